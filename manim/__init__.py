@@ -21,6 +21,7 @@ from .animation.transform import *
 from .animation.update import *
 
 from .renderer.cairo_renderer import *
+from .renderer.planning_renderer import *
 
 from .camera.camera import *
 from .camera.mapping_camera import *
@@ -11,6 +11,7 @@ from manim.utils.module_ops import (
 )
 from manim.utils.file_ops import open_file as open_media_file
 from manim._config.main_utils import parse_args
+from manim.renderer.planning_renderer import PlanningRenderer
 
 try:
     from manim.grpc.impl import frame_server_impl
@@ -88,6 +89,21 @@ def main():
                 print("\n\n")
                 traceback.print_exc()
                 print("\n\n")
+        elif config["plan_only"]:
+            needs_rendering = False
+            for SceneClass in scene_classes_from_file(input_file):
+                try:
+                    renderer = PlanningRenderer()
+                    SceneClass(renderer=renderer).render()
+                    plan = renderer.get_plan()
+                    renderer.log_plan(plan)
+                    needs_rendering |= any(a.status == "render" for a in plan)
+                except Exception:
+                    print("\n\n")
+                    traceback.print_exc()
+                    print("\n\n")
+                    needs_rendering = True
+            sys.exit(1 if needs_rendering else 0)
         else:
             for SceneClass in scene_classes_from_file(input_file):
                 try:
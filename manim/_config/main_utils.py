@@ -281,6 +281,12 @@ def _parse_args_no_subcmd(args: list) -> argparse.Namespace:
         const=True,
         help="Remove all cached partial-movie-files",
     )
+    parser.add_argument(
+        "--plan_only",
+        action="store_const",
+        const=True,
+        help="Only report which animations are cached and which need rendering, exiting with status 1 if any does",
+    )
     parser.add_argument(
         "--log_to_file",
         action="store_const",
@@ -397,6 +403,12 @@ def _parse_args_no_subcmd(args: list) -> argparse.Namespace:
         "Overrides the -l, -m, -e, and -k flags, if present",
     )
 
+    parser.add_argument(
+        "--encoder_profile",
+        help="Encode movies with the given profile, from fastest to smallest files",
+        choices=constants.ENCODER_PROFILES.keys(),
+    )
+
     # This sets FROM_ANIMATION_NUMBER and UPTO_ANIMATION_NUMBER
     parser.add_argument(
         "-n",
@@ -250,8 +250,13 @@ class ManimConfig(MutableMapping):
         "assets_dir",
         "background_color",
         "background_opacity",
+        "cache_store",
         "custom_folders",
         "disable_caching",
+        "encoder_crf",
+        "encoder_preset",
+        "encoder_threads",
+        "encoder_tune",
         "ffmpeg_loglevel",
         "flush_cache",
         "frame_height",
@@ -260,18 +265,22 @@ class ManimConfig(MutableMapping):
         "frame_x_radius",
         "frame_y_radius",
         "from_animation_number",
+        "image_compression_level",
+        "image_sequence_format",
         "images_dir",
         "input_file",
         "js_renderer_path",
         "leave_progress_bars",
         "log_dir",
         "log_to_file",
+        "max_cache_size",
         "max_files_cached",
         "media_dir",
         "movie_file_extension",
         "partial_movie_dir",
         "pixel_height",
         "pixel_width",
+        "plan_only",
         "png_mode",
         "preview",
         "progress_bar",
@@ -287,9 +296,11 @@ class ManimConfig(MutableMapping):
         "upto_animation_number",
         "use_js_renderer",
         "verbosity",
+        "video_codec",
         "video_dir",
         "write_all",
         "write_to_movie",
+        "yuv_conversion",
     }
 
     def __init__(self) -> None:
@@ -508,6 +519,7 @@ class ManimConfig(MutableMapping):
             "flush_cache",
             "custom_folders",
             "use_js_renderer",
+            "plan_only",
         ]:
             setattr(self, key, parser["CLI"].getboolean(key, fallback=False))
 
@@ -516,6 +528,8 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "frame_rate",
+            "image_compression_level",
+            "max_cache_size",
             "max_files_cached",
             "pixel_height",
             "pixel_width",
@@ -539,6 +553,8 @@ class ManimConfig(MutableMapping):
             "movie_file_extension",
             "background_color",
             "js_renderer_path",
+            "cache_store",
+            "image_sequence_format",
         ]:
             setattr(self, key, parser["CLI"].get(key, fallback="", raw=True))
 
@@ -560,6 +576,25 @@ class ManimConfig(MutableMapping):
         if val:
             setattr(self, "ffmpeg_loglevel", val)
 
+        # the encoder profile sets several encoder options, which can then be
+        # overridden one by one
+        self.encoder_profile = parser["ffmpeg"].get(
+            "encoder_profile", fallback=constants.DEFAULT_ENCODER_PROFILE
+        )
+        for key in ["codec", "preset", "tune"]:
+            val = parser["ffmpeg"].get(key, raw=True)
+            if val:
+                setattr(
+                    self, "video_codec" if key == "codec" else f"encoder_{key}", val
+                )
+        val = parser["ffmpeg"].get("crf")
+        if val:
+            self.encoder_crf = int(val)
+        self.encoder_threads = parser["ffmpeg"].getint("threads", fallback=0)
+        self.yuv_conversion = parser["ffmpeg"].getboolean(
+            "yuv_conversion", fallback=False
+        )
+
         return self
 
     def digest_args(self, args: argparse.Namespace) -> "ManimConfig":
@@ -613,6 +648,7 @@ class ManimConfig(MutableMapping):
             "verbosity",
             "background_color",
             "use_js_renderer",
+            "plan_only",
         ]:
             if hasattr(args, key):
                 attr = getattr(args, key)
@@ -655,6 +691,10 @@ class ManimConfig(MutableMapping):
         # Handle the quality flags
         self.quality = _determine_quality(args)
 
+        # Handle the --encoder_profile flag
+        if getattr(args, "encoder_profile", None) is not None:
+            self.encoder_profile = args.encoder_profile
+
         # Handle the -r flag.
         rflag = args.resolution
         if rflag is not None:
@@ -914,12 +954,80 @@ class ManimConfig(MutableMapping):
         doc="Maximum number of files cached.  Use -1 for infinity (no flag).",
     )
 
+    image_sequence_format = property(
+        lambda self: self._d["image_sequence_format"],
+        lambda self, val: self._set_from_list(
+            "image_sequence_format", val, ["png", "webp"]
+        ),
+        doc="File format of the frames saved with -g, png or webp (no flag).",
+    )
+
+    image_compression_level = property(
+        lambda self: self._d["image_compression_level"],
+        lambda self, val: self._set_between("image_compression_level", val, 0, 9),
+        doc="Compression level of the frames saved with -g, from 0 (fastest) to 9 (smallest) (no flag).",
+    )
+
+    video_codec = property(
+        lambda self: self._d["video_codec"],
+        lambda self, val: self._set_str("video_codec", val),
+        doc="Codec ffmpeg encodes movies with, unless they are transparent (no flag).",
+    )
+
+    encoder_preset = property(
+        lambda self: self._d["encoder_preset"],
+        lambda self, val: self._set_str("encoder_preset", val),
+        doc="Preset of the encoder, e.g. ultrafast or slow (no flag).",
+    )
+
+    encoder_crf = property(
+        lambda self: self._d["encoder_crf"],
+        lambda self, val: self._set_between("encoder_crf", val, 0, 51),
+        doc="Constant rate factor of the encoder, from 0 (lossless) to 51 (smallest) (no flag).",
+    )
+
+    encoder_tune = property(
+        lambda self: self._d["encoder_tune"],
+        lambda self, val: self._set_str("encoder_tune", val),
+        doc="Tuning of the encoder, e.g. animation, or empty for none (no flag).",
+    )
+
+    encoder_threads = property(
+        lambda self: self._d["encoder_threads"],
+        lambda self, val: self._set_pos_number("encoder_threads", val, False),
+        doc="Number of threads of the encoder.  Use 0 to let ffmpeg decide (no flag).",
+    )
+
+    yuv_conversion = property(
+        lambda self: self._d["yuv_conversion"],
+        lambda self, val: self._set_boolean("yuv_conversion", val),
+        doc="Whether frames are converted to YUV before being piped to ffmpeg (no flag).",
+    )
+
+    max_cache_size = property(
+        lambda self: self._d["max_cache_size"],
+        lambda self, val: self._set_pos_number("max_cache_size", val, True),
+        doc="Maximum total size of the cached files, in megabytes.  Use -1 for infinity (no flag).",
+    )
+
     flush_cache = property(
         lambda self: self._d["flush_cache"],
         lambda self, val: self._set_boolean("flush_cache", val),
         doc="Whether to delete all the cached partial movie files.",
     )
 
+    cache_store = property(
+        lambda self: self._d["cache_store"],
+        lambda self, val: self._d.__setitem__("cache_store", val),
+        doc="Directory or HTTP URL where partial movie files are shared (no flag).",
+    )
+
+    plan_only = property(
+        lambda self: self._d["plan_only"],
+        lambda self, val: self._set_boolean("plan_only", val),
+        doc="Only report which animations are cached and need rendering (--plan_only).",
+    )
+
     disable_caching = property(
         lambda self: self._d["disable_caching"],
         lambda self, val: self._set_boolean("disable_caching", val),
@@ -974,6 +1082,25 @@ class ManimConfig(MutableMapping):
         self.frame_size = q["pixel_width"], q["pixel_height"]
         self.frame_rate = q["frame_rate"]
 
+    @property
+    def encoder_profile(self):
+        """Encoder profile setting the codec, preset, crf and tune of ffmpeg
+        (--encoder_profile).  ``None`` if these options match no profile."""
+        keys = ["video_codec", "encoder_preset", "encoder_crf", "encoder_tune"]
+        for name, profile in constants.ENCODER_PROFILES.items():
+            if all(self[k] == profile[k] for k in keys):
+                return name
+        return None
+
+    @encoder_profile.setter
+    def encoder_profile(self, name: str) -> None:
+        if name not in constants.ENCODER_PROFILES:
+            raise KeyError(
+                f"encoder_profile must be one of {list(constants.ENCODER_PROFILES.keys())}"
+            )
+        for key, val in constants.ENCODER_PROFILES[name].items():
+            self[key] = val
+
     @property
     def transparent(self):
         """Whether the background opacity is 0.0 (-t)."""
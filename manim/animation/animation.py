@@ -150,8 +150,8 @@ class Animation:
 
     def interpolate_mobject(self, alpha: float) -> None:
         families = list(self.get_all_families_zipped())
-        for i, mobs in enumerate(families):
-            sub_alpha = self.get_sub_alpha(alpha, i, len(families))
+        sub_alphas = self.get_sub_alphas(alpha, len(families))
+        for mobs, sub_alpha in zip(families, sub_alphas):
             self.interpolate_submobject(*mobs, sub_alpha)
 
     def interpolate_submobject(
@@ -170,6 +170,37 @@ class Animation:
         lower = index * lag_ratio
         return np.clip((value - lower), 0, 1)
 
+    def get_sub_alphas(self, alpha: float, num_submobjects: int) -> np.ndarray:
+        """Returns the alphas of all the submobjects at once.
+
+        Parameters
+        ----------
+        alpha : float
+            The alpha of the animation, after its rate function.
+        num_submobjects : int
+            The number of submobjects, which start one after the other
+            according to ``lag_ratio``.
+
+        Returns
+        -------
+        np.ndarray
+            The alpha of each submobject, as :meth:`get_sub_alpha` would
+            return it.
+        """
+        if type(self).get_sub_alpha is not Animation.get_sub_alpha:
+            # Honour subclasses still overriding the single alpha version.
+            return np.array(
+                [
+                    self.get_sub_alpha(alpha, index, num_submobjects)
+                    for index in range(num_submobjects)
+                ]
+            )
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        value = alpha * full_length
+        lowers = np.arange(num_submobjects) * lag_ratio
+        return np.clip(value - lowers, 0, 1)
+
     # Getters and setters
     def set_run_time(self, run_time: float) -> "Animation":
         self.run_time = run_time
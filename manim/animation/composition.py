@@ -50,6 +50,10 @@ class AnimationGroup(Animation):
     def begin(self) -> None:
         for anim in self.animations:
             anim.begin()
+        # Every animation is now at its start.
+        self.last_time = 0
+        self.active_indices = np.zeros(0, dtype=int)
+        self.finished_indices = np.zeros(0, dtype=int)
 
     def finish(self) -> None:
         for anim in self.animations:
@@ -60,8 +64,15 @@ class AnimationGroup(Animation):
             anim.clean_up_from_scene(scene)
 
     def update_mobjects(self, dt: int) -> None:
-        for anim in self.animations:
-            anim.update_mobjects(dt)
+        if self.last_time is None:
+            indices = range(len(self.animations))
+        else:
+            # Only the animations in progress, and those finished by the last
+            # interpolation, which are updated one last time.
+            indices = np.union1d(self.active_indices, self.finished_indices)
+            self.finished_indices = np.zeros(0, dtype=int)
+        for index in indices:
+            self.animations[index].update_mobjects(dt)
 
     def init_run_time(self) -> None:
         self.build_animations_with_timings()
@@ -85,6 +96,65 @@ class AnimationGroup(Animation):
             # Start time of next animation is based on
             # the lag_ratio
             curr_time = interpolate(start_time, end_time, self.lag_ratio)
+        # The same timings as arrays, to find the alphas of all the
+        # animations at once.
+        self.start_times = np.array([awt[1] for awt in self.anims_with_timings])
+        end_times = np.array([awt[2] for awt in self.anims_with_timings])
+        run_times = end_times - self.start_times
+        self.instant_animations = run_times == 0
+        self.run_times = np.where(self.instant_animations, 1, run_times)
+        # The timeline: the animations that take time, sorted by start and
+        # by end time, to find those starting or ending between two frames
+        # by binary search.  Instant animations always stay at their start.
+        timed = np.flatnonzero(~self.instant_animations)
+        self.start_order = timed[np.argsort(self.start_times[timed], kind="stable")]
+        self.sorted_start_times = self.start_times[self.start_order]
+        self.end_order = timed[np.argsort(end_times[timed], kind="stable")]
+        self.sorted_end_times = end_times[self.end_order]
+        self.reset_timeline()
+
+    def reset_timeline(self) -> None:
+        """Makes the next call to :meth:`interpolate` interpolate every
+        animation of the group, e.g. after their mobjects were changed from
+        outside of the group."""
+        # The time of the last interpolation, or None if the state of the
+        # animations is unknown.
+        self.last_time = None
+        # The animations left in progress by the last interpolation, and
+        # those it finished, whose mobjects weren't updated since.
+        self.active_indices = np.zeros(0, dtype=int)
+        self.finished_indices = np.zeros(0, dtype=int)
+        for anim in self.animations:
+            if isinstance(anim, AnimationGroup):
+                anim.reset_timeline()
+
+    def get_indices_to_interpolate(self, time: float) -> np.ndarray:
+        """Returns the indices of the animations whose alpha may have changed
+        since the last interpolation: those in progress then, and those
+        starting or ending between then and ``time``, in either direction.
+
+        Parameters
+        ----------
+        time : float
+            The time of the group to interpolate to.
+
+        Returns
+        -------
+        np.ndarray
+            The sorted indices of the animations.
+        """
+        low, high = sorted((self.last_time, time))
+        starting = self.start_order[
+            np.searchsorted(self.sorted_start_times, low, "left") : np.searchsorted(
+                self.sorted_start_times, high, "right"
+            )
+        ]
+        ending = self.end_order[
+            np.searchsorted(self.sorted_end_times, low, "left") : np.searchsorted(
+                self.sorted_end_times, high, "right"
+            )
+        ]
+        return np.union1d(self.active_indices, np.concatenate([starting, ending]))
 
     def interpolate(self, alpha: float) -> None:
         # Note, if the run_time of AnimationGroup has been
@@ -93,13 +163,23 @@ class AnimationGroup(Animation):
         # e.g. of the surrounding scene.  Instead they'd
         # be a rescaled version.  But that's okay!
         time = alpha * self.max_end_time
-        for anim, start_time, end_time in self.anims_with_timings:
-            anim_time = end_time - start_time
-            if anim_time == 0:
-                sub_alpha = 0
-            else:
-                sub_alpha = np.clip((time - start_time) / anim_time, 0, 1)
-            anim.interpolate(sub_alpha)
+        if self.last_time is None:
+            indices = np.arange(len(self.animations))
+        else:
+            indices = self.get_indices_to_interpolate(time)
+        sub_alphas = np.clip(
+            (time - self.start_times[indices]) / self.run_times[indices], 0, 1
+        )
+        sub_alphas[self.instant_animations[indices]] = 0
+        for index, sub_alpha in zip(indices, sub_alphas):
+            self.animations[index].interpolate(sub_alpha)
+        # The animations that are done, or not started yet, are left alone
+        # until the time crosses their start or end again.
+        self.last_time = time
+        self.active_indices = indices[(sub_alphas > 0) & (sub_alphas < 1)]
+        self.finished_indices = np.union1d(
+            self.finished_indices, indices[sub_alphas == 1]
+        )
 
 
 class Succession(AnimationGroup):
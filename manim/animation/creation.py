@@ -89,6 +89,14 @@ from ..utils.rate_functions import double_smooth, linear, smooth
 class ShowPartial(Animation):
     """Abstract class for Animations that show the VMobject partially.
 
+    Parameters
+    ----------
+    mobject : :class:`~.VMobject`
+        The VMobject to animate.
+    use_arc_length : :class:`bool`
+        Whether the shown part grows at a constant speed along the path,
+        rather than spending the same time on every curve of the path.
+
     Raises
     ------
     :class:`TypeError`
@@ -100,17 +108,19 @@ class ShowPartial(Animation):
 
     """
 
-    def __init__(self, mobject: VMobject, **kwargs):
+    def __init__(self, mobject: VMobject, use_arc_length: bool = False, **kwargs):
         if not isinstance(mobject, VMobject):
             raise TypeError("This Animation only works on vectorized mobjects")
+        self.use_arc_length = use_arc_length
         super().__init__(mobject, **kwargs)
 
     def interpolate_submobject(
         self, submobject: Mobject, starting_submobject: Mobject, alpha: float
     ) -> None:
-        submobject.pointwise_become_partial(
-            starting_submobject, *self._get_bounds(alpha)
-        )
+        bounds = self._get_bounds(alpha)
+        if self.use_arc_length:
+            bounds = starting_submobject.proportion_from_arc_length(bounds)
+        submobject.pointwise_become_partial(starting_submobject, *bounds)
 
     def _get_bounds(self, alpha: float) -> None:
         raise NotImplementedError("Please use ShowCreation or ShowPassingFlash")
@@ -123,6 +133,8 @@ class ShowCreation(ShowPartial):
     ----------
     mobject : :class:`~.VMobject`
         The VMobject to animate.
+    use_arc_length : :class:`bool`
+        Whether to draw the VMobject at a constant speed along its path.
 
     Raises
     ------
@@ -200,11 +212,13 @@ class DrawBorderThenFill(Animation):
         stroke_color: str = None,
         draw_border_animation_config: typing.Dict = {},  # what does this dict accept?
         fill_animation_config: typing.Dict = {},
+        use_arc_length: bool = False,
         **kwargs
     ) -> None:
         self._typecheck_input(vmobject)
         super().__init__(vmobject, run_time=run_time, rate_func=rate_func, **kwargs)
         self.stroke_width = stroke_width
+        self.use_arc_length = use_arc_length
         self.stroke_color = stroke_color
         self.draw_border_animation_config = draw_border_animation_config
         self.fill_animation_config = fill_animation_config
@@ -240,6 +254,8 @@ class DrawBorderThenFill(Animation):
     ) -> None:  # Fixme: not matching the parent class? What is outline doing here?
         index, subalpha = integer_interpolate(0, 2, alpha)
         if index == 0:
+            if self.use_arc_length:
+                subalpha = outline.proportion_from_arc_length(subalpha)
             submobject.pointwise_become_partial(outline, 0, subalpha)
             submobject.match_style(outline)
         else:
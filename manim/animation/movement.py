@@ -111,6 +111,10 @@ class PhaseFlow(Animation):
 
 class MoveAlongPath(Animation):
     """Make one mobject move along the path of another mobject.
+
+    With ``use_arc_length=True``, the mobject moves at a constant speed
+    along the path, instead of spending the same time on each of its curves.
+
     Example
     --------
     .. manim:: MoveAlongPathExample
@@ -130,13 +134,17 @@ class MoveAlongPath(Animation):
         mobject: "Mobject",
         path: np.ndarray,
         suspend_mobject_updating: typing.Optional[bool] = False,
+        use_arc_length: bool = False,
         **kwargs
     ) -> None:
         self.path = path
+        self.use_arc_length = use_arc_length
         super().__init__(
             mobject, suspend_mobject_updating=suspend_mobject_updating, **kwargs
         )
 
     def interpolate_mobject(self, alpha: float) -> None:
+        if self.use_arc_length:
+            alpha = self.path.proportion_from_arc_length(alpha)
         point = self.path.point_from_proportion(alpha)
         self.mobject.move_to(point)
@@ -29,6 +29,7 @@ import typing
 import numpy as np
 
 from ..animation.animation import Animation
+from ..animation.batched_interpolation import BatchedInterpolation
 from ..constants import DEFAULT_POINTWISE_FUNCTION_RUN_TIME, DEGREES, OUT
 from ..mobject.mobject import Group, Mobject
 from ..utils.paths import path_along_arc, straight_path
@@ -54,6 +55,7 @@ class Transform(Animation):
         self.path_arc_axis = path_arc_axis
         self.replace_mobject_with_target_in_scene = replace_mobject_with_target_in_scene
         self.target_mobject = target_mobject
+        self.batched_interpolation = None
         super().__init__(mobject, **kwargs)
         self._init_path_func()
 
@@ -78,13 +80,32 @@ class Transform(Animation):
         # Note, this potentially changes the structure
         # of both mobject and target_mobject
         self.mobject.align_data(self.target_copy)
+        self.batched_interpolation = None
         super().begin()
+        self.batched_interpolation = self.create_batched_interpolation()
 
     def create_target(self) -> typing.Union[Mobject, None]:
         # Has no meaningful effect here, but may be useful
         # in subclasses
         return self.target_mobject
 
+    def create_batched_interpolation(self) -> typing.Optional[BatchedInterpolation]:
+        """Packs the submobjects to interpolate them all at once in
+        :meth:`interpolate_mobject`, or returns ``None`` if they have to be
+        interpolated one by one."""
+        if type(self).interpolate_submobject is not Transform.interpolate_submobject:
+            return None
+        # The packed points and colors would get stale if updaters changed
+        # the starting or target mobjects during the animation.
+        if (
+            self.starting_mobject.get_family_updaters()
+            or self.target_copy.get_family_updaters()
+        ):
+            return None
+        return BatchedInterpolation.from_families(
+            self.get_all_families_zipped(), self.path_func
+        )
+
     def check_target_mobject_validity(self) -> None:
         if self.target_mobject is None:
             raise NotImplementedError(
@@ -124,6 +145,14 @@ class Transform(Animation):
             ]
         )
 
+    def interpolate_mobject(self, alpha: float) -> None:
+        if self.batched_interpolation is None:
+            super().interpolate_mobject(alpha)
+            return
+        self.batched_interpolation.interpolate(
+            self.get_sub_alphas(alpha, self.batched_interpolation.num_submobjects)
+        )
+
     def interpolate_submobject(
         self,
         submobject: Mobject,
@@ -395,6 +424,10 @@ class TransformAnimations(Transform):
         start_anim.mobject = self.starting_mobject
         end_anim.mobject = self.target_mobject
 
+    def create_batched_interpolation(self) -> None:
+        # The starting and ending mobjects change on every frame.
+        return None
+
     def interpolate(self, alpha: float) -> None:
         self.start_anim.interpolate(alpha)
         self.end_anim.interpolate(alpha)
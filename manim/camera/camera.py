@@ -8,23 +8,30 @@ import itertools as it
 import operator as op
 import time
 import copy
+import weakref
+import zlib
 
 from PIL import Image
-from scipy.spatial.distance import pdist
 import cairo
 import numpy as np
 
 from .. import logger, config
 from ..constants import *
-from ..mobject.types.image_mobject import AbstractImageMobject
+from ..mobject.types.image_mobject import AbstractImageMobject, ImageMobjectFromCamera
 from ..mobject.mobject import Mobject
 from ..mobject.types.point_cloud_mobject import PMobject
 from ..mobject.types.vectorized_mobject import VMobject
 from ..utils.color import color_to_int_rgba
+from ..utils.compositing import (
+    composite_lighten,
+    composite_multiply,
+    composite_over,
+    composite_over_pixels,
+    premultiply,
+)
 from ..utils.images import get_full_raster_image_path
 from ..utils.iterables import list_difference_update
 from ..utils.simple_functions import fdiv
-from ..utils.space_ops import angle_of_vector
 from ..utils.space_ops import get_norm
 from ..utils.family import extract_mobject_family_members
 
@@ -62,6 +69,8 @@ class Camera:
         frame_height=None,
         frame_width=None,
         frame_rate=None,
+        point_cloud_chunk_size=2 ** 20,
+        cull_offscreen_mobjects=True,
         **kwargs,
     ):
         """Initialises the Camera.
@@ -70,6 +79,12 @@ class Camera:
         ----------
         background : optional
             What self.background should be, by default None as will be set later.
+        point_cloud_chunk_size : int, optional
+            The maximum number of pixel samples splatted at once when
+            displaying point clouds, by default 2 ** 20.
+        cull_offscreen_mobjects : bool, optional
+            Whether mobjects lying entirely outside of the frame are skipped
+            when capturing, by default True.
         **kwargs
             Any local variables to be set.
         """
@@ -82,6 +97,11 @@ class Camera:
         self.cairo_line_width_multiple = cairo_line_width_multiple
         self.use_z_index = use_z_index
         self.background = background
+        self.point_cloud_chunk_size = point_cloud_chunk_size
+        self.cull_offscreen_mobjects = cull_offscreen_mobjects
+        # Statistics about the last call to capture_mobjects
+        self.num_displayed_mobjects = 0
+        self.num_culled_mobjects = 0
 
         if pixel_height is None:
             pixel_height = config["pixel_height"]
@@ -112,6 +132,12 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # Maps the ids of vectorized mobjects to their cairo path while
+        # several cameras capture them in the same frame, see
+        # MultiCamera.capture_mobjects.
+        self.path_cache = None
+        # Maps image mobjects to their last resampled image
+        self.image_mobject_cache = weakref.WeakKeyDictionary()
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -314,6 +340,9 @@ class Camera:
             hasattr(self, "pixel_array")
             and self.pixel_array.shape == converted_array.shape
         ):
+            if hasattr(self, "pixel_array"):
+                # The cairo context of the old array keeps it alive.
+                self.pixel_array_to_cairo_context.pop(id(self.pixel_array), None)
             self.pixel_array = converted_array
         else:
             # Set in place
@@ -484,9 +513,109 @@ class Camera:
         # without altering their order.  it.groupby computes exactly this
         # partition while at the same time preserving order.
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
-        for group_type, group in it.groupby(mobjects, self.type_or_raise):
+        if self.cull_offscreen_mobjects:
+            displayed = self.cull_mobjects(mobjects)
+        else:
+            displayed = mobjects
+        self.num_displayed_mobjects = len(displayed)
+        self.num_culled_mobjects = len(mobjects) - len(displayed)
+        for group_type, group in it.groupby(displayed, self.type_or_raise):
             self.display_funcs[group_type](list(group), self.pixel_array)
 
+    def cull_mobjects(self, mobjects):
+        """Removes the mobjects which lie entirely outside of the frame.
+
+        Only the points of each mobject itself are considered, not the ones
+        of its submobjects, so this is meant to be applied to the list
+        returned by :meth:`get_mobjects_to_display`.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects to cull.
+
+        Returns
+        -------
+        list
+            The mobjects that may cover part of the frame, in their original
+            order.
+        """
+        fc = self.frame_center
+        half_width = self.frame_width / 2
+        half_height = self.frame_height / 2
+        frame_min = np.array([fc[0] - half_width, fc[1] - half_height])
+        frame_max = np.array([fc[0] + half_width, fc[1] + half_height])
+        result = []
+        for mobject in mobjects:
+            if mobject.get_num_points() == 0:
+                continue
+            lower_left, upper_right = self.get_mobject_frame_bounds(mobject)
+            margin = self.get_mobject_frame_margin(mobject)
+            if np.all(lower_left - margin <= frame_max) and np.all(
+                upper_right + margin >= frame_min
+            ):
+                result.append(mobject)
+        return result
+
+    def get_mobject_frame_bounds(self, mobject):
+        """Returns the corners of the rectangle covered by the points of a
+        mobject once they are shown by this camera.
+
+        The bounding box of the points is transformed rather than the points
+        themselves, which is exact as long as
+        :meth:`transform_points_pre_display` maps boxes into convex regions.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject to get the bounds of.
+
+        Returns
+        -------
+        tuple
+            The lower left and upper right ``(x, y)`` corners, in frame
+            coordinates.
+        """
+        points = mobject.points
+        if isinstance(mobject, AbstractImageMobject):
+            # The fourth corner of the image is implied by the other three.
+            ul, ur, dl = points[:3]
+            corners = np.array([ul, ur, dl, ur + dl - ul])
+        else:
+            mins = points.min(0)
+            maxs = points.max(0)
+            corners = np.array(list(it.product(*zip(mins, maxs))))
+        corners = self.transform_points_pre_display(mobject, corners)
+        return corners[:, :2].min(0), corners[:, :2].max(0)
+
+    def get_mobject_frame_margin(self, mobject):
+        """Returns how far, in frame units, a mobject can be drawn beyond
+        the bounds of its points.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject to get the margin of.
+
+        Returns
+        -------
+        float
+            The margin to add on every side of the bounds.
+        """
+        # Antialiasing can touch a pixel beyond the exact outline.
+        pixel_size = self.frame_width / self.pixel_width
+        margin = 2 * pixel_size
+        if isinstance(mobject, VMobject):
+            width = max(
+                mobject.get_stroke_width(), mobject.get_stroke_width(background=True)
+            )
+            # Miter joins reach up to 5 line widths (cairo's default miter
+            # limit is 10) past the path.
+            margin += 5 * width * self.cairo_line_width_multiple
+        elif isinstance(mobject, PMobject):
+            margin += self.adjusted_thickness(mobject.stroke_width) * pixel_size
+        return margin
+
     # Methods associated with svg rendering
 
     # NOTE: None of the methods below have been mentioned outside of their definitions. Their DocStrings are not as
@@ -539,28 +668,36 @@ class Camera:
         cached_ctx = self.get_cached_cairo_context(pixel_array)
         if cached_ctx:
             return cached_ctx
+        surface = cairo.ImageSurface.create_for_data(
+            pixel_array, cairo.FORMAT_ARGB32, self.pixel_width, self.pixel_height
+        )
+        ctx = cairo.Context(surface)
+        ctx.set_matrix(cairo.Matrix(*self.get_cairo_matrix_values()))
+        self.cache_cairo_context(pixel_array, ctx)
+        return ctx
+
+    def get_cairo_matrix_values(self):
+        """Returns the coefficients of the transformation matrix of the cairo
+        contexts, which maps the frame of the camera to its pixels.
+
+        Returns
+        -------
+        tuple
+            The ``(xx, yx, xy, yy, x0, y0)`` arguments of :class:`cairo.Matrix`.
+        """
         pw = self.pixel_width
         ph = self.pixel_height
         fw = self.frame_width
         fh = self.frame_height
         fc = self.frame_center
-        surface = cairo.ImageSurface.create_for_data(
-            pixel_array, cairo.FORMAT_ARGB32, pw, ph
+        return (
+            fdiv(pw, fw),
+            0,
+            0,
+            -fdiv(ph, fh),
+            (pw / 2) - fc[0] * fdiv(pw, fw),
+            (ph / 2) + fc[1] * fdiv(ph, fh),
         )
-        ctx = cairo.Context(surface)
-        ctx.scale(pw, ph)
-        ctx.set_matrix(
-            cairo.Matrix(
-                fdiv(pw, fw),
-                0,
-                0,
-                -fdiv(ph, fh),
-                (pw / 2) - fc[0] * fdiv(pw, fw),
-                (ph / 2) + fc[1] * fdiv(ph, fh),
-            )
-        )
-        self.cache_cairo_context(pixel_array, ctx)
-        return ctx
 
     def display_multiple_vectorized_mobjects(self, vmobjects, pixel_array):
         """Displays multiple VMobjects in the pixel_array
@@ -636,6 +773,14 @@ class Camera:
         Camera
             Camera object after setting cairo_context_path
         """
+        path_cache = self.path_cache
+        if path_cache is not None and id(vmobject) in path_cache:
+            # Paths are in frame coordinates, which the matrix of each
+            # context maps to its own pixels.
+            ctx.new_path()
+            ctx.append_path(path_cache[id(vmobject)])
+            return self
+
         points = self.transform_points_pre_display(vmobject, vmobject.points)
         # TODO, shouldn't this be handled in transform_points_pre_display?
         # points = points - self.get_frame_center()
@@ -653,6 +798,8 @@ class Camera:
                 ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
             if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
                 ctx.close_path()
+        if path_cache is not None:
+            path_cache[id(vmobject)] = ctx.copy_path()
         return self
 
     def set_cairo_context_color(self, ctx, rgbas, vmobject):
@@ -836,8 +983,17 @@ class Camera:
             )
 
     def display_point_cloud(self, pmobject, points, rgbas, thickness, pixel_array):
-        """Displays a PMobject by modifying the Pixel array suitably..
-        TODO: Write a description for the rgbas argument.
+        """Displays a PMobject by splatting its points onto the pixel array.
+
+        Every point is drawn as a disc roughly ``thickness`` pixels wide. The
+        points are processed in chunks of at most :attr:`point_cloud_chunk_size`
+        pixel samples, so memory use does not grow with the size of the point
+        cloud, and translucent points are blended over the existing pixels
+        (see :meth:`splat_point_cloud_chunk`). The blending does not depend
+        on the order of the points within a chunk, but the chunks are drawn
+        one over the other, so overlapping translucent points in different
+        chunks blend in the order of the cloud.
+
         Parameters
         ----------
         pmobject : PMobject
@@ -845,7 +1001,7 @@ class Camera:
         points : list
             The points to display in the point cloud mobject
         rgbas : np.array
-
+            The RGBA color of each point, with values between 0 and 1.
         thickness : int, float
             The thickness of each point of the PMobject
         pixel_array : np.array
@@ -853,30 +1009,75 @@ class Camera:
         """
         if len(points) == 0:
             return
-        pixel_coords = self.points_to_pixel_coords(pmobject, points)
-        pixel_coords = self.thickened_coordinates(pixel_coords, thickness)
-        rgba_len = pixel_array.shape[2]
+        nudges = self.get_thickening_nudges(thickness, circular=True)
+        points_per_chunk = max(self.point_cloud_chunk_size // len(nudges), 1)
+        for start in range(0, len(points), points_per_chunk):
+            end = start + points_per_chunk
+            self.splat_point_cloud_chunk(
+                pmobject, points[start:end], rgbas[start:end], nudges, pixel_array
+            )
+
+    def splat_point_cloud_chunk(self, pmobject, points, rgbas, nudges, pixel_array):
+        """Splats a chunk of points of a PMobject onto the pixel array.
+
+        All samples that land on the same pixel are accumulated first: the
+        pixel is covered with alpha ``1 - prod(1 - alpha_i)`` by the
+        alpha-weighted mean color of the samples, which is then composited
+        over the existing pixel with
+        :func:`~.compositing.composite_over_pixels`. This makes the result
+        independent of the order of the points within the chunk; successive
+        chunks are still composited over each other in order.
 
-        rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
-        target_len = len(pixel_coords)
-        factor = target_len // len(rgbas)
-        rgbas = np.array([rgbas] * factor).reshape((target_len, rgba_len))
+        Parameters
+        ----------
+        pmobject : PMobject
+            Point Cloud Mobject
+        points : np.array
+            The points of this chunk.
+        rgbas : np.array
+            The RGBA color of each point of this chunk.
+        nudges : np.array
+            The pixel offsets making up the kernel drawn for each point.
+        pixel_array : np.array
+            The pixel array to modify.
+        """
+        pixel_coords = self.points_to_pixel_coords(pmobject, points)
+        pixel_coords = (pixel_coords[np.newaxis] + nudges[:, np.newaxis]).reshape(
+            (-1, 2)
+        )
+        point_indices = np.tile(np.arange(len(points)), len(nudges))
 
         on_screen_indices = self.on_screen_pixels(pixel_coords)
         pixel_coords = pixel_coords[on_screen_indices]
-        rgbas = rgbas[on_screen_indices]
+        point_indices = point_indices[on_screen_indices]
+        if len(point_indices) == 0:
+            return
 
-        ph = self.pixel_height
+        # Number the distinct pixels hit by this chunk.  Sorting the samples
+        # keeps the scratch memory proportional to the chunk, not the frame.
         pw = self.pixel_width
+        sample_indices = pixel_coords[:, 1] * pw + pixel_coords[:, 0]
+        flat_indices, inverse = np.unique(sample_indices, return_inverse=True)
+        inverse = inverse.ravel()
+        num_pixels = len(flat_indices)
+
+        rgbas = rgbas[point_indices]
+        alphas = np.clip(rgbas[:, 3], 0, 1)
+
+        with np.errstate(divide="ignore"):
+            log_transparencies = np.log1p(-alphas)
+        coverage = 1 - np.exp(np.bincount(inverse, log_transparencies, num_pixels))
+        weights = np.bincount(inverse, alphas, num_pixels)
+        colors = np.array(
+            [np.bincount(inverse, alphas * rgbas[:, i], num_pixels) for i in range(3)]
+        ).T
+        np.divide(
+            colors, weights[:, np.newaxis], out=colors, where=weights[:, np.newaxis] > 0
+        )
 
-        flattener = np.array([1, pw], dtype="int")
-        flattener = flattener.reshape((2, 1))
-        indices = np.dot(pixel_coords, flattener)[:, 0]
-        indices = indices.astype("int")
-
-        new_pa = pixel_array.reshape((ph * pw, rgba_len))
-        new_pa[indices] = rgbas
-        pixel_array[:, :] = new_pa.reshape((ph, pw, rgba_len))
+        ys, xs = np.divmod(flat_indices, pw)
+        colors *= coverage[:, np.newaxis]
+        composite_over_pixels(pixel_array, ys, xs, np.column_stack([colors, coverage]))
 
     def display_multiple_image_mobjects(self, image_mobjects, pixel_array):
         """Displays multiple image mobjects by modifying the passed pixel_array.
@@ -894,6 +1095,12 @@ class Camera:
     def display_image_mobject(self, image_mobject, pixel_array):
         """Displays an ImageMobject by changing the pixel_array suitably.
 
+        Only the bounding box of the image on screen is touched: the image is
+        mapped onto it with a single affine resampling step (which accounts
+        for rotation, scaling and shear) and composited over the pixels
+        underneath.  The resampled image is cached, so an image whose corners
+        and pixels haven't changed since the last frame is not resampled again.
+
         Parameters
         ----------
         image_mobject : ImageMobject
@@ -901,48 +1108,155 @@ class Camera:
         pixel_array : np.ndarray
             The Pixel array to put the imagemobject in.
         """
-        corner_coords = self.points_to_pixel_coords(image_mobject, image_mobject.points)
-        ul_coords, ur_coords, dl_coords = corner_coords
-        right_vect = ur_coords - ul_coords
-        down_vect = dl_coords - ul_coords
-        center_coords = ul_coords + (right_vect + down_vect) / 2
+        placed_image = self.get_placed_image(image_mobject, pixel_array)
+        if placed_image is None:
+            return
+        (x0, y0), sub_image = placed_image
+        composite_over(pixel_array, sub_image, x0, y0)
+
+    def get_placed_image(self, image_mobject, pixel_array):
+        """Returns the image of an ImageMobject resampled to where it appears
+        in the pixel array, from the cache when possible.
 
-        sub_image = Image.fromarray(image_mobject.get_pixel_array(), mode="RGBA")
+        Parameters
+        ----------
+        image_mobject : ImageMobject
+            The ImageMobject to place.
+        pixel_array : np.ndarray
+            The pixel array the image is going to be displayed in.
 
-        # Reshape
-        pixel_width = max(int(pdist([ul_coords, ur_coords])), 1)
-        pixel_height = max(int(pdist([ul_coords, dl_coords])), 1)
-        sub_image = sub_image.resize(
-            (pixel_width, pixel_height), resample=Image.BICUBIC
+        Returns
+        -------
+        tuple or None
+            ``((x, y), sub_image)`` where ``sub_image`` is a premultiplied RGBA
+            array to be composited with its upper left corner at pixel
+            ``(x, y)``, or None if the image is not visible.
+        """
+        source = image_mobject.get_pixel_array()
+        corner_coords = self.points_to_subpixel_coords(
+            image_mobject, image_mobject.points
+        )
+        if isinstance(image_mobject, ImageMobjectFromCamera):
+            # Sub cameras render at the size their image is displayed at, so
+            # their pixels are usually copied as they are.
+            position = self.get_pixel_aligned_position(corner_coords, source)
+            if position is not None:
+                return position, source
+        key = (
+            corner_coords.tobytes(),
+            pixel_array.shape,
+            source.shape,
+            zlib.crc32(np.ascontiguousarray(source)),
         )
+        cached = self.image_mobject_cache.get(image_mobject)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        placed_image = self.resample_image(
+            source,
+            corner_coords,
+            pixel_array,
+            # Cameras draw premultiplied colors
+            premultiplied=isinstance(image_mobject, ImageMobjectFromCamera),
+        )
+        self.image_mobject_cache[image_mobject] = (key, placed_image)
+        return placed_image
 
-        # Rotate
-        angle = angle_of_vector(right_vect)
-        adjusted_angle = -int(360 * angle / TAU)
-        if adjusted_angle != 0:
-            sub_image = sub_image.rotate(
-                adjusted_angle, resample=Image.BICUBIC, expand=1
-            )
+    def get_pixel_aligned_position(self, corner_coords, source):
+        """Returns where to copy an image whose corners are within a pixel
+        of an unrotated and unscaled copy of it.
+
+        Parameters
+        ----------
+        corner_coords : np.ndarray
+            The pixel coordinates of the upper left, upper right and lower
+            left corners of the image.
+        source : np.ndarray
+            The pixel array of the image.
 
-        # TODO, there is no accounting for a shear...
+        Returns
+        -------
+        tuple or None
+            The ``(x, y)`` pixel of the upper left corner of the copy, or
+            None if the image has to be resampled.
+        """
+        ul_coords, ur_coords, dl_coords = corner_coords
+        height, width = source.shape[:2]
+        if np.allclose(ur_coords - ul_coords, (width, 0), atol=1) and np.allclose(
+            dl_coords - ul_coords, (0, height), atol=1
+        ):
+            return tuple(int(c) for c in np.round(ul_coords))
+        return None
+
+    def resample_image(self, source, corner_coords, pixel_array, premultiplied=False):
+        """Maps an RGBA image onto the parallelogram spanned by the given
+        corners with a single affine resampling step.
+
+        Parameters
+        ----------
+        source : np.ndarray
+            The RGBA pixel array of the image.
+        corner_coords : np.ndarray
+            The pixel coordinates of the upper left, upper right and lower
+            left corners of the image.
+        pixel_array : np.ndarray
+            The pixel array the image is going to be displayed in.
+        premultiplied : bool, optional
+            Whether the colors of ``source`` are already premultiplied by
+            their alpha, by default False
 
-        # Paste into an image as large as the camera's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.pixel_height, self.pixel_width)), mode="RGBA"
+        Returns
+        -------
+        tuple or None
+            See :meth:`get_placed_image`.
+        """
+        ul_coords, ur_coords, dl_coords = corner_coords
+        right_vect = ur_coords - ul_coords
+        down_vect = dl_coords - ul_coords
+        all_corners = np.array([ul_coords, ur_coords, dl_coords, ur_coords + down_vect])
+        ph, pw = pixel_array.shape[:2]
+        x0, y0 = np.clip(np.floor(all_corners.min(0)).astype(int), 0, (pw, ph))
+        x1, y1 = np.clip(np.ceil(all_corners.max(0)).astype(int), 0, (pw, ph))
+        if x1 <= x0 or y1 <= y0:
+            return None
+
+        if premultiplied:
+            height, width = source.shape[:2]
+            image = Image.frombuffer(
+                "RGBa",
+                (width, height),
+                np.ascontiguousarray(source),
+                "raw",
+                "RGBa",
+                0,
+                1,
+            )
+        else:
+            image = Image.fromarray(source, mode="RGBA").convert("RGBa")
+        # Maps coordinates within the image, relative to its size, to
+        # coordinates within the pixel array
+        image_to_pixel = np.array([right_vect, down_vect]).T
+        if abs(np.linalg.det(image_to_pixel)) < 1e-9:
+            return None
+        # Box-filter heavily shrunk images first, since the affine
+        # resampling doesn't antialias
+        scales = np.linalg.norm(image_to_pixel, axis=0) / image.size
+        reduction = int(1 / max(scales.max(), 1e-9))
+        if reduction >= 2:
+            image = image.reduce(min(reduction, *image.size))
+        width, height = image.size
+        pixel_to_image = np.linalg.inv(image_to_pixel) * [[width], [height]]
+        offset = pixel_to_image.dot([x0, y0] - ul_coords)
+        sub_image = image.transform(
+            (x1 - x0, y1 - y0),
+            Image.AFFINE,
+            data=(*pixel_to_image[0], offset[0], *pixel_to_image[1], offset[1]),
+            resample=Image.BICUBIC,
         )
-        new_ul_coords = center_coords - np.array(sub_image.size) / 2
-        new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
+        # Older Pillow versions can't convert "RGBa" images to arrays
+        sub_array = np.frombuffer(sub_image.tobytes(), np.uint8).reshape(
+            (sub_image.height, sub_image.width, 4)
         )
-        # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        return (x0, y0), sub_array
 
     def overlay_rgba_array(self, pixel_array, new_array):
         """Overlays an RGBA array on top of the given Pixel array.
@@ -952,9 +1266,9 @@ class Camera:
         pixel_array : np.array
             The original pixel array to modify.
         new_array : np.array
-            The new pixel array to overlay.
+            The new pixel array to overlay, with premultiplied colors.
         """
-        self.overlay_PIL_image(pixel_array, self.get_image(new_array))
+        composite_over(pixel_array, new_array)
 
     def overlay_PIL_image(self, pixel_array, image):
         """Overlays a PIL image on the passed pixel array.
@@ -966,9 +1280,7 @@ class Camera:
         image : PIL.Image
             The Image to overlay.
         """
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(self.get_image(pixel_array), image), dtype="uint8"
-        )
+        composite_over(pixel_array, premultiply(np.array(image.convert("RGBA"))))
 
     def adjust_out_of_range_points(self, points):
         """If any of the points in the passed array are out of
@@ -1013,6 +1325,23 @@ class Camera:
     def points_to_pixel_coords(
         self, mobject, points
     ):  # TODO: Write more detailed docstrings for this method.
+        return self.points_to_subpixel_coords(mobject, points).astype("int")
+
+    def points_to_subpixel_coords(self, mobject, points):
+        """Returns the (non rounded) pixel coordinates of the passed points.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject the points belong to.
+        points : np.ndarray
+            The points to convert.
+
+        Returns
+        -------
+        np.ndarray
+            An array of (x, y) pixel coordinates, as floats.
+        """
         points = self.transform_points_pre_display(mobject, points)
         shifted_points = points - self.frame_center
 
@@ -1030,7 +1359,7 @@ class Camera:
 
         result[:, 0] = shifted_points[:, 0] * width_mult + width_add
         result[:, 1] = shifted_points[:, 1] * height_mult + height_add
-        return result.astype("int")
+        return result
 
     def on_screen_pixels(self, pixel_coords):
         """Returns array of pixels that are on the screen from a given
@@ -1074,12 +1403,15 @@ class Camera:
         factor = fdiv(big_sum, this_sum)
         return 1 + (thickness - 1) / factor
 
-    def get_thickening_nudges(self, thickness):
+    def get_thickening_nudges(self, thickness, circular=False):
         """
 
         Parameters
         ----------
         thickness : int, float
+        circular : bool, optional
+            Whether to only keep the nudges within a disc of diameter
+            ``thickness`` rather than the full square, by default False
 
         Returns
         -------
@@ -1088,7 +1420,12 @@ class Camera:
         """
         thickness = int(thickness)
         _range = list(range(-thickness // 2 + 1, thickness // 2 + 1))
-        return np.array(list(it.product(_range, _range)))
+        nudges = np.array(list(it.product(_range, _range)))
+        if circular and len(nudges) > 1:
+            center = np.mean(_range)
+            distances = np.linalg.norm(nudges - center, axis=1)
+            nudges = nudges[distances <= thickness / 2]
+        return nudges
 
     def thickened_coordinates(self, pixel_coords, thickness):
         """Returns thickened coordinates for a passed array of pixel coords and
@@ -1220,18 +1557,20 @@ class BackgroundColoredVMobjectDisplayer:
         Returns
         -------
         np.ndarray
-            The pixel array of the file whose file name is `file_name`
+            The premultiplied pixel array of the file whose file name is
+            `file_name`
         """
         if file_name in self.file_name_to_pixel_array_map:
             return self.file_name_to_pixel_array_map[file_name]
         full_path = get_full_raster_image_path(file_name)
-        image = Image.open(full_path)
+        image = Image.open(full_path).convert("RGBA")
         back_array = np.array(image)
 
         pixel_array = self.pixel_array
         if not np.all(pixel_array.shape == back_array.shape):
             back_array = self.resize_background_array_to_match(back_array, pixel_array)
 
+        back_array = premultiply(back_array)
         self.file_name_to_pixel_array_map[file_name] = back_array
         return back_array
 
@@ -1252,19 +1591,16 @@ class BackgroundColoredVMobjectDisplayer:
             cvmobjects, lambda cv: cv.get_background_image_file()
         )
         curr_array = None
-        for batch, image_file in batch_image_file_pairs:
+        for image_file, batch in batch_image_file_pairs:
             background_array = self.get_background_array(image_file)
             pixel_array = self.pixel_array
             self.camera.display_multiple_non_background_colored_vmobjects(
                 batch, pixel_array
             )
-            new_array = np.array(
-                (background_array * pixel_array.astype("float") / 255),
-                dtype=self.camera.pixel_array_dtype,
-            )
+            composite_multiply(pixel_array, background_array)
             if curr_array is None:
-                curr_array = new_array
+                curr_array = pixel_array.copy()
             else:
-                curr_array = np.maximum(curr_array, new_array)
+                composite_lighten(curr_array, pixel_array)
             self.reset_pixel_array()
         return curr_array
@@ -28,6 +28,9 @@ class MappingCamera(Camera):
         self.mapping_func = mapping_func
         self.min_num_curves = min_num_curves
         self.allow_object_intrusion = allow_object_intrusion
+        # Bounding boxes say nothing about where an arbitrary mapping sends
+        # the points, so nothing can be culled safely.
+        kwargs.setdefault("cull_offscreen_mobjects", False)
         Camera.__init__(self, **kwargs)
 
     def points_to_pixel_coords(self, points):
@@ -9,6 +9,8 @@
 __all__ = ["CameraFrame", "MovingCamera"]
 
 
+import cairo
+
 from .. import config
 from ..camera.camera import Camera
 from ..constants import ORIGIN
@@ -57,6 +59,8 @@ class MovingCamera(Camera):
                 self.default_frame_stroke_width,
             )
         self.frame = frame
+        # The matrix values each cached cairo context was last set to.
+        self.pixel_array_to_cairo_matrix = {}
         Camera.__init__(self, **kwargs)
 
     # TODO, make these work for a rotated frame
@@ -133,24 +137,47 @@ class MovingCamera(Camera):
         # self.realign_frame_shape()
         Camera.capture_mobjects(self, mobjects, **kwargs)
 
-    # Since the frame can be moving around, the cairo
-    # context used for updating should be regenerated
-    # at each frame.  So no caching.
     def get_cached_cairo_context(self, pixel_array):
+        """Returns the cached cairo context of the passed
+        pixel array if it exists, and None if it doesn't.
+
+        As the frame can move around, the transformation matrix of the
+        context is updated whenever the position or the size of the frame
+        changed since the context was last used.  The surface itself is
+        reused from frame to frame.
+
+        Parameters
+        ----------
+        pixel_array : np.array
+            The pixel array to check.
+
+        Returns
+        -------
+        cairo.Context
+            The cached cairo context.
         """
-        Since the frame can be moving around, the cairo
-        context used for updating should be regenerated
-        at each frame.  So no caching.
-        """
-        return None
+        ctx = Camera.get_cached_cairo_context(self, pixel_array)
+        if ctx is not None:
+            matrix_values = self.get_cairo_matrix_values()
+            if matrix_values != self.pixel_array_to_cairo_matrix.get(id(pixel_array)):
+                ctx.set_matrix(cairo.Matrix(*matrix_values))
+                self.pixel_array_to_cairo_matrix[id(pixel_array)] = matrix_values
+        return ctx
 
     def cache_cairo_context(self, pixel_array, ctx):
+        """Caches the passed Pixel array into a Cairo Context
+
+        Parameters
+        ----------
+        pixel_array : np.array
+            The pixel array to cache
+        ctx : cairo.Context
+            The context to cache it into.
         """
-        Since the frame can be moving around, the cairo
-        context used for updating should be regenerated
-        at each frame.  So no caching.
-        """
-        pass
+        Camera.cache_cairo_context(self, pixel_array, ctx)
+        self.pixel_array_to_cairo_matrix[
+            id(pixel_array)
+        ] = self.get_cairo_matrix_values()
 
     # def reset_frame_center(self):
     #     self.frame_center = self.frame.get_center()
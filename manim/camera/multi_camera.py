@@ -3,6 +3,7 @@
 __all__ = ["MultiCamera"]
 
 
+from ..camera.camera import Camera
 from ..camera.moving_camera import MovingCamera
 from ..utils.iterables import list_difference_update
 
@@ -57,10 +58,18 @@ class MultiCamera(MovingCamera):
                 imfc.camera.frame.get_height(),
                 imfc.camera.frame.get_width(),
             )
-            imfc.camera.reset_pixel_shape(
-                int(pixel_height * imfc.get_height() / self.frame_height),
-                int(pixel_width * imfc.get_width() / self.frame_width),
-            )
+            new_pixel_height = int(pixel_height * imfc.get_height() / self.frame_height)
+            new_pixel_width = int(pixel_width * imfc.get_width() / self.frame_width)
+            if (imfc.camera.pixel_height, imfc.camera.pixel_width) != (
+                new_pixel_height,
+                new_pixel_width,
+            ):
+                imfc.camera.reset_pixel_shape(new_pixel_height, new_pixel_width)
+            else:
+                # Keep the background and the pixel array, and with it the
+                # cairo context of the sub camera.
+                imfc.camera.resize_frame_shape()
+                imfc.camera.reset()
 
     def reset(self):
         """Resets the MultiCamera.
@@ -77,12 +86,28 @@ class MultiCamera(MovingCamera):
 
     def capture_mobjects(self, mobjects, **kwargs):
         self.update_sub_cameras()
-        for imfc in self.image_mobjects_from_cameras:
-            to_add = list(mobjects)
-            if not self.allow_cameras_to_capture_their_own_display:
-                to_add = list_difference_update(to_add, imfc.get_family())
-            imfc.camera.capture_mobjects(to_add, **kwargs)
-        MovingCamera.capture_mobjects(self, mobjects, **kwargs)
+        # The family of the mobjects is extracted, and the path of each
+        # vectorized mobject built, once for all the cameras.
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        cameras = [imfc.camera for imfc in self.image_mobjects_from_cameras]
+        cameras.append(self)
+        path_cache = {}
+        for camera in cameras:
+            if (
+                type(camera).transform_points_pre_display
+                is Camera.transform_points_pre_display
+            ):
+                camera.path_cache = path_cache
+        try:
+            for imfc in self.image_mobjects_from_cameras:
+                to_add = mobjects
+                if not self.allow_cameras_to_capture_their_own_display:
+                    to_add = list_difference_update(to_add, imfc.get_family())
+                imfc.camera.capture_mobjects(to_add, include_submobjects=False)
+            MovingCamera.capture_mobjects(self, mobjects, include_submobjects=False)
+        finally:
+            for camera in cameras:
+                camera.path_cache = None
 
     def get_mobjects_indicating_movement(self):
         """Returns all mobjects whose movement implies that the camera
@@ -325,6 +325,17 @@ class ThreeDCamera(Camera):
         else:
             return self.project_points(points)
 
+    def get_mobject_frame_bounds(self, mobject):  # NOTE : DocStrings From parent
+        if self.exponential_projection and mobject not in self.fixed_in_frame_mobjects:
+            # The exponential projection can bulge boxes outwards, so the
+            # actual points have to be projected.
+            points = self.transform_points_pre_display(mobject, mobject.points)
+            return points[:, :2].min(0), points[:, :2].max(0)
+        # The perspective projection maps the bounding box of points in front
+        # of the camera to a convex region spanned by its projected corners,
+        # and points behind the camera are pushed far out, which keeps them.
+        return super().get_mobject_frame_bounds(mobject)
+
     def add_fixed_orientation_mobjects(
         self, *mobjects, use_static_center_func=False, center_func=None
     ):
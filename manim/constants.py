@@ -177,3 +177,27 @@ QUALITIES: typing.Dict[str, typing.Dict[str, typing.Union[str, int, None]]] = {
 
 DEFAULT_QUALITY: str = "high_quality"
 DEFAULT_QUALITY_SHORT = QUALITIES[DEFAULT_QUALITY]["flag"]
+
+# Encoder profiles, trading file size for encoding speed
+ENCODER_PROFILES: typing.Dict[str, typing.Dict[str, typing.Union[str, int]]] = {
+    "preview": {
+        "video_codec": "libx264",
+        "encoder_preset": "ultrafast",
+        "encoder_crf": 23,
+        "encoder_tune": "",
+    },
+    "default": {
+        "video_codec": "libx264",
+        "encoder_preset": "medium",
+        "encoder_crf": 23,
+        "encoder_tune": "",
+    },
+    "master": {
+        "video_codec": "libx264",
+        "encoder_preset": "slow",
+        "encoder_crf": 18,
+        "encoder_tune": "animation",
+    },
+}
+
+DEFAULT_ENCODER_PROFILE: str = "default"
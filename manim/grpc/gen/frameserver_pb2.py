@@ -18,7 +18,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x11\x66rameserver.proto\x12\x0b\x66rameserver";\n\x16\x46\x65tchSceneDataResponse\x12!\n\x05scene\x18\x01 \x01(\x0b\x32\x12.frameserver.Scene"[\n\x05Scene\x12\x0c\n\x04name\x18\x01 \x01(\t\x12*\n\nanimations\x18\x02 \x03(\x0b\x32\x16.frameserver.Animation\x12\x18\n\x10\x62\x61\x63kground_color\x18\x03 \x01(\t"+\n\tAnimation\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x64uration\x18\x02 \x01(\x02"\xd5\x01\n\x0c\x46rameRequest\x12\x13\n\x0btime_offset\x18\x01 \x01(\x02\x12\x13\n\x0bstart_index\x18\x02 \x01(\x05\x12\x11\n\tend_index\x18\x03 \x01(\x05\x12\x13\n\x0bimage_index\x18\x04 \x01(\x05\x12;\n\x0cpreview_mode\x18\x05 \x01(\x0e\x32%.frameserver.FrameRequest.PreviewMode"6\n\x0bPreviewMode\x12\x07\n\x03\x41LL\x10\x00\x12\x13\n\x0f\x41NIMATION_RANGE\x10\x01\x12\t\n\x05IMAGE\x10\x02"u\n\x05Style\x12\x12\n\nfill_color\x18\x01 \x01(\t\x12\x14\n\x0c\x66ill_opacity\x18\x02 \x01(\x02\x12\x14\n\x0cstroke_color\x18\x03 \x01(\t\x12\x16\n\x0estroke_opacity\x18\x04 \x01(\x02\x12\x14\n\x0cstroke_width\x18\x05 \x01(\x02"(\n\x05Point\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01z\x18\x03 \x01(\x02"\x97\x02\n\x0bMobjectData\x12\n\n\x02id\x18\x01 \x01(\x03\x12!\n\x05style\x18\x02 \x01(\x0b\x32\x12.frameserver.Style\x12\x32\n\x04type\x18\x03 \x01(\x0e\x32$.frameserver.MobjectData.MobjectType\x12:\n\x17vectorized_mobject_data\x18\x04 \x01(\x0b\x32\x19.frameserver.VMobjectData\x12\x39\n\x12image_mobject_data\x18\x05 \x01(\x0b\x32\x1d.frameserver.ImageMobjectData".\n\x0bMobjectType\x12\x0c\n\x08VMOBJECT\x10\x00\x12\x11\n\rIMAGE_MOBJECT\x10\x01"H\n\x0cVMobjectData\x12"\n\x06points\x18\x01 \x03(\x0b\x32\x12.frameserver.Point\x12\x14\n\x0cneeds_redraw\x18\x02 \x01(\x08"c\n\x10ImageMobjectData\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\r\n\x05width\x18\x03 \x01(\x02\x12"\n\x06\x63\x65nter\x18\x04 \x01(\x0b\x32\x12.frameserver.Point"\xdf\x01\n\rFrameResponse\x12*\n\x08mobjects\x18\x01 \x03(\x0b\x32\x18.frameserver.MobjectData\x12\x15\n\rframe_pending\x18\x02 \x01(\x08\x12\x1a\n\x12\x61nimation_finished\x18\x03 \x01(\x08\x12\x16\n\x0escene_finished\x18\x04 \x01(\x08\x12\x10\n\x08\x64uration\x18\x05 \x01(\x02\x12\x12\n\nanimations\x18\x06 \x03(\t\x12\x17\n\x0f\x61nimation_index\x18\x07 \x01(\x05\x12\x18\n\x10\x61nimation_offset\x18\x08 \x01(\x02"\x0e\n\x0c\x45mptyRequest"\x0f\n\rEmptyResponse2\xa8\x01\n\x0b\x46rameServer\x12G\n\x0eGetFrameAtTime\x12\x19.frameserver.FrameRequest\x1a\x1a.frameserver.FrameResponse\x12P\n\x0e\x46\x65tchSceneData\x12\x19.frameserver.EmptyRequest\x1a#.frameserver.FetchSceneDataResponseb\x06proto3',
+    serialized_pb=b'\n\x11\x66rameserver.proto\x12\x0b\x66rameserver";\n\x16\x46\x65tchSceneDataResponse\x12!\n\x05scene\x18\x01 \x01(\x0b\x32\x12.frameserver.Scene"[\n\x05Scene\x12\x0c\n\x04name\x18\x01 \x01(\t\x12*\n\nanimations\x18\x02 \x03(\x0b\x32\x16.frameserver.Animation\x12\x18\n\x10\x62\x61\x63kground_color\x18\x03 \x01(\t"+\n\tAnimation\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x64uration\x18\x02 \x01(\x02"\x87\x02\n\x0c\x46rameRequest\x12\x13\n\x0btime_offset\x18\x01 \x01(\x02\x12\x13\n\x0bstart_index\x18\x02 \x01(\x05\x12\x11\n\tend_index\x18\x03 \x01(\x05\x12\x13\n\x0bimage_index\x18\x04 \x01(\x05\x12;\n\x0cpreview_mode\x18\x05 \x01(\x0e\x32%.frameserver.FrameRequest.PreviewMode\x12\x0e\n\x06packed\x18\x06 \x01(\x08\x12\x11\n\tclient_id\x18\x07 \x01(\t\x12\r\n\x05\x64\x65lta\x18\x08 \x01(\x08"6\n\x0bPreviewMode\x12\x07\n\x03\x41LL\x10\x00\x12\x13\n\x0f\x41NIMATION_RANGE\x10\x01\x12\t\n\x05IMAGE\x10\x02"w\n\x11\x46rameRangeRequest\x12(\n\x05\x66rame\x18\x01 \x01(\x0b\x32\x19.frameserver.FrameRequest\x12\x12\n\nstart_time\x18\x02 \x01(\x02\x12\x10\n\x08\x65nd_time\x18\x03 \x01(\x02\x12\x12\n\nframe_rate\x18\x04 \x01(\x02"\xe3\x01\n\x12RasterFrameRequest\x12(\n\x05\x66rame\x18\x01 \x01(\x0b\x32\x19.frameserver.FrameRequest\x12\x13\n\x0bpixel_width\x18\x02 \x01(\x05\x12\x14\n\x0cpixel_height\x18\x03 \x01(\x05\x12;\n\x06\x66ormat\x18\x04 \x01(\x0e\x32+.frameserver.RasterFrameRequest.ImageFormat\x12\x0f\n\x07quality\x18\x05 \x01(\x05"*\n\x0bImageFormat\x12\x07\n\x03PNG\x10\x00\x12\x08\n\x04JPEG\x10\x01\x12\x08\n\x04WEBP\x10\x02"\x9a\x01\n\x13RasterFrameResponse\x12\r\n\x05image\x18\x01 \x01(\x0c\x12\x13\n\x0bpixel_width\x18\x02 \x01(\x05\x12\x14\n\x0cpixel_height\x18\x03 \x01(\x05\x12\x16\n\x0escene_finished\x18\x04 \x01(\x08\x12\x17\n\x0f\x61nimation_index\x18\x05 \x01(\x05\x12\x18\n\x10\x61nimation_offset\x18\x06 \x01(\x02"\x9f\x01\n\x05Style\x12\x12\n\nfill_color\x18\x01 \x01(\t\x12\x14\n\x0c\x66ill_opacity\x18\x02 \x01(\x02\x12\x14\n\x0cstroke_color\x18\x03 \x01(\t\x12\x16\n\x0estroke_opacity\x18\x04 \x01(\x02\x12\x14\n\x0cstroke_width\x18\x05 \x01(\x02\x12\x12\n\nfill_rgbas\x18\x06 \x03(\x02\x12\x14\n\x0cstroke_rgbas\x18\x07 \x03(\x02"(\n\x05Point\x12\t\n\x01x\x18\x01 \x01(\x02\x12\t\n\x01y\x18\x02 \x01(\x02\x12\t\n\x01z\x18\x03 \x01(\x02"\x97\x02\n\x0bMobjectData\x12\n\n\x02id\x18\x01 \x01(\x03\x12!\n\x05style\x18\x02 \x01(\x0b\x32\x12.frameserver.Style\x12\x32\n\x04type\x18\x03 \x01(\x0e\x32$.frameserver.MobjectData.MobjectType\x12:\n\x17vectorized_mobject_data\x18\x04 \x01(\x0b\x32\x19.frameserver.VMobjectData\x12\x39\n\x12image_mobject_data\x18\x05 \x01(\x0b\x32\x1d.frameserver.ImageMobjectData".\n\x0bMobjectType\x12\x0c\n\x08VMOBJECT\x10\x00\x12\x11\n\rIMAGE_MOBJECT\x10\x01"_\n\x0cVMobjectData\x12"\n\x06points\x18\x01 \x03(\x0b\x32\x12.frameserver.Point\x12\x14\n\x0cneeds_redraw\x18\x02 \x01(\x08\x12\x15\n\rpacked_points\x18\x03 \x01(\x0c"c\n\x10ImageMobjectData\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06height\x18\x02 \x01(\x02\x12\r\n\x05width\x18\x03 \x01(\x02\x12"\n\x06\x63\x65nter\x18\x04 \x01(\x0b\x32\x12.frameserver.Point"\x91\x02\n\rFrameResponse\x12*\n\x08mobjects\x18\x01 \x03(\x0b\x32\x18.frameserver.MobjectData\x12\x15\n\rframe_pending\x18\x02 \x01(\x08\x12\x1a\n\x12\x61nimation_finished\x18\x03 \x01(\x08\x12\x16\n\x0escene_finished\x18\x04 \x01(\x08\x12\x10\n\x08\x64uration\x18\x05 \x01(\x02\x12\x12\n\nanimations\x18\x06 \x03(\t\x12\x17\n\x0f\x61nimation_index\x18\x07 \x01(\x05\x12\x18\n\x10\x61nimation_offset\x18\x08 \x01(\x02\x12\x13\n\x0bmobject_ids\x18\t \x03(\x03\x12\x1b\n\x13removed_mobject_ids\x18\n \x03(\x03"\x0e\n\x0c\x45mptyRequest"\x0f\n\rEmptyResponse2\xcb\x02\n\x0b\x46rameServer\x12G\n\x0eGetFrameAtTime\x12\x19.frameserver.FrameRequest\x1a\x1a.frameserver.FrameResponse\x12P\n\x0e\x46\x65tchSceneData\x12\x19.frameserver.EmptyRequest\x1a#.frameserver.FetchSceneDataResponse\x12L\n\x0cStreamFrames\x12\x1e.frameserver.FrameRangeRequest\x1a\x1a.frameserver.FrameResponse0\x01\x12S\n\x0eGetRasterFrame\x12\x1f.frameserver.RasterFrameRequest\x1a .frameserver.RasterFrameResponseb\x06proto3',
 )
 
 
@@ -56,11 +56,50 @@ _FRAMEREQUEST_PREVIEWMODE = _descriptor.EnumDescriptor(
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=393,
-    serialized_end=447,
+    serialized_start=443,
+    serialized_end=497,
 )
 _sym_db.RegisterEnumDescriptor(_FRAMEREQUEST_PREVIEWMODE)
 
+_RASTERFRAMEREQUEST_IMAGEFORMAT = _descriptor.EnumDescriptor(
+    name="ImageFormat",
+    full_name="frameserver.RasterFrameRequest.ImageFormat",
+    filename=None,
+    file=DESCRIPTOR,
+    create_key=_descriptor._internal_create_key,
+    values=[
+        _descriptor.EnumValueDescriptor(
+            name="PNG",
+            index=0,
+            number=0,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="JPEG",
+            index=1,
+            number=1,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="WEBP",
+            index=2,
+            number=2,
+            serialized_options=None,
+            type=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    containing_type=None,
+    serialized_options=None,
+    serialized_start=806,
+    serialized_end=848,
+)
+_sym_db.RegisterEnumDescriptor(_RASTERFRAMEREQUEST_IMAGEFORMAT)
+
 _MOBJECTDATA_MOBJECTTYPE = _descriptor.EnumDescriptor(
     name="MobjectType",
     full_name="frameserver.MobjectData.MobjectType",
@@ -87,8 +126,8 @@ _MOBJECTDATA_MOBJECTTYPE = _descriptor.EnumDescriptor(
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=844,
-    serialized_end=890,
+    serialized_start=1445,
+    serialized_end=1491,
 )
 _sym_db.RegisterEnumDescriptor(_MOBJECTDATA_MOBJECTTYPE)
 
@@ -376,6 +415,63 @@ _FRAMEREQUEST = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="packed",
+            full_name="frameserver.FrameRequest.packed",
+            index=5,
+            number=6,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="client_id",
+            full_name="frameserver.FrameRequest.client_id",
+            index=6,
+            number=7,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="delta",
+            full_name="frameserver.FrameRequest.delta",
+            index=7,
+            number=8,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -388,7 +484,360 @@ _FRAMEREQUEST = _descriptor.Descriptor(
     extension_ranges=[],
     oneofs=[],
     serialized_start=234,
-    serialized_end=447,
+    serialized_end=497,
+)
+
+
+_FRAMERANGEREQUEST = _descriptor.Descriptor(
+    name="FrameRangeRequest",
+    full_name="frameserver.FrameRangeRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="frame",
+            full_name="frameserver.FrameRangeRequest.frame",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="start_time",
+            full_name="frameserver.FrameRangeRequest.start_time",
+            index=1,
+            number=2,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="end_time",
+            full_name="frameserver.FrameRangeRequest.end_time",
+            index=2,
+            number=3,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="frame_rate",
+            full_name="frameserver.FrameRangeRequest.frame_rate",
+            index=3,
+            number=4,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=499,
+    serialized_end=618,
+)
+
+
+_RASTERFRAMEREQUEST = _descriptor.Descriptor(
+    name="RasterFrameRequest",
+    full_name="frameserver.RasterFrameRequest",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="frame",
+            full_name="frameserver.RasterFrameRequest.frame",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="pixel_width",
+            full_name="frameserver.RasterFrameRequest.pixel_width",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="pixel_height",
+            full_name="frameserver.RasterFrameRequest.pixel_height",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="format",
+            full_name="frameserver.RasterFrameRequest.format",
+            index=3,
+            number=4,
+            type=14,
+            cpp_type=8,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="quality",
+            full_name="frameserver.RasterFrameRequest.quality",
+            index=4,
+            number=5,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[
+        _RASTERFRAMEREQUEST_IMAGEFORMAT,
+    ],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=621,
+    serialized_end=848,
+)
+
+
+_RASTERFRAMERESPONSE = _descriptor.Descriptor(
+    name="RasterFrameResponse",
+    full_name="frameserver.RasterFrameResponse",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="image",
+            full_name="frameserver.RasterFrameResponse.image",
+            index=0,
+            number=1,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="pixel_width",
+            full_name="frameserver.RasterFrameResponse.pixel_width",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="pixel_height",
+            full_name="frameserver.RasterFrameResponse.pixel_height",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="scene_finished",
+            full_name="frameserver.RasterFrameResponse.scene_finished",
+            index=3,
+            number=4,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="animation_index",
+            full_name="frameserver.RasterFrameResponse.animation_index",
+            index=4,
+            number=5,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="animation_offset",
+            full_name="frameserver.RasterFrameResponse.animation_offset",
+            index=5,
+            number=6,
+            type=2,
+            cpp_type=6,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=851,
+    serialized_end=1005,
 )
 
 
@@ -495,6 +944,44 @@ _STYLE = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="fill_rgbas",
+            full_name="frameserver.Style.fill_rgbas",
+            index=5,
+            number=6,
+            type=2,
+            cpp_type=6,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="stroke_rgbas",
+            full_name="frameserver.Style.stroke_rgbas",
+            index=6,
+            number=7,
+            type=2,
+            cpp_type=6,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -504,8 +991,8 @@ _STYLE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=449,
-    serialized_end=566,
+    serialized_start=1008,
+    serialized_end=1167,
 )
 
 
@@ -583,8 +1070,8 @@ _POINT = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=568,
-    serialized_end=608,
+    serialized_start=1169,
+    serialized_end=1209,
 )
 
 
@@ -702,8 +1189,8 @@ _MOBJECTDATA = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=611,
-    serialized_end=890,
+    serialized_start=1212,
+    serialized_end=1491,
 )
 
 
@@ -753,6 +1240,25 @@ _VMOBJECTDATA = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="packed_points",
+            full_name="frameserver.VMobjectData.packed_points",
+            index=2,
+            number=3,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -762,8 +1268,8 @@ _VMOBJECTDATA = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=892,
-    serialized_end=964,
+    serialized_start=1493,
+    serialized_end=1588,
 )
 
 
@@ -860,8 +1366,8 @@ _IMAGEMOBJECTDATA = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=966,
-    serialized_end=1065,
+    serialized_start=1590,
+    serialized_end=1689,
 )
 
 
@@ -1025,6 +1531,44 @@ _FRAMERESPONSE = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="mobject_ids",
+            full_name="frameserver.FrameResponse.mobject_ids",
+            index=8,
+            number=9,
+            type=3,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="removed_mobject_ids",
+            full_name="frameserver.FrameResponse.removed_mobject_ids",
+            index=9,
+            number=10,
+            type=3,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -1034,8 +1578,8 @@ _FRAMERESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1068,
-    serialized_end=1291,
+    serialized_start=1692,
+    serialized_end=1965,
 )
 
 
@@ -1055,8 +1599,8 @@ _EMPTYREQUEST = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1293,
-    serialized_end=1307,
+    serialized_start=1967,
+    serialized_end=1981,
 )
 
 
@@ -1076,14 +1620,18 @@ _EMPTYRESPONSE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1309,
-    serialized_end=1324,
+    serialized_start=1983,
+    serialized_end=1998,
 )
 
 _FETCHSCENEDATARESPONSE.fields_by_name["scene"].message_type = _SCENE
 _SCENE.fields_by_name["animations"].message_type = _ANIMATION
 _FRAMEREQUEST.fields_by_name["preview_mode"].enum_type = _FRAMEREQUEST_PREVIEWMODE
 _FRAMEREQUEST_PREVIEWMODE.containing_type = _FRAMEREQUEST
+_FRAMERANGEREQUEST.fields_by_name["frame"].message_type = _FRAMEREQUEST
+_RASTERFRAMEREQUEST.fields_by_name["frame"].message_type = _FRAMEREQUEST
+_RASTERFRAMEREQUEST.fields_by_name["format"].enum_type = _RASTERFRAMEREQUEST_IMAGEFORMAT
+_RASTERFRAMEREQUEST_IMAGEFORMAT.containing_type = _RASTERFRAMEREQUEST
 _MOBJECTDATA.fields_by_name["style"].message_type = _STYLE
 _MOBJECTDATA.fields_by_name["type"].enum_type = _MOBJECTDATA_MOBJECTTYPE
 _MOBJECTDATA.fields_by_name["vectorized_mobject_data"].message_type = _VMOBJECTDATA
@@ -1096,6 +1644,9 @@ DESCRIPTOR.message_types_by_name["FetchSceneDataResponse"] = _FETCHSCENEDATARESP
 DESCRIPTOR.message_types_by_name["Scene"] = _SCENE
 DESCRIPTOR.message_types_by_name["Animation"] = _ANIMATION
 DESCRIPTOR.message_types_by_name["FrameRequest"] = _FRAMEREQUEST
+DESCRIPTOR.message_types_by_name["FrameRangeRequest"] = _FRAMERANGEREQUEST
+DESCRIPTOR.message_types_by_name["RasterFrameRequest"] = _RASTERFRAMEREQUEST
+DESCRIPTOR.message_types_by_name["RasterFrameResponse"] = _RASTERFRAMERESPONSE
 DESCRIPTOR.message_types_by_name["Style"] = _STYLE
 DESCRIPTOR.message_types_by_name["Point"] = _POINT
 DESCRIPTOR.message_types_by_name["MobjectData"] = _MOBJECTDATA
@@ -1150,6 +1701,39 @@ FrameRequest = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(FrameRequest)
 
+FrameRangeRequest = _reflection.GeneratedProtocolMessageType(
+    "FrameRangeRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _FRAMERANGEREQUEST,
+        "__module__": "frameserver_pb2"
+        # @@protoc_insertion_point(class_scope:frameserver.FrameRangeRequest)
+    },
+)
+_sym_db.RegisterMessage(FrameRangeRequest)
+
+RasterFrameRequest = _reflection.GeneratedProtocolMessageType(
+    "RasterFrameRequest",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _RASTERFRAMEREQUEST,
+        "__module__": "frameserver_pb2"
+        # @@protoc_insertion_point(class_scope:frameserver.RasterFrameRequest)
+    },
+)
+_sym_db.RegisterMessage(RasterFrameRequest)
+
+RasterFrameResponse = _reflection.GeneratedProtocolMessageType(
+    "RasterFrameResponse",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _RASTERFRAMERESPONSE,
+        "__module__": "frameserver_pb2"
+        # @@protoc_insertion_point(class_scope:frameserver.RasterFrameResponse)
+    },
+)
+_sym_db.RegisterMessage(RasterFrameResponse)
+
 Style = _reflection.GeneratedProtocolMessageType(
     "Style",
     (_message.Message,),
@@ -1246,8 +1830,8 @@ _FRAMESERVER = _descriptor.ServiceDescriptor(
     index=0,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_start=1327,
-    serialized_end=1495,
+    serialized_start=2001,
+    serialized_end=2332,
     methods=[
         _descriptor.MethodDescriptor(
             name="GetFrameAtTime",
@@ -1269,6 +1853,26 @@ _FRAMESERVER = _descriptor.ServiceDescriptor(
             serialized_options=None,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.MethodDescriptor(
+            name="StreamFrames",
+            full_name="frameserver.FrameServer.StreamFrames",
+            index=2,
+            containing_service=None,
+            input_type=_FRAMERANGEREQUEST,
+            output_type=_FRAMERESPONSE,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.MethodDescriptor(
+            name="GetRasterFrame",
+            full_name="frameserver.FrameServer.GetRasterFrame",
+            index=3,
+            containing_service=None,
+            input_type=_RASTERFRAMEREQUEST,
+            output_type=_RASTERFRAMERESPONSE,
+            serialized_options=None,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
 )
 _sym_db.RegisterServiceDescriptor(_FRAMESERVER)
@@ -24,6 +24,16 @@ class FrameServerStub(object):
             request_serializer=frameserver__pb2.EmptyRequest.SerializeToString,
             response_deserializer=frameserver__pb2.FetchSceneDataResponse.FromString,
         )
+        self.StreamFrames = channel.unary_stream(
+            "/frameserver.FrameServer/StreamFrames",
+            request_serializer=frameserver__pb2.FrameRangeRequest.SerializeToString,
+            response_deserializer=frameserver__pb2.FrameResponse.FromString,
+        )
+        self.GetRasterFrame = channel.unary_unary(
+            "/frameserver.FrameServer/GetRasterFrame",
+            request_serializer=frameserver__pb2.RasterFrameRequest.SerializeToString,
+            response_deserializer=frameserver__pb2.RasterFrameResponse.FromString,
+        )
 
 
 class FrameServerServicer(object):
@@ -41,6 +51,22 @@ class FrameServerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamFrames(self, request, context):
+        """Streams the frames of a time range, each one as a delta from the
+        previous one.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def GetRasterFrame(self, request, context):
+        """Returns an image of the scene at the specified time, rendered on the
+        server.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_FrameServerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +80,16 @@ def add_FrameServerServicer_to_server(servicer, server):
             request_deserializer=frameserver__pb2.EmptyRequest.FromString,
             response_serializer=frameserver__pb2.FetchSceneDataResponse.SerializeToString,
         ),
+        "StreamFrames": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamFrames,
+            request_deserializer=frameserver__pb2.FrameRangeRequest.FromString,
+            response_serializer=frameserver__pb2.FrameResponse.SerializeToString,
+        ),
+        "GetRasterFrame": grpc.unary_unary_rpc_method_handler(
+            servicer.GetRasterFrame,
+            request_deserializer=frameserver__pb2.RasterFrameRequest.FromString,
+            response_serializer=frameserver__pb2.RasterFrameResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "frameserver.FrameServer", rpc_method_handlers
@@ -122,3 +158,61 @@ class FrameServer(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def StreamFrames(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/frameserver.FrameServer/StreamFrames",
+            frameserver__pb2.FrameRangeRequest.SerializeToString,
+            frameserver__pb2.FrameResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def GetRasterFrame(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/frameserver.FrameServer/GetRasterFrame",
+            frameserver__pb2.RasterFrameRequest.SerializeToString,
+            frameserver__pb2.RasterFrameResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -4,6 +4,8 @@ from ..gen import frameserver_pb2_grpc
 from ..gen import renderserver_pb2
 from ..gen import renderserver_pb2_grpc
 from concurrent import futures
+import collections
+import io
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 import grpc
@@ -11,6 +13,7 @@ import subprocess as sp
 import threading
 import time
 import traceback
+import types
 from ...utils.module_ops import (
     get_module,
     get_scene_classes_from_module,
@@ -18,11 +21,11 @@ from ...utils.module_ops import (
     scene_classes_from_file,
 )
 from ... import logger
+from ...camera.camera import Camera
 from ...constants import JS_RENDERER_INFO
 from ...renderer.js_renderer import JsRenderer
 from ...utils.family import extract_mobject_family_members
 import logging
-import copy
 from ...mobject.value_tracker import ValueTracker
 from ...mobject.types.vectorized_mobject import VMobject
 from ...mobject.types.image_mobject import ImageMobject
@@ -46,22 +49,32 @@ class ScriptUpdateHandler(FileSystemEventHandler):
         self.catch_all_handler(event)
 
     def on_modified(self, event):
-        self.frame_server.load_scene_module()
-
-        with grpc.insecure_channel("localhost:50052") as channel:
-            stub = renderserver_pb2_grpc.RenderServerStub(channel)
-            try:
-                self.frame_server.update_renderer_scene_data()
-            except grpc._channel._InactiveRpcError:
-                logger.warning("No frontend was detected at localhost:50052.")
-                sp.Popen(config["js_renderer_path"])
+        self.frame_server.schedule_reload()
 
 
 class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
+    # The time to wait for further changes to the scene's file before
+    # reloading it, in seconds.
+    reload_delay = 0.5
+    # The number of images kept by GetRasterFrame.
+    raster_cache_size = 256
+    # The number of clients whose last frame is remembered for delta frames.
+    max_clients = 16
+
     def __init__(self, server, input_file_path):
         self.server = server
         self.input_file_path = input_file_path
         self.exception = None
+        self.keyframes = []
+        # Guards the scene and keyframes being served, which are replaced at
+        # once when a reload is done.
+        self.lock = threading.Lock()
+        self.reload_lock = threading.Lock()
+        self.reload_timer = None
+        # Images rendered by GetRasterFrame, by keyframe index, time, size and
+        # format, least recently used first.
+        self.raster_cache = collections.OrderedDict()
+        self.raster_cameras = {}
         self.load_scene_module()
 
         observer = Observer()
@@ -83,87 +96,293 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
 
     def GetFrameAtTime(self, request, context):
         try:
-            # Determine start and end indices.
-            if (
-                request.preview_mode
-                == frameserver_pb2.FrameRequest.PreviewMode.ANIMATION_RANGE
-            ):
-                requested_scene_index = request.start_index
-            elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.ALL:
-                requested_scene_index = 0
-            elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.IMAGE:
-                requested_scene_index = request.image_index
-
-            if (
-                request.preview_mode
-                == frameserver_pb2.FrameRequest.PreviewMode.ANIMATION_RANGE
-                and request.end_index > request.start_index
-            ):
-                requested_end_index = request.end_index
-            elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.ALL:
-                requested_end_index = len(self.keyframes)
-            elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.IMAGE:
-                requested_end_index = len(self.keyframes)
-
-            # Find the requested scene.
-            requested_scene = self.keyframes[requested_scene_index]
-            requested_scene_end_time = requested_scene.duration
-            scene_finished = False
-            while requested_scene_end_time < request.time_offset:
-                if requested_scene_index + 1 < requested_end_index:
-                    requested_scene_index += 1
-                    requested_scene = self.keyframes[requested_scene_index]
-                    requested_scene_end_time += requested_scene.duration
-                else:
-                    scene_finished = True
-                    break
-
-            if requested_scene_index == self.previous_scene_index:
-                requested_scene = self.previous_scene
-            else:
-                requested_scene = copy.deepcopy(requested_scene)
-                self.previous_scene = requested_scene
-                self.previous_scene_index = requested_scene_index
-
-            # Update to the requested time.
-            if not scene_finished:
-                requested_scene_start_time = (
-                    requested_scene_end_time - requested_scene.duration
+            with self.lock:
+                return self.get_frame_response(
+                    request,
+                    request.time_offset,
+                    self.get_client_digests(request),
+                    delta=request.delta,
                 )
-                animation_offset = request.time_offset - requested_scene_start_time
-            else:
-                animation_offset = requested_scene.duration
-            requested_scene.update_to_time(animation_offset)
+        except Exception as e:
+            traceback.print_exc()
+
+    def StreamFrames(self, request, context):
+        try:
+            frame_request = request.frame
+            with self.lock:
+                sent_digests = self.get_client_digests(frame_request)
+            delta = frame_request.delta
+            if sent_digests is None:
+                sent_digests = {}
+                delta = False
+            frame_rate = request.frame_rate or config["frame_rate"]
+            duration = request.end_time - request.start_time
+            num_frames = int(duration * frame_rate + 1e-6) + 1
+            for i in range(num_frames):
+                if not context.is_active():
+                    return
+                with self.lock:
+                    response = self.get_frame_response(
+                        frame_request,
+                        request.start_time + i / frame_rate,
+                        sent_digests,
+                        delta=delta,
+                    )
+                yield response
+                delta = True
+        except Exception as e:
+            traceback.print_exc()
+
+    def GetRasterFrame(self, request, context):
+        try:
+            with self.lock:
+                return self.get_raster_frame_response(request)
+        except Exception as e:
+            traceback.print_exc()
 
-            # Serialize the scene's mobjects.
-            mobjects = extract_mobject_family_members(
+    def get_client_digests(self, request):
+        """Returns the digests of the mobjects last sent to the client making
+        a request, or ``None`` if the request doesn't identify its client.
+
+        Only the :attr:`max_clients` most recent clients are remembered; a
+        client that was forgotten is sent full frames again.
+        """
+        if not request.client_id:
+            return None
+        sent_digests = self.client_digests.setdefault(request.client_id, {})
+        self.client_digests.move_to_end(request.client_id)
+        while len(self.client_digests) > self.max_clients:
+            self.client_digests.popitem(last=False)
+        return sent_digests
+
+    def get_frame_response(self, request, time_offset, sent_digests=None, delta=False):
+        """Serializes the scene at ``time_offset``.
+
+        Parameters
+        ----------
+        request : :class:`FrameRequest`
+            The request, giving the range of the scene to look at and how to
+            encode the frame.
+        time_offset : :class:`float`
+            The time of the frame.
+        sent_digests : Optional[:class:`dict`]
+            Maps the ids of the mobjects last sent to the client to their
+            digest.  It is updated to the mobjects of this frame.
+        delta : :class:`bool`
+            Whether to leave out the mobjects whose digest is unchanged.
+
+        Returns
+        -------
+        :class:`FrameResponse`
+            The frame.
+        """
+        requested_scene_index, animation_offset, scene_finished = self.find_keyframe(
+            request, time_offset
+        )
+        requested_scene = self.seek(requested_scene_index, animation_offset)
+
+        # Serialize the scene's mobjects.
+        mobjects = [
+            mobject
+            for mobject in extract_mobject_family_members(
                 requested_scene.mobjects, only_those_with_points=True
             )
+            if not isinstance(mobject, ValueTracker)
+        ]
+        mobject_ids = []
+        removed_mobject_ids = []
+        if sent_digests is None:
             serialized_mobjects = [
-                serialize_mobject(mobject)
+                serialize_mobject(mobject, packed=request.packed)
                 for mobject in mobjects
-                if not isinstance(mobject, ValueTracker)
             ]
+        else:
+            digests = {id(mobject): get_mobject_digest(mobject) for mobject in mobjects}
+            serialized_mobjects = [
+                serialize_mobject(mobject, packed=request.packed)
+                for mobject in mobjects
+                if not delta or sent_digests.get(id(mobject)) != digests[id(mobject)]
+            ]
+            if delta:
+                mobject_ids = list(digests)
+                removed_mobject_ids = [
+                    mobject_id
+                    for mobject_id in sent_digests
+                    if mobject_id not in digests
+                ]
+            sent_digests.clear()
+            sent_digests.update(digests)
+
+        resp = frameserver_pb2.FrameResponse(
+            mobjects=serialized_mobjects,
+            frame_pending=False,
+            animation_finished=False,
+            scene_finished=scene_finished
+            or request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.IMAGE,
+            duration=requested_scene.duration,
+            animations=map(
+                lambda anim: anim.__class__.__name__, requested_scene.animations
+            ),
+            animation_index=requested_scene_index,
+            animation_offset=animation_offset,
+            mobject_ids=mobject_ids,
+            removed_mobject_ids=removed_mobject_ids,
+        )
+        return resp
+
+    def get_raster_frame_response(self, request):
+        """Renders the scene at the time of a :class:`RasterFrameRequest`.
+
+        Images are cached by the index of their keyframe until the scene is
+        reloaded.
+        """
+        frame_request = request.frame
+        pixel_width, pixel_height = get_raster_frame_size(
+            request.pixel_width, request.pixel_height
+        )
+        keyframe_index, animation_offset, scene_finished = self.find_keyframe(
+            frame_request, frame_request.time_offset
+        )
+        key = (
+            keyframe_index,
+            animation_offset,
+            pixel_width,
+            pixel_height,
+            request.format,
+            request.quality,
+        )
+        image = self.raster_cache.get(key)
+        if image is not None:
+            self.raster_cache.move_to_end(key)
+        else:
+            scene = self.seek(keyframe_index, animation_offset)
+            image = self.render_raster_frame(
+                scene, pixel_width, pixel_height, request.format, request.quality
+            )
+            self.raster_cache[key] = image
+            if len(self.raster_cache) > self.raster_cache_size:
+                self.raster_cache.popitem(last=False)
+
+        return frameserver_pb2.RasterFrameResponse(
+            image=image,
+            pixel_width=pixel_width,
+            pixel_height=pixel_height,
+            scene_finished=scene_finished
+            or frame_request.preview_mode
+            == frameserver_pb2.FrameRequest.PreviewMode.IMAGE,
+            animation_index=keyframe_index,
+            animation_offset=animation_offset,
+        )
+
+    def render_raster_frame(
+        self, scene, pixel_width, pixel_height, image_format, quality
+    ):
+        """Renders the mobjects of ``scene`` with a :class:`~.Camera`.
+
+        Returns
+        -------
+        :class:`bytes`
+            The image, compressed in ``image_format``.
+        """
+        camera = self.raster_cameras.get((pixel_width, pixel_height))
+        if camera is None:
+            camera = Camera(
+                pixel_width=pixel_width,
+                pixel_height=pixel_height,
+                frame_width=config["frame_height"] * pixel_width / pixel_height,
+            )
+            self.raster_cameras[(pixel_width, pixel_height)] = camera
+        camera.reset()
+        camera.capture_mobjects(scene.mobjects)
+        image = camera.get_image()
+
+        buffer = io.BytesIO()
+        ImageFormat = frameserver_pb2.RasterFrameRequest.ImageFormat
+        if image_format == ImageFormat.JPEG:
+            image.convert("RGB").save(buffer, "JPEG", quality=quality or 90)
+        elif image_format == ImageFormat.WEBP:
+            if quality:
+                image.save(buffer, "WEBP", quality=quality)
+            else:
+                image.save(buffer, "WEBP", lossless=True)
+        else:
+            image.save(buffer, "PNG")
+        return buffer.getvalue()
+
+    def find_keyframe(self, request, time_offset):
+        """Finds the keyframe shown at ``time_offset``.
+
+        Returns
+        -------
+        Tuple[:class:`int`, :class:`float`, :class:`bool`]
+            The index of the keyframe, the time since its start and whether
+            the time is past the end of the requested range.
+        """
+        # Determine start and end indices.
+        if (
+            request.preview_mode
+            == frameserver_pb2.FrameRequest.PreviewMode.ANIMATION_RANGE
+        ):
+            requested_scene_index = request.start_index
+        elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.ALL:
+            requested_scene_index = 0
+        elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.IMAGE:
+            requested_scene_index = request.image_index
+
+        if (
+            request.preview_mode
+            == frameserver_pb2.FrameRequest.PreviewMode.ANIMATION_RANGE
+            and request.end_index > request.start_index
+        ):
+            requested_end_index = request.end_index
+        elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.ALL:
+            requested_end_index = len(self.keyframes)
+        elif request.preview_mode == frameserver_pb2.FrameRequest.PreviewMode.IMAGE:
+            requested_end_index = len(self.keyframes)
+
+        # Find the requested scene.
+        requested_scene = self.keyframes[requested_scene_index]
+        requested_scene_end_time = requested_scene.duration
+        scene_finished = False
+        while requested_scene_end_time < time_offset:
+            if requested_scene_index + 1 < requested_end_index:
+                requested_scene_index += 1
+                requested_scene = self.keyframes[requested_scene_index]
+                requested_scene_end_time += requested_scene.duration
+            else:
+                scene_finished = True
+                break
 
-            resp = frameserver_pb2.FrameResponse(
-                mobjects=serialized_mobjects,
-                frame_pending=False,
-                animation_finished=False,
-                scene_finished=scene_finished
-                or request.preview_mode
-                == frameserver_pb2.FrameRequest.PreviewMode.IMAGE,
-                duration=requested_scene.duration,
-                animations=map(
-                    lambda anim: anim.__class__.__name__, requested_scene.animations
-                ),
-                animation_index=requested_scene_index,
-                animation_offset=animation_offset,
+        # Find the time since the start of the requested scene.
+        if not scene_finished:
+            requested_scene_start_time = (
+                requested_scene_end_time - requested_scene.duration
             )
-            return resp
-        except Exception as e:
-            traceback.print_exc()
+            animation_offset = time_offset - requested_scene_start_time
+        else:
+            animation_offset = requested_scene.duration
+        return requested_scene_index, animation_offset, scene_finished
+
+    def seek(self, keyframe_index, animation_offset):
+        """Sets the scene to a time of one of its keyframes and returns it."""
+        if keyframe_index == self.previous_scene_index:
+            scene = self.scene
+        else:
+            previous_keyframe = (
+                None
+                if self.previous_scene_index is None
+                else self.keyframes[self.previous_scene_index]
+            )
+            scene = self.keyframes[keyframe_index].restore(previous_keyframe)
+            self.previous_scene_index = keyframe_index
+        scene.update_to_time(animation_offset)
+        return scene
 
     def FetchSceneData(self, request, context):
+        with self.lock:
+            return self.get_scene_data_response()
+
+    def get_scene_data_response(self):
         try:
             request = frameserver_pb2.FetchSceneDataResponse(
                 scene=frameserver_pb2.Scene(
@@ -196,12 +415,41 @@ class FrameServer(frameserver_pb2_grpc.FrameServerServicer):
             self.exception = e
 
     def generate_keyframe_data(self):
-        self.keyframes = []
-        self.previous_scene_index = None
-        self.previous_scene = None
-        self.renderer = JsRenderer(self)
-        self.scene = self.scene_class(self.renderer)
-        self.scene.render()
+        # Play the scene aside, so that the previous version keeps being served
+        # in the meantime.
+        keyframe_holder = types.SimpleNamespace(keyframes=[])
+        renderer = JsRenderer(keyframe_holder)
+        scene = self.scene_class(renderer)
+        scene.render()
+        keyframes = keyframe_holder.keyframes
+
+        with self.lock:
+            self.keyframes = keyframes
+            # The digests of the mobjects last sent to each client, least
+            # recently seen client first.
+            self.client_digests = collections.OrderedDict()
+            self.raster_cache.clear()
+            self.previous_scene_index = None
+            self.renderer = renderer
+            self.scene = scene
+
+    def schedule_reload(self):
+        """Reloads the scene in the background once its file stops changing
+        for :attr:`reload_delay` seconds."""
+        if self.reload_timer is not None:
+            self.reload_timer.cancel()
+        self.reload_timer = threading.Timer(self.reload_delay, self.reload)
+        self.reload_timer.daemon = True
+        self.reload_timer.start()
+
+    def reload(self):
+        with self.reload_lock:
+            self.load_scene_module()
+            try:
+                self.update_renderer_scene_data()
+            except grpc._channel._InactiveRpcError:
+                logger.warning("No frontend was detected at localhost:50052.")
+                sp.Popen(config["js_renderer_path"])
 
     def update_renderer_scene_data(self):
         # If a javascript renderer is running, notify it of the scene being served. If
@@ -241,22 +489,59 @@ def animations_to_name(animations):
     return f"{str(animations[0])}..."
 
 
-def serialize_mobject(mobject):
+def get_raster_frame_size(pixel_width, pixel_height):
+    """Completes the image size of a :class:`RasterFrameRequest`, where 0
+    stands for the configured size or aspect ratio."""
+    if not pixel_width and not pixel_height:
+        return config["pixel_width"], config["pixel_height"]
+    aspect_ratio = config["pixel_width"] / config["pixel_height"]
+    if not pixel_width:
+        pixel_width = max(1, round(pixel_height * aspect_ratio))
+    elif not pixel_height:
+        pixel_height = max(1, round(pixel_width / aspect_ratio))
+    return pixel_width, pixel_height
+
+
+def get_mobject_digest(mobject):
+    """Returns a hash of everything :func:`serialize_mobject` sends about a
+    mobject, to find out which mobjects changed between two frames."""
+    if isinstance(mobject, VMobject):
+        return hash(
+            (
+                mobject.points.tobytes(),
+                mobject.get_fill_rgbas().tobytes(),
+                mobject.get_stroke_rgbas().tobytes(),
+                float(mobject.get_stroke_width()),
+            )
+        )
+    return hash(serialize_mobject(mobject).SerializeToString())
+
+
+def serialize_mobject(mobject, packed=False):
     mob_proto = frameserver_pb2.MobjectData()
+    mob_proto.id = id(mobject)
 
     if isinstance(mobject, VMobject):
+        # Hashing the bytes of the points is much faster than hashing a tuple
+        # of them, and the bytes are what is sent anyway.
+        packed_points = mobject.points.astype("<f4").tobytes()
         needs_redraw = False
-        point_hash = hash(tuple(mobject.points.flatten()))
+        point_hash = hash(packed_points)
         if mobject.point_hash != point_hash:
             mobject.point_hash = point_hash
             needs_redraw = True
         mob_proto.vectorized_mobject_data.needs_redraw = needs_redraw
 
-        for point in mobject.points:
-            point_proto = mob_proto.vectorized_mobject_data.points.add()
-            point_proto.x = point[0]
-            point_proto.y = point[1]
-            point_proto.z = point[2]
+        if packed:
+            mob_proto.vectorized_mobject_data.packed_points = packed_points
+            mob_proto.style.fill_rgbas.extend(mobject.get_fill_rgbas().ravel().tolist())
+            mob_proto.style.stroke_rgbas.extend(
+                mobject.get_stroke_rgbas().ravel().tolist()
+            )
+        else:
+            points = mob_proto.vectorized_mobject_data.points
+            for x, y, z in mobject.points.tolist():
+                points.add(x=x, y=y, z=z)
 
         mob_style = mobject.get_style(simple=True)
         mob_proto.style.fill_color = mob_style["fill_color"]
@@ -264,8 +549,6 @@ def serialize_mobject(mobject):
         mob_proto.style.stroke_color = mob_style["stroke_color"]
         mob_proto.style.stroke_opacity = float(mob_style["stroke_opacity"])
         mob_proto.style.stroke_width = float(mob_style["stroke_width"])
-
-        mob_proto.id = id(mobject)
     elif isinstance(mobject, ImageMobject):
         mob_proto.type = frameserver_pb2.MobjectData.MobjectType.IMAGE_MOBJECT
         mob_style = mobject.get_style()
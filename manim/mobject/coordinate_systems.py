@@ -94,8 +94,27 @@ class CoordinateSystem:
     def get_graph(self, function, **kwargs):
         x_min = kwargs.pop("x_min", self.x_min)
         x_max = kwargs.pop("x_max", self.x_max)
+        if kwargs.get("use_vectorized", False):
+            # coords_to_point is affine, so it maps all the values at once
+            # through the images of the origin and of the unit vectors.
+            origin = self.coords_to_point(0, 0)
+            x_unit = self.coords_to_point(1, 0) - origin
+            y_unit = self.coords_to_point(0, 1) - origin
+
+            def parametric_function(t):
+                return (
+                    origin
+                    + np.multiply.outer(t, x_unit)
+                    + np.multiply.outer(function(t), y_unit)
+                ).T
+
+        else:
+
+            def parametric_function(t):
+                return self.coords_to_point(t, function(t))
+
         graph = ParametricFunction(
-            lambda t: self.coords_to_point(t, function(t)),
+            parametric_function,
             t_min=x_min,
             t_max=x_max,
             **kwargs,
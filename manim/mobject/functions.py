@@ -14,6 +14,34 @@ import math
 class ParametricFunction(VMobject):
     """A parametric curve.
 
+    Parameters
+    ----------
+    function : Callable[[float], np.ndarray]
+        The function mapping ``t`` to a point.
+    t_min, t_max : float
+        The range of ``t``.
+    step_size : Union[float, str]
+        The step between the values of ``t`` the function is sampled at, or
+        ``"auto"`` to pick it from the magnitude of ``t``.
+    dt : float
+        The margin left around each of the ``discontinuities``.
+    discontinuities : Optional[Iterable[float]]
+        The values of ``t`` where the curve is broken.
+    use_vectorized : bool
+        Whether ``function`` takes an array of values of ``t`` and returns
+        the coordinates of the points along its first axis, e.g.
+        ``lambda t: (np.cos(t), np.sin(t), 0)``, in which case it is
+        evaluated at all the values of ``t`` at once.
+    pixel_tolerance : Optional[float]
+        If given, ``step_size`` is ignored and the curve is sampled
+        adaptively: starting from ``n_initial_samples`` evenly spaced values
+        of ``t``, the intervals whose midpoint strays more than this many
+        pixels from the chord between their ends are split in two, until
+        every interval is within the tolerance.  Curved parts get more
+        samples and straight parts fewer.
+    n_initial_samples : int
+        The number of intervals the adaptive sampling starts from.
+
     Examples
     --------
 
@@ -54,6 +82,10 @@ class ParametricFunction(VMobject):
         step_size=0.01,
         dt=1e-8,
         discontinuities=None,
+        use_vectorized=False,
+        pixel_tolerance=None,
+        n_initial_samples=32,
+        max_refinements=12,
         **kwargs
     ):
         self.function = function
@@ -62,6 +94,12 @@ class ParametricFunction(VMobject):
         self.step_size = step_size
         self.dt = dt
         self.discontinuities = [] if discontinuities is None else discontinuities
+        self.use_vectorized = use_vectorized
+        self.pixel_tolerance = pixel_tolerance
+        self.n_initial_samples = n_initial_samples
+        # Bounds the number of samples around jumps, which never get within
+        # the tolerance.
+        self.max_refinements = max_refinements
         VMobject.__init__(self, **kwargs)
 
     def get_function(self):
@@ -91,6 +129,63 @@ class ParametricFunction(VMobject):
         else:
             return self.step_size
 
+    def get_points_from_function(self, t_values):
+        """Evaluates the function at each of ``t_values``, all at once if it
+        is vectorized.
+
+        Parameters
+        ----------
+        t_values : np.ndarray
+            The values of ``t``.
+
+        Returns
+        -------
+        np.ndarray
+            The points of the curve, of shape ``(len(t_values), 3)``.
+        """
+        if self.use_vectorized:
+            # Constant coordinates, like a z of 0, are spread over all points.
+            coordinates = np.broadcast_arrays(*self.function(t_values))
+            return np.stack(coordinates, axis=1).astype(float)
+        return np.array([self.function(t) for t in t_values], dtype=float)
+
+    def sample_adaptively(self, t_min, t_max):
+        """Samples the curve between ``t_min`` and ``t_max`` finely enough for
+        it to stray less than ``pixel_tolerance`` from the polyline through
+        the samples.
+
+        Each pass evaluates the midpoints of all the intervals left to check
+        at once, and splits those whose midpoint is too far from their chord.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The sampled values of ``t``, and the points of the curve there.
+        """
+        tolerance = self.pixel_tolerance * config["frame_width"] / config["pixel_width"]
+        t_values = np.linspace(t_min, t_max, self.n_initial_samples + 1)
+        points = self.get_points_from_function(t_values)
+        to_check = np.arange(self.n_initial_samples)
+        for _ in range(self.max_refinements):
+            if len(to_check) == 0:
+                break
+            mid_t_values = (t_values[to_check] + t_values[to_check + 1]) / 2
+            mid_points = self.get_points_from_function(mid_t_values)
+            chord_midpoints = (points[to_check] + points[to_check + 1]) / 2
+            # Intervals with non-finite ends are never split.
+            with np.errstate(invalid="ignore"):
+                too_far = (
+                    np.linalg.norm(mid_points - chord_midpoints, axis=1) > tolerance
+                )
+            split = to_check[too_far]
+            t_values = np.insert(t_values, split + 1, mid_t_values[too_far])
+            points = np.insert(points, split + 1, mid_points[too_far], axis=0)
+            # Inserting before them shifts the later intervals; both halves
+            # of each split interval are checked at the next pass.
+            shifted = split + np.arange(len(split))
+            to_check = np.column_stack([shifted, shifted + 1]).ravel()
+        return t_values, points
+
     def generate_points(self):
         t_min, t_max = self.t_min, self.t_max
         dt = self.dt
@@ -105,12 +200,14 @@ class ParametricFunction(VMobject):
         ]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = list(np.arange(t1, t2, self.get_step_size(t1)))
-            if t_range[-1] != t2:
-                t_range.append(t2)
-            points = np.array([self.function(t) for t in t_range])
-            valid_indices = np.apply_along_axis(np.all, 1, np.isfinite(points))
-            points = points[valid_indices]
+            if self.pixel_tolerance is None:
+                t_range = list(np.arange(t1, t2, self.get_step_size(t1)))
+                if t_range[-1] != t2:
+                    t_range.append(t2)
+                points = self.get_points_from_function(np.array(t_range))
+            else:
+                _, points = self.sample_adaptively(t1, t2)
+            points = points[np.isfinite(points).all(axis=1)]
             if len(points) > 0:
                 self.start_new_path(points[0])
                 self.add_points_as_corners(points[1:])
@@ -123,8 +220,12 @@ class FunctionGraph(ParametricFunction):
         self.x_min = -config["frame_x_radius"]
         self.x_max = config["frame_x_radius"]
         self.parametric_function = lambda t: np.array([t, function(t), 0])
+        if kwargs.get("use_vectorized", False):
+            sampled_function = lambda t: (t, function(t), 0)
+        else:
+            sampled_function = self.parametric_function
         ParametricFunction.__init__(
-            self, self.parametric_function, t_min=self.x_min, t_max=self.x_max, **kwargs
+            self, sampled_function, t_min=self.x_min, t_max=self.x_max, **kwargs
         )
         self.function = function
 
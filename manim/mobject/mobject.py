@@ -4,12 +4,13 @@
 __all__ = ["Mobject", "Group"]
 
 
-from functools import reduce
+from functools import reduce, wraps
 import copy
 import itertools as it
 import operator as op
 import random
 import sys
+import weakref
 
 from pathlib import Path
 from colour import Color
@@ -32,6 +33,66 @@ from ..utils.space_ops import rotation_matrix
 # TODO: Explain array_attrs
 
 
+class _SubmobjectList(list):
+    """The list of submobjects of a mobject.
+
+    It also caches the family of its mobject, and remembers which mobjects
+    computed their family from it.  When it is modified, the cached family
+    is dropped, along with those of these parents, recursively, so only the
+    ancestors of a modified mobject compute their family again.
+    """
+
+    # A weak reference to the mobject owning the list.
+    owner = None
+    # The cached family of the owner, or None.
+    family = None
+    # The mobjects whose cached family includes the owner.
+    parents = None
+
+    def __copy__(self):
+        return list(self)
+
+    def __reduce_ex__(self, protocol):
+        # Copies are owned by the copy of the mobject, and start uncached.
+        return _SubmobjectList, (list(self),)
+
+    def invalidate(self):
+        # A cached family implies cached families for all its members, so
+        # the parents of a mobject without one have none either.
+        if self.family is None:
+            return
+        self.family = None
+        for parent in self.parents or ():
+            parent.submobjects.invalidate()
+
+
+def _invalidating(method):
+    @wraps(method)
+    def modify(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.invalidate()
+        return result
+
+    return modify
+
+
+for _name in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+]:
+    setattr(_SubmobjectList, _name, _invalidating(getattr(list, _name)))
+
+
 class Mobject(Container):
     """Mathematical Object: base class for objects that can be displayed on screen.
 
@@ -57,6 +118,32 @@ class Mobject(Container):
         self.init_colors()
         Container.__init__(self, **kwargs)
 
+    @property
+    def submobjects(self):
+        submobjects = self.__dict__["submobjects"]
+        owner = submobjects.owner if type(submobjects) is _SubmobjectList else None
+        if owner is None or owner() is not self:
+            # The list was copied along with the mobject, or is still shared
+            # with the mobject it was copied from.
+            submobjects = _SubmobjectList(submobjects)
+            submobjects.owner = weakref.ref(self)
+            self.__dict__["submobjects"] = submobjects
+        return submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects):
+        previous = self.__dict__.get("submobjects")
+        submobjects = _SubmobjectList(submobjects)
+        submobjects.owner = weakref.ref(self)
+        if (
+            type(previous) is _SubmobjectList
+            and previous.owner is not None
+            and previous.owner() is self
+        ):
+            submobjects.parents = previous.parents
+            previous.invalidate()
+        self.__dict__["submobjects"] = submobjects
+
     @property
     def animate(self):
         """Used to animate the application of a method.
@@ -301,7 +388,9 @@ class Mobject(Container):
         return self.updaters
 
     def get_family_updaters(self):
-        return list(it.chain(*[sm.get_updaters() for sm in self.get_family()]))
+        return list(
+            it.chain.from_iterable(sm.get_updaters() for sm in self.iter_family())
+        )
 
     def add_updater(self, update_function, index=None, call_updater=False):
         """Add an update function to this mobject.
@@ -1078,12 +1167,49 @@ class Mobject(Container):
         return result + self.submobjects
 
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        """Returns the mobject followed by all its submobjects, recursively.
+
+        Each member of the family is listed once.  The family is cached until
+        the submobjects of a mobject change, so this is cheap to call
+        repeatedly.
+
+        Returns
+        -------
+        List[:class:`Mobject`]
+            A new list holding the family.
+        """
+        return list(self._get_cached_family())
+
+    def iter_family(self):
+        """Iterates over the family of the mobject, like :meth:`get_family`,
+        without building a new list.
+
+        Yields
+        ------
+        :class:`Mobject`
+            The members of the family.
+        """
+        return iter(self._get_cached_family())
+
+    def _get_cached_family(self):
+        # The returned list is shared and must not be modified.
+        submobjects = self.submobjects
+        if submobjects.family is not None:
+            return submobjects.family
+        family = [self]
+        for submob in submobjects:
+            family.extend(submob._get_cached_family())
+            submob_list = submob.submobjects
+            if submob_list.parents is None:
+                submob_list.parents = weakref.WeakSet()
+            submob_list.parents.add(self)
+        if len(submobjects) > 1:
+            family = remove_list_redundancies(family)
+        submobjects.family = family
+        return family
 
     def family_members_with_points(self):
-        return [m for m in self.get_family() if m.get_num_points() > 0]
+        return [m for m in self.iter_family() if m.get_num_points() > 0]
 
     def arrange(
         self,
@@ -3,6 +3,8 @@
 __all__ = ["PMobject", "Mobject1D", "Mobject2D", "PGroup", "PointCloudDot", "Point"]
 
 
+from colour import Color
+
 from ...constants import *
 from ...mobject.mobject import Mobject
 from ...utils.bezier import interpolate
@@ -13,12 +13,16 @@ __all__ = [
 
 import itertools as it
 import sys
+import weakref
 import colour
 
 from ...constants import *
 from ...mobject.mobject import Mobject
 from ...mobject.three_d_utils import get_3d_vmob_gradient_start_and_end_points
 from ...utils.bezier import bezier
+from ...utils.bezier import get_bezier_arc_length_table
+from ...utils.bezier import get_bezier_curve_points
+from ...utils.bezier import get_partial_bezier_curves
 from ...utils.bezier import get_smooth_handle_points
 from ...utils.bezier import interpolate
 from ...utils.bezier import integer_interpolate
@@ -32,6 +36,12 @@ from ...utils.space_ops import rotate_vector
 from ...utils.space_ops import get_norm
 from ...utils.space_ops import shoelace_direction
 
+# Arc-length tables are cached per VMobject along with the points they were
+# computed from, so that any change to the points, even in place, invalidates
+# them.
+_arc_length_cache = weakref.WeakKeyDictionary()
+
+
 # TODO
 # - Change cubic curve groups to have 4 points instead of 3
 # - Change sub_path idea accordingly
@@ -73,6 +83,8 @@ class VMobject(Mobject):
         # varying zoom levels?
         tolerance_for_point_equality=1e-6,
         n_points_per_cubic_curve=4,
+        # Number of samples per curve in the arc-length table
+        n_arc_length_samples=4,
         **kwargs,
     ):
         self.fill_color = fill_color
@@ -94,6 +106,7 @@ class VMobject(Mobject):
         self.shade_in_3d = shade_in_3d
         self.tolerance_for_point_equality = tolerance_for_point_equality
         self.n_points_per_cubic_curve = n_points_per_cubic_curve
+        self.n_arc_length_samples = n_arc_length_samples
         Mobject.__init__(self, **kwargs)
 
     def get_group_class(self):
@@ -686,12 +699,65 @@ class VMobject(Mobject):
         nppcc = self.n_points_per_cubic_curve
         return len(self.points) // nppcc
 
+    def get_curves(self):
+        """Returns the control points of the cubic curves of the mobject, as an
+        array of shape (num_curves, 4, dim), without copying them."""
+        nppcc = self.n_points_per_cubic_curve
+        num_curves = self.get_num_curves()
+        return self.points[: nppcc * num_curves].reshape((num_curves, nppcc, self.dim))
+
     def point_from_proportion(self, alpha):
         num_cubics = self.get_num_curves()
         n, residue = integer_interpolate(0, num_cubics, alpha)
         curve = self.get_nth_curve_function(n)
         return curve(residue)
 
+    def get_arc_length_table(self):
+        """Returns the arc length of the mobject up to evenly spaced points of
+        each of its curves, as given by :func:`~.get_bezier_arc_length_table`
+        with ``n_arc_length_samples`` samples per curve.
+
+        The table is cached until the points of the mobject change.
+
+        Returns
+        -------
+        np.ndarray
+            The increasing arc lengths, the last one being the total length.
+        """
+        points = self.points
+        cached = _arc_length_cache.get(self)
+        if cached is not None and np.array_equal(cached[0], points):
+            return cached[1]
+        table = get_bezier_arc_length_table(
+            self.get_curves(), self.n_arc_length_samples
+        )
+        _arc_length_cache[self] = (points.copy(), table)
+        return table
+
+    def proportion_from_arc_length(self, alpha):
+        """Converts proportions of the arc length of the mobject into the
+        proportions taken by :meth:`point_from_proportion` and
+        :meth:`pointwise_become_partial`, which give the same share to every
+        curve however long it is.
+
+        Parameters
+        ----------
+        alpha : Union[float, np.ndarray]
+            Proportions of the arc length, between 0 and 1.
+
+        Returns
+        -------
+        Union[float, np.ndarray]
+            The corresponding proportions along the curves, found by binary
+            search in :meth:`get_arc_length_table`.
+        """
+        table = self.get_arc_length_table()
+        if table[-1] == 0:
+            return alpha
+        return np.interp(
+            np.multiply(alpha, table[-1]), table, np.linspace(0, 1, len(table))
+        )
+
     def get_anchors_and_handles(self):
         """
         returns anchors1, handles1, handles2, anchors2,
@@ -727,14 +793,36 @@ class VMobject(Mobject):
         return np.array(list(it.chain(*[sm.get_anchors() for sm in self.get_family()])))
 
     def get_arc_length(self, n_sample_points=None):
+        """Returns the length of the path through the points of the mobject.
+
+        Like the polyline through samples of :meth:`point_from_proportion`,
+        it counts the straight jumps between consecutive subpaths, unlike
+        :meth:`get_arc_length_table`.
+
+        Parameters
+        ----------
+        n_sample_points : Optional[int]
+            The number of evenly spaced samples of :meth:`point_from_proportion`
+            to measure the polyline through.  By default, the length is read
+            from :meth:`get_arc_length_table`.
+
+        Returns
+        -------
+        float
+            The length.
+        """
+        curves = self.get_curves()
+        if len(curves) == 0:
+            return 0
         if n_sample_points is None:
-            n_sample_points = 4 * self.get_num_curves() + 1
-        points = np.array(
-            [self.point_from_proportion(a) for a in np.linspace(0, 1, n_sample_points)]
-        )
-        diffs = points[1:] - points[:-1]
-        norms = np.apply_along_axis(get_norm, 1, diffs)
-        return np.sum(norms)
+            jumps = np.linalg.norm(curves[1:, 0] - curves[:-1, -1], axis=1)
+            return self.get_arc_length_table()[-1] + jumps.sum()
+        # Sample all the curves at once, at the same proportions as
+        # point_from_proportion would.
+        values = np.linspace(0, 1, n_sample_points) * len(curves)
+        indices = np.minimum(values.astype(int), len(curves) - 1)
+        points = get_bezier_curve_points(curves[indices], values - indices)
+        return np.linalg.norm(np.diff(points, axis=0), axis=1).sum()
 
     # Alignment
     def align_points(self, vmobject):
@@ -872,8 +960,8 @@ class VMobject(Mobject):
         if a <= 0 and b >= 1:
             self.set_points(vmobject.points)
             return self
-        bezier_quads = vmobject.get_cubic_bezier_tuples()
-        num_cubics = len(bezier_quads)
+        curves = vmobject.get_curves()
+        num_cubics = len(curves)
 
         lower_index, lower_residue = integer_interpolate(0, num_cubics, a)
         upper_index, upper_residue = integer_interpolate(0, num_cubics, b)
@@ -883,18 +971,17 @@ class VMobject(Mobject):
             return self
         if lower_index == upper_index:
             self.append_points(
-                partial_bezier_points(
-                    bezier_quads[lower_index], lower_residue, upper_residue
-                )
+                partial_bezier_points(curves[lower_index], lower_residue, upper_residue)
             )
         else:
-            self.append_points(
-                partial_bezier_points(bezier_quads[lower_index], lower_residue, 1)
+            start, end = get_partial_bezier_curves(
+                curves[[lower_index, upper_index]],
+                [lower_residue, 0],
+                [1, upper_residue],
             )
-            for quad in bezier_quads[lower_index + 1 : upper_index]:
-                self.append_points(quad)
+            middle = curves[lower_index + 1 : upper_index]
             self.append_points(
-                partial_bezier_points(bezier_quads[upper_index], 0, upper_residue)
+                np.concatenate([start, middle.reshape((-1, vmobject.dim)), end])
             )
         return self
 
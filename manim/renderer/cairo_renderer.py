@@ -149,8 +149,7 @@ class CairoRenderer:
         self.time += num_frames * dt
         if self.skip_animations:
             return
-        for _ in range(num_frames):
-            self.file_writer.write_frame(frame)
+        self.file_writer.write_frame(frame, num_frames)
 
     def show_frame(self):
         """
@@ -1,4 +1,4 @@
-import copy
+from .keyframe import Keyframe
 
 
 class JsRenderer:
@@ -17,13 +17,12 @@ class JsRenderer:
     def play(self, scene, *args, **kwargs):
         self.num_plays += 1
         s = scene.compile_animation_data(*args, skip_rendering=True, **kwargs)
-        scene_copy = copy.deepcopy(scene)
-        scene_copy.renderer = self
-        self.frame_server.keyframes.append(scene_copy)
+        keyframes = self.frame_server.keyframes
+        keyframe = Keyframe(scene, keyframes[-1] if keyframes else None)
+        keyframes.append(keyframe)
         if s is None:
-            scene_copy.is_static = True
+            keyframe.is_static = True
         else:
-            scene_copy.is_static = False
             scene.play_internal(skip_rendering=True)
 
     def update_frame(  # TODO Description in Docstring
@@ -0,0 +1,181 @@
+"""Compact snapshots of a scene at the start of its animations."""
+
+__all__ = ["Keyframe", "get_mobject_state", "set_mobject_state"]
+
+
+import numpy as np
+
+from ..animation.composition import AnimationGroup
+from ..utils.family import extract_mobject_family_members
+
+
+def _is_unchanged(old, new):
+    if old is new:
+        return True
+    if isinstance(new, np.ndarray):
+        return (
+            isinstance(old, np.ndarray)
+            and old.shape == new.shape
+            and old.dtype == new.dtype
+            and np.array_equal(old, new)
+        )
+    if isinstance(new, list):
+        return (
+            isinstance(old, list)
+            and len(old) == len(new)
+            and all(a is b for a, b in zip(old, new))
+        )
+    if isinstance(new, (bool, int, float, str)):
+        return type(old) is type(new) and old == new
+    return False
+
+
+def get_mobject_state(mobject, previous_state=None):
+    """Returns the state of a mobject, that is a copy of its attributes.
+
+    Arrays and lists are copied, other attributes are kept as they are.  The
+    values that didn't change since ``previous_state`` are shared with it
+    rather than copied again, and if nothing changed ``previous_state`` itself
+    is returned.
+
+    Parameters
+    ----------
+    mobject : :class:`~.Mobject`
+        The mobject.
+    previous_state : Optional[:class:`dict`]
+        An earlier state of the same mobject.
+
+    Returns
+    -------
+    :class:`dict`
+        The state, which must not be modified.
+    """
+    if previous_state is None:
+        previous_state = {}
+    state = {}
+    for key, value in mobject.__dict__.items():
+        old_value = previous_state.get(key)
+        if _is_unchanged(old_value, value):
+            value = old_value
+        elif isinstance(value, np.ndarray):
+            value = value.copy()
+        elif isinstance(value, list):
+            value = list(value)
+        state[key] = value
+    if len(state) == len(previous_state) and all(
+        previous_state.get(key) is value for key, value in state.items()
+    ):
+        return previous_state
+    return state
+
+
+def set_mobject_state(mobject, state):
+    """Sets a mobject back to a state returned by :func:`get_mobject_state`.
+
+    The state is copied, so that changing the mobject afterwards leaves it
+    intact.
+    """
+    attributes = mobject.__dict__
+    submobjects = attributes.get("submobjects")
+    attributes.clear()
+    for key, value in state.items():
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+        elif isinstance(value, list):
+            value = list(value)
+        attributes[key] = value
+    if "submobjects" in state:
+        # Replace the current submobjects through the property, so that the
+        # cached families of the mobject and its ancestors are invalidated.
+        new_submobjects = attributes["submobjects"]
+        if submobjects is None:
+            del attributes["submobjects"]
+        else:
+            attributes["submobjects"] = submobjects
+        mobject.submobjects = new_submobjects
+
+
+class Keyframe:
+    """The state of a scene when one of its animations begins.
+
+    Instead of a copy of the whole scene, a keyframe holds the state of each
+    mobject of the scene (see :func:`get_mobject_state`), and the animations
+    played from there.  The states that didn't change since the previous
+    keyframe are shared with it, so that a scene where a few mobjects move at
+    a time doesn't hold a full copy of itself per animation.
+
+    Parameters
+    ----------
+    scene : :class:`~.Scene`
+        The scene, with the animations of the keyframe begun.
+    previous_keyframe : Optional[:class:`Keyframe`]
+        The keyframe of the previous animation of the scene.
+    """
+
+    def __init__(self, scene, previous_keyframe=None):
+        self.scene = scene
+        self.mobjects = list(scene.mobjects)
+        self.foreground_mobjects = list(scene.foreground_mobjects)
+        self.animations = list(scene.animations or [])
+        self.duration = scene.duration
+        self.is_static = False
+        previous_states = (
+            {} if previous_keyframe is None else previous_keyframe.mobject_states
+        )
+        self.mobject_states = {
+            mobject: get_mobject_state(mobject, previous_states.get(mobject))
+            for mobject in extract_mobject_family_members(self.mobjects)
+        }
+
+    def get_touched_mobjects(self):
+        """Returns the mobjects that playing the keyframe may change: those of
+        its animations and those with updaters, with their families."""
+        mobjects = [
+            animation.mobject
+            for animation in self.animations
+            if animation.mobject is not None
+        ]
+        mobjects += [mobject for mobject in self.mobject_states if mobject.updaters]
+        return extract_mobject_family_members(mobjects)
+
+    def restore(self, current_keyframe=None):
+        """Sets the scene back to the state of the keyframe.
+
+        Parameters
+        ----------
+        current_keyframe : Optional[:class:`Keyframe`]
+            The keyframe the scene was last restored to, and possibly played
+            from.  Only the mobjects whose state differs from it, or that it may
+            have changed, are restored.  Every mobject is if it is ``None``.
+
+        Returns
+        -------
+        :class:`~.Scene`
+            The scene, ready for :meth:`~.Scene.update_to_time`.
+        """
+        if current_keyframe is None:
+            to_restore = self.mobject_states
+        else:
+            current_states = current_keyframe.mobject_states
+            to_restore = set(current_keyframe.get_touched_mobjects())
+            to_restore.update(
+                mobject
+                for mobject, state in self.mobject_states.items()
+                if current_states.get(mobject) is not state
+            )
+        for mobject in to_restore:
+            if mobject in self.mobject_states:
+                set_mobject_state(mobject, self.mobject_states[mobject])
+
+        scene = self.scene
+        scene.mobjects = list(self.mobjects)
+        scene.foreground_mobjects = list(self.foreground_mobjects)
+        scene.animations = list(self.animations)
+        scene.duration = self.duration
+        scene.last_t = 0
+        # The mobjects of the animation groups may have been set back to
+        # their start, behind the groups' backs.
+        for animation in self.animations:
+            if isinstance(animation, AnimationGroup):
+                animation.reset_timeline()
+        return scene
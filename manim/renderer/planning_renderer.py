@@ -0,0 +1,191 @@
+"""A renderer finding out which animations of a scene need rendering."""
+
+__all__ = ["PlannedAnimation", "PlanningRenderer"]
+
+
+import typing
+
+from .. import config, logger
+from ..scene.scene_file_writer import SceneFileWriter
+from ..utils.exceptions import EndSceneEarlyException
+from ..utils.hashing import get_hash_from_play_call
+
+
+class PlannedAnimation(typing.NamedTuple):
+    """A play call of a scene, as planned by :class:`PlanningRenderer`.
+
+    ``status`` is ``"cached"`` if its partial movie file is cached,
+    ``"render"`` if it has to be rendered and ``"skipped"`` if it is left out
+    of the render by ``from_animation_number``.
+    """
+
+    index: int
+    hash: typing.Optional[str]
+    description: str
+    run_time: float
+    status: str
+
+
+class PlanningRenderer:
+    """A renderer playing a scene without rendering it, to find out which of
+    its animations are already cached.
+
+    As with :class:`~.JsRenderer`, ``construct()`` runs with rendering
+    skipped: every animation jumps to its end and nothing is drawn or
+    written.  The hash of each play call is computed along the way, exactly
+    as :func:`~.handle_caching_play` does during a render, and all of them are
+    looked up in the cache at once by :meth:`get_plan`.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        renderer = PlanningRenderer()
+        MyScene(renderer=renderer).render()
+        to_render = [
+            animation.index
+            for animation in renderer.get_plan()
+            if animation.status == "render"
+        ]
+    """
+
+    def __init__(self):
+        self.skip_animations = True
+        self.camera = None
+        self.file_writer = None
+        self.animations_hashes = []
+        self.planned_animations = []
+        self.num_plays = 0
+        self.time = 0
+        self.static_image = None
+        self.cached_hashes = None
+
+    def init_scene(self, scene):
+        # The camera is part of the hashes, so it must be the one the scene
+        # is rendered with.
+        self.camera = scene.camera_class()
+        self.file_writer = SceneFileWriter(self, scene.__class__.__name__)
+
+    def play(self, scene, *args, **kwargs):
+        upto_animation_number = config["upto_animation_number"]
+        if upto_animation_number and self.num_plays > upto_animation_number:
+            raise EndSceneEarlyException()
+        animations = scene.compile_animations(*args, **kwargs)
+        scene.add_mobjects_from_animations(animations)
+        if self.num_plays < config["from_animation_number"]:
+            hash_play = None
+        elif config["disable_caching"]:
+            hash_play = f"uncached_{self.num_plays:05}"
+        else:
+            hash_play = get_hash_from_play_call(
+                self, self.camera, animations, scene.mobjects
+            )
+        self.animations_hashes.append(hash_play)
+        description = str(animations[0]) + (", etc." if len(animations) > 1 else "")
+        run_time = scene.get_run_time(animations)
+        self.planned_animations.append((self.num_plays, description, run_time))
+
+        if scene.compile_animation_data(*args, skip_rendering=True, **kwargs):
+            scene.play_internal(skip_rendering=True)
+        self.time += run_time
+        self.num_plays += 1
+
+    def get_plan(self):
+        """Returns which of the animations played so far are cached.
+
+        The cache is looked up without marking anything as used, on the first
+        call only, after which the file writer is closed.
+
+        Returns
+        -------
+        List[:class:`PlannedAnimation`]
+            The planned animations, in the order they were played.
+        """
+        if self.cached_hashes is None:
+            try:
+                if config["disable_caching"]:
+                    self.cached_hashes = set()
+                else:
+                    self.cached_hashes = self.file_writer.get_cached_hashes(
+                        [h for h in self.animations_hashes if h is not None],
+                        download=False,
+                    )
+            finally:
+                self.file_writer.close()
+        cached = self.cached_hashes
+        plan = []
+        for hash_play, (index, description, run_time) in zip(
+            self.animations_hashes, self.planned_animations
+        ):
+            if hash_play is None:
+                status = "skipped"
+            elif hash_play in cached:
+                status = "cached"
+            else:
+                status = "render"
+            plan.append(
+                PlannedAnimation(index, hash_play, description, run_time, status)
+            )
+        return plan
+
+    def get_ranges_to_render(self, plan):
+        """Groups the animations of a plan that need rendering into ranges of
+        consecutive animations.
+
+        Each range can be rendered on its own with ``-n first,last``, e.g. by
+        a separate render node.  Dispatching the ranges is left to the caller.
+
+        Parameters
+        ----------
+        plan : List[:class:`PlannedAnimation`]
+            A plan returned by :meth:`get_plan`.
+
+        Returns
+        -------
+        List[Tuple[:class:`int`, :class:`int`]]
+            The indices of the first and last animations of each range.
+        """
+        ranges = []
+        for animation in plan:
+            if animation.status != "render":
+                continue
+            if ranges and ranges[-1][1] == animation.index - 1:
+                ranges[-1] = (ranges[-1][0], animation.index)
+            else:
+                ranges.append((animation.index, animation.index))
+        return ranges
+
+    def log_plan(self, plan):
+        """Logs a plan returned by :meth:`get_plan`, with the total run time
+        of the animations that need rendering and the ranges to render them
+        in (see :meth:`get_ranges_to_render`)."""
+        for animation in plan:
+            logger.info(
+                f"Animation {animation.index} : {animation.status} "
+                f"({animation.description}, {animation.run_time:g}s)"
+            )
+        to_render = [animation for animation in plan if animation.status == "render"]
+        logger.info(
+            f"{len(to_render)} of {len(plan)} animation(s) need rendering, "
+            f"{sum(animation.run_time for animation in to_render):g}s in total."
+        )
+        for first, last in self.get_ranges_to_render(plan):
+            logger.info(f"Render with -n {first},{last}")
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def render(self, scene, moving_mobjects):
+        pass
+
+    def add_frame(self, frame, num_frames=1):
+        pass
+
+    def get_frame(self):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        pass
+
+    def scene_finished(self, scene):
+        pass
@@ -365,12 +365,29 @@ class GraphScene(Scene):
         if x_max is None:
             x_max = self.x_max
 
-        def parameterized_function(alpha):
-            x = interpolate(x_min, x_max, alpha)
-            y = func(x)
-            if not np.isfinite(y):
-                y = self.y_max
-            return self.coords_to_point(x, y)
+        if kwargs.get("use_vectorized", False):
+            # coords_to_point is affine, so it maps all the values at once
+            # through the images of the origin and of the unit vectors.
+            origin = self.coords_to_point(0, 0)
+            x_unit = self.coords_to_point(1, 0) - origin
+            y_unit = self.coords_to_point(0, 1) - origin
+
+            def parameterized_function(alpha):
+                x = interpolate(x_min, x_max, alpha)
+                y = func(x)
+                y = np.where(np.isfinite(y), y, self.y_max)
+                return (
+                    origin + np.multiply.outer(x, x_unit) + np.multiply.outer(y, y_unit)
+                ).T
+
+        else:
+
+            def parameterized_function(alpha):
+                x = interpolate(x_min, x_max, alpha)
+                y = func(x)
+                if not np.isfinite(y):
+                    y = self.y_max
+                return self.coords_to_point(x, y)
 
         graph = ParametricFunction(parameterized_function, color=color, **kwargs)
         graph.underlying_function = func
@@ -0,0 +1,89 @@
+"""Writing frames as numbered image files off the render thread."""
+
+__all__ = ["ImageSequenceWriter"]
+
+
+import collections
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+
+class ImageSequenceWriter:
+    """Saves frames as a sequence of PNG or WebP files using a pool of
+    threads, so that compressing them doesn't hold up rendering.
+
+    Frames are saved as ``<prefix><number>.<image_format>``, numbered in the
+    order they are written.  At most ``max_pending_frames`` frames are held
+    in memory; writing more waits for the oldest ones to be saved.
+
+    Parameters
+    ----------
+    prefix : :class:`str`
+        The path of the files, without the frame number and extension.
+    image_format : :class:`str`, optional
+        Either ``"png"`` or ``"webp"``.
+    compression_level : :class:`int`, optional
+        From 0 (fastest) to 9 (smallest files).  WebP files are lossless.
+    max_workers : :class:`int`, optional
+        The number of threads saving frames.
+    max_pending_frames : :class:`int`, optional
+        The number of frames that may be waiting to be saved.
+    """
+
+    def __init__(
+        self,
+        prefix,
+        image_format="png",
+        compression_level=6,
+        max_workers=4,
+        max_pending_frames=16,
+    ):
+        self.prefix = prefix
+        self.extension = f".{image_format}"
+        if image_format == "webp":
+            # WebP's method goes from 0 (fast) to 6 (slowest, smallest).
+            self.save_options = {
+                "lossless": True,
+                "method": round(compression_level * 6 / 9),
+            }
+        else:
+            self.save_options = {"compress_level": compression_level}
+        self.max_pending_frames = max_pending_frames
+        self.pool = ThreadPoolExecutor(max_workers)
+        self.pending = collections.deque()
+        self.frame_count = 0
+
+    def get_path(self, frame_number):
+        return f"{self.prefix}{frame_number}{self.extension}"
+
+    def write_frame(self, frame, num_frames=1):
+        """Queues a frame to be saved ``num_frames`` times.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.  It must not be modified afterwards.
+        num_frames : :class:`int`, optional
+            The number of consecutive files showing the frame.
+        """
+        if num_frames < 1:
+            return
+        paths = [self.get_path(self.frame_count + i) for i in range(num_frames)]
+        self.frame_count += num_frames
+        while len(self.pending) >= self.max_pending_frames:
+            self.pending.popleft().result()
+        self.pending.append(self.pool.submit(self._save, frame, paths))
+
+    def _save(self, frame, paths):
+        Image.fromarray(frame).save(paths[0], **self.save_options)
+        # Repeated frames are copied rather than compressed again.
+        for path in paths[1:]:
+            shutil.copyfile(paths[0], path)
+
+    def finish(self):
+        """Waits until all the frames are saved."""
+        while self.pending:
+            self.pending.popleft().result()
+        self.pool.shutdown()
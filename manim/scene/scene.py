@@ -4,6 +4,7 @@
 __all__ = ["Scene"]
 
 
+import collections
 import inspect
 import random
 import warnings
@@ -276,13 +277,10 @@ class Scene(Container):
         """
         # Return only those which are not in the family
         # of another mobject from the scene
-        families = [m.get_family() for m in self.mobjects]
-
-        def is_top_level(mobject):
-            num_families = sum([(mobject in family) for family in families])
-            return num_families == 1
-
-        return list(filter(is_top_level, self.mobjects))
+        num_families = collections.Counter(
+            m for mobject in self.mobjects for m in mobject.iter_family()
+        )
+        return [m for m in self.mobjects if num_families[m] == 1]
 
     def get_mobject_family_members(self):
         """
@@ -575,12 +573,11 @@ class Scene(Container):
         animation_mobjects = [anim.mobject for anim in animations]
         mobjects = self.get_mobject_family_members()
         for i, mob in enumerate(mobjects):
-            update_possibilities = [
-                mob in animation_mobjects,
-                len(mob.get_family_updaters()) > 0,
-                mob in self.foreground_mobjects,
-            ]
-            if any(update_possibilities):
+            if (
+                mob in animation_mobjects
+                or any(sm.get_updaters() for sm in mob.iter_family())
+                or mob in self.foreground_mobjects
+            ):
                 return mobjects[i:]
         return []
 
@@ -4,21 +4,23 @@ __all__ = ["SceneFileWriter"]
 
 
 import numpy as np
-from pydub import AudioSegment
-import shutil
 import subprocess
 import os
+import tempfile
 from time import sleep
 import datetime
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .. import config, logger
 from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
+from ..utils.cache_stores import get_cache_store
+from ..utils.caching import PartialMovieCache
 from ..utils.file_ops import guarantee_existence
 from ..utils.file_ops import add_extension_if_not_present
-from ..utils.file_ops import modify_atime
-from ..utils.sounds import get_full_sound_file_path
+from ..utils.images import rgba_to_yuv420p
+from ..utils.sounds import AudioTimeline, get_full_sound_file_path
+from .image_sequence_writer import ImageSequenceWriter
 
 
 class SceneFileWriter(object):
@@ -46,8 +48,16 @@ class SceneFileWriter(object):
         self.stream_lock = False
         self.init_output_directories(scene_name)
         self.init_audio()
-        self.frame_count = 0
         self.partial_movie_files = []
+        self.writing_process = None
+        self.pipe_yuv420p = False
+        # Transfers from and to the cache store, see get_cached_hashes.
+        self.pending_downloads = {}
+        self.pending_uploads = []
+        self.store_hits = 0
+        # Whether the cache store holds a file, by file name, so that each
+        # file is looked for in the store at most once per render.
+        self.store_lookups = {}
 
     def init_output_directories(self, scene_name):
         """Initialise output directories.
@@ -80,6 +90,12 @@ class SceneFileWriter(object):
             self.image_file_path = os.path.join(
                 image_dir, add_extension_if_not_present(default_name, ".png")
             )
+            if config["save_pngs"]:
+                self.image_sequence_writer = ImageSequenceWriter(
+                    os.path.splitext(self.image_file_path)[0],
+                    image_format=config["image_sequence_format"],
+                    compression_level=config["image_compression_level"],
+                )
 
         if config["write_to_movie"]:
             movie_dir = guarantee_existence(
@@ -105,6 +121,12 @@ class SceneFileWriter(object):
                     module_name=module_name,
                 )
             )
+            self.partial_movie_cache = PartialMovieCache(
+                self.partial_movie_directory, config["movie_file_extension"]
+            )
+            self.cache_store = get_cache_store(config["cache_store"])
+            if self.cache_store is not None:
+                self.cache_transfers = ThreadPoolExecutor(4)
 
     def add_partial_movie_file(self, hash_animation):
         """Adds a new partial movie file path to scene.partial_movie_files from an hash. This method will compute the path from the hash.
@@ -122,11 +144,8 @@ class SceneFileWriter(object):
         if hash_animation is None:
             self.partial_movie_files.append(None)
             return
-        new_partial_movie_file = os.path.join(
-            self.partial_movie_directory,
-            f"{hash_animation}{config['movie_file_extension']}",
-        )
-        self.partial_movie_files.append(new_partial_movie_file)
+        new_partial_movie_file = self.partial_movie_cache.get_path(hash_animation)
+        self.partial_movie_files.append(str(new_partial_movie_file))
 
     def get_resolution_directory(self):
         """Get the name of the resolution directory directly containing
@@ -163,12 +182,7 @@ class SceneFileWriter(object):
         Preps the writer for adding audio to the movie.
         """
         self.includes_sound = False
-
-    def create_audio_segment(self):
-        """
-        Creates an empty, silent, Audio Segment.
-        """
-        self.audio_segment = AudioSegment.silent()
+        self.audio_timeline = AudioTimeline()
 
     def add_audio_segment(self, new_segment, time=None, gain_to_background=None):
         """
@@ -187,33 +201,18 @@ class SceneFileWriter(object):
         gain_to_background : optional
             The gain of the segment from the background.
         """
-        if not self.includes_sound:
-            self.includes_sound = True
-            self.create_audio_segment()
-        segment = self.audio_segment
-        curr_end = segment.duration_seconds
-        if time is None:
-            time = curr_end
-        if time < 0:
-            raise ValueError("Adding sound at timestamp < 0")
-
-        new_end = time + new_segment.duration_seconds
-        diff = new_end - curr_end
-        if diff > 0:
-            segment = segment.append(
-                AudioSegment.silent(int(np.ceil(diff * 1000))),
-                crossfade=0,
-            )
-        self.audio_segment = segment.overlay(
-            new_segment,
-            position=int(1000 * time),
-            gain_during_overlay=gain_to_background,
+        self.includes_sound = True
+        self.audio_timeline.add_segment(
+            new_segment, time, gain_to_background=gain_to_background
         )
 
     def add_sound(self, sound_file, time=None, gain=None, **kwargs):
         """
         This method adds an audio segment from a sound file.
 
+        Sound files are only decoded the first time they are added, and all
+        the sounds are mixed when the movie is combined.
+
         Parameters
         ----------
         sound_file : str
@@ -231,10 +230,8 @@ class SceneFileWriter(object):
 
         """
         file_path = get_full_sound_file_path(sound_file)
-        new_segment = AudioSegment.from_file(file_path)
-        if gain:
-            new_segment = new_segment.apply_gain(gain)
-        self.add_audio_segment(new_segment, time, **kwargs)
+        self.includes_sound = True
+        self.audio_timeline.add_sound(file_path, time, gain, **kwargs)
 
     # Writers
     def begin_animation(self, allow_write=False):
@@ -242,13 +239,15 @@ class SceneFileWriter(object):
         Used internally by manim to stream the animation to FFMPEG for
         displaying or writing to a file.
 
+        The FFMPEG process itself is only started once the first frames
+        of the animation are written, see :meth:`write_frame`.
+
         Parameters
         ----------
         allow_write : bool, optional
             Whether or not to write to a video file.
         """
-        if config["write_to_movie"] and allow_write:
-            self.open_movie_pipe()
+        self.writing_process = None
 
     def end_animation(self, allow_write=False):
         """
@@ -261,24 +260,43 @@ class SceneFileWriter(object):
             Whether or not to write to a video file.
         """
         if config["write_to_movie"] and allow_write:
+            if self.writing_process is None:
+                # Still produce a partial movie file for animations without
+                # any frame.
+                self.open_movie_pipe()
             self.close_movie_pipe()
 
-    def write_frame(self, frame):
+    def write_frame(self, frame, num_frames=1):
         """
         Used internally by Manim to write a frame to
         the FFMPEG input buffer.
 
+        When a still frame makes up a whole animation (as for a static
+        ``wait()``), it is piped only once and FFMPEG is told to repeat
+        it, rather than piping ``num_frames`` identical copies.
+
         Parameters
         ----------
         frame : np.array
             Pixel array of the frame.
+        num_frames : int, optional
+            The number of times the frame is shown.
         """
+        if num_frames < 1:
+            return
         if config["write_to_movie"]:
-            self.writing_process.stdin.write(frame.tostring())
+            num_piped_frames = num_frames
+            if self.writing_process is None:
+                self.open_movie_pipe(num_repeated_frames=num_frames)
+                num_piped_frames = 1
+            if self.pipe_yuv420p:
+                data = rgba_to_yuv420p(frame).tobytes()
+            else:
+                data = frame.tobytes()
+            for _ in range(num_piped_frames):
+                self.writing_process.stdin.write(data)
         if config["save_pngs"]:
-            path, extension = os.path.splitext(self.image_file_path)
-            Image.fromarray(frame).save(f"{path}{self.frame_count}{extension}")
-            self.frame_count += 1
+            self.image_sequence_writer.write_frame(frame, num_frames)
 
     def save_final_image(self, image):
         """
@@ -321,27 +339,53 @@ class SceneFileWriter(object):
         If save_last_frame is True, saves the last
         frame in the default image directory.
         """
+        if config["save_pngs"]:
+            self.image_sequence_writer.finish()
         if config["write_to_movie"]:
-            if hasattr(self, "writing_process"):
+            if getattr(self, "writing_process", None) is not None:
                 self.writing_process.terminate()
-            self.combine_movie_files()
-            if config["flush_cache"]:
-                self.flush_cache_directory()
-            else:
-                self.clean_cache()
-
-    def open_movie_pipe(self):
+            try:
+                self.close_cache_store()
+                self.combine_movie_files()
+                if config["flush_cache"]:
+                    self.flush_cache_directory()
+                else:
+                    self.clean_cache()
+                self.print_cache_statistics()
+            finally:
+                self.partial_movie_cache.close()
+
+    def open_movie_pipe(self, num_repeated_frames=None):
         """
         Used internally by Manim to initialise
         FFMPEG and begin writing to FFMPEG's input
         buffer.
+
+        Parameters
+        ----------
+        num_repeated_frames : int, optional
+            If given, the movie consists of the first frame written to the
+            pipe, shown this many times.
         """
         file_path = self.partial_movie_files[self.renderer.num_plays]
         self.partial_movie_file_path = file_path
+        # The movie is written under a temporary name and moved in place once
+        # complete, so that renders sharing the cache never pick up a partly
+        # written file.
+        base, extension = os.path.splitext(file_path)
+        self.partial_movie_temp_file_path = f"{base}_{os.getpid()}_temp{extension}"
 
         fps = config["frame_rate"]
         height = config["pixel_height"]
         width = config["pixel_width"]
+        # Frames can only be split in 2x2 blocks for YUV 4:2:0 if their
+        # dimensions are even, which libx264 requires anyway.
+        self.pipe_yuv420p = (
+            config["yuv_conversion"]
+            and not config["transparent"]
+            and width % 2 == 0
+            and height % 2 == 0
+        )
 
         command = [
             FFMPEG_BIN,
@@ -351,7 +395,7 @@ class SceneFileWriter(object):
             "-s",
             "%dx%d" % (width, height),  # size of one frame
             "-pix_fmt",
-            "rgba",
+            "yuv420p" if self.pipe_yuv420p else "rgba",
             "-r",
             str(fps),  # frames per second
             "-i",
@@ -360,11 +404,28 @@ class SceneFileWriter(object):
             "-loglevel",
             config["ffmpeg_loglevel"].lower(),
         ]
+        if num_repeated_frames is not None and num_repeated_frames > 1:
+            # Looping the single input frame keeps the timestamps of a
+            # movie of num_repeated_frames frames at the given frame rate.
+            command += ["-vf", f"loop=loop={num_repeated_frames - 1}:size=1:start=0"]
         if config["transparent"]:
             command += ["-vcodec", "qtrle"]
         else:
-            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
-        command += [file_path]
+            command += [
+                "-vcodec",
+                config["video_codec"],
+                "-pix_fmt",
+                "yuv420p",
+                "-preset",
+                config["encoder_preset"],
+                "-crf",
+                str(config["encoder_crf"]),
+            ]
+            if config["encoder_tune"]:
+                command += ["-tune", config["encoder_tune"]]
+        if config["encoder_threads"]:
+            command += ["-threads", str(config["encoder_threads"])]
+        command += [self.partial_movie_temp_file_path]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
 
     def close_movie_pipe(self):
@@ -373,6 +434,23 @@ class SceneFileWriter(object):
         """
         self.writing_process.stdin.close()
         self.writing_process.wait()
+        if os.path.exists(self.partial_movie_temp_file_path):
+            os.replace(self.partial_movie_temp_file_path, self.partial_movie_file_path)
+            if not config["disable_caching"]:
+                hash_animation = self.renderer.animations_hashes[
+                    self.renderer.num_plays
+                ]
+                self.partial_movie_cache.add(hash_animation)
+                if self.cache_store is not None:
+                    name = f"{hash_animation}{config['movie_file_extension']}"
+                    self.pending_uploads.append(
+                        self.cache_transfers.submit(
+                            self.cache_store.upload,
+                            name,
+                            self.partial_movie_file_path,
+                        )
+                    )
+                    self.store_lookups[name] = True
 
         logger.info(
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
@@ -380,7 +458,8 @@ class SceneFileWriter(object):
         )
 
     def is_already_cached(self, hash_invocation):
-        """Will check if a file named with `hash_invocation` exists.
+        """Will check if the partial movie file named with `hash_invocation`
+        is in the cache.
 
         Parameters
         ----------
@@ -390,15 +469,121 @@ class SceneFileWriter(object):
         Returns
         -------
         :class:`bool`
-            Whether the file exists.
+            Whether the file is cached.
+        """
+        return hash_invocation in self.get_cached_hashes([hash_invocation])
+
+    def get_cached_hashes(self, hashes, download=True):
+        """Checks which of several partial movie files are cached.
+
+        The files missing from the partial movie directory are looked for in
+        the cache store (see ``config["cache_store"]``) all at once.  Those
+        found there are downloaded in the background, while the following
+        animations render; :meth:`wait_for_cache_transfers` waits for them.
+        The answers of the store are remembered until the end of the render,
+        so a file is looked for in the store at most once.
+
+        Parameters
+        ----------
+        hashes : List[:class:`str`]
+            The hashes corresponding to invocations to either `scene.play` or `scene.wait`.
+        download : :class:`bool`, optional
+            Whether to download the files found in the cache store and to
+            mark the cached files as used.  Without it, nothing is changed,
+            as when planning a render.
+
+        Returns
+        -------
+        Set[:class:`str`]
+            The hashes whose files are cached.
         """
         if not hasattr(self, "partial_movie_directory"):
-            return False
-        path = os.path.join(
-            self.partial_movie_directory,
-            f"{hash_invocation}{config['movie_file_extension']}",
-        )
-        return os.path.exists(path)
+            return set()
+        cached = {h for h in hashes if h in self.pending_downloads}
+        missing = []
+        for hash_invocation in hashes:
+            if hash_invocation in cached:
+                continue
+            if self.partial_movie_cache.contains(hash_invocation, touch=download):
+                cached.add(hash_invocation)
+            else:
+                missing.append(hash_invocation)
+        if self.cache_store is None or not missing:
+            return cached
+        extension = config["movie_file_extension"]
+        names = [f"{h}{extension}" for h in missing]
+        unknown = [name for name in names if name not in self.store_lookups]
+        if unknown:
+            in_store = self.cache_store.contains_many(unknown)
+            for name in unknown:
+                self.store_lookups[name] = name in in_store
+        for hash_invocation, name in zip(missing, names):
+            if not self.store_lookups[name]:
+                continue
+            cached.add(hash_invocation)
+            if download:
+                self.pending_downloads[hash_invocation] = self.cache_transfers.submit(
+                    self.download_partial_movie_file, hash_invocation
+                )
+                self.store_hits += 1
+        return cached
+
+    def download_partial_movie_file(self, hash_invocation):
+        """Copies a partial movie file from the cache store to the partial
+        movie directory.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash of the animation.
+        """
+        path = str(self.partial_movie_cache.get_path(hash_invocation))
+        base, extension = os.path.splitext(path)
+        temp_path = f"{base}_{os.getpid()}_download{extension}"
+        self.cache_store.download(f"{hash_invocation}{extension}", temp_path)
+        os.replace(temp_path, path)
+
+    def wait_for_cache_transfers(self):
+        """Waits until the downloads from and the uploads to the cache store
+        are done."""
+        for hash_invocation, download in self.pending_downloads.items():
+            try:
+                download.result()
+            except Exception as error:
+                raise RuntimeError(
+                    f"Could not download the partial movie file {hash_invocation} "
+                    f"from the cache store. Render again with --disable_caching."
+                ) from error
+            self.partial_movie_cache.add(hash_invocation)
+        self.pending_downloads = {}
+        for upload in self.pending_uploads:
+            try:
+                upload.result()
+            except Exception as error:
+                logger.warning(
+                    f"Could not upload a partial movie file to the cache store: {error}"
+                )
+        self.pending_uploads = []
+
+    def close_cache_store(self):
+        """Waits for the transfers from and to the cache store, and stops the
+        threads running them."""
+        if getattr(self, "cache_store", None) is None:
+            return
+        try:
+            self.wait_for_cache_transfers()
+        finally:
+            self.cache_transfers.shutdown()
+
+    def close(self):
+        """Stops the transfers from and to the cache store and closes the
+        index of the partial movie cache, for file writers that don't
+        :meth:`finish` a movie."""
+        try:
+            self.close_cache_store()
+        finally:
+            if hasattr(self, "partial_movie_cache"):
+                self.partial_movie_cache.close()
 
     def combine_movie_files(self):
         """
@@ -418,16 +603,18 @@ class SceneFileWriter(object):
         # tests) use scene initialization, and this error would be raised as
         # it's just an empty scene initialized.
 
-        # Write a file partial_file_list.txt containing all partial movie
-        # files. This is used by FFMPEG.
-        file_list = os.path.join(
-            self.partial_movie_directory, "partial_movie_file_list.txt"
+        # Write a file listing all partial movie files. This is used by
+        # FFMPEG.  Its name is unique, as the directory may be shared.
+        file_descriptor, file_list = tempfile.mkstemp(
+            prefix="partial_movie_file_list_",
+            suffix=".txt",
+            dir=self.partial_movie_directory,
         )
         logger.debug(
             f"Partial movie files to combine ({len(partial_movie_files)} files): %(p)s",
             {"p": partial_movie_files[:5]},
         )
-        with open(file_list, "w") as fp:
+        with os.fdopen(file_descriptor, "w") as fp:
             fp.write("# This file is used internally by FFMPEG.\n")
             for pf_path in partial_movie_files:
                 if os.name == "nt":
@@ -447,102 +634,106 @@ class SceneFileWriter(object):
             config["ffmpeg_loglevel"].lower(),
         ]
 
-        if config["write_to_movie"] and not config["save_as_gif"]:
-            commands += ["-c", "copy", movie_file_path]
-
-        if config["save_as_gif"]:
-            commands += [self.gif_file_path]
-
-        if not self.includes_sound:
-            commands.insert(-1, "-an")
-
-        combine_process = subprocess.Popen(commands)
-        combine_process.wait()
-
-        if self.includes_sound:
+        add_sound = self.includes_sound and not config["save_as_gif"]
+        if add_sound:
+            # The soundtrack is mixed into a WAV file, which is muxed while
+            # the partial movie files are concatenated.
             sound_file_path = movie_file_path.replace(
                 config["movie_file_extension"], ".wav"
             )
-            # Makes sure sound file length will match video file
-            self.add_audio_segment(AudioSegment.silent(0))
-            self.audio_segment.export(
-                sound_file_path,
-                bitrate="312k",
-            )
-            temp_file_path = movie_file_path.replace(".", "_temp.")
-            commands = [
-                FFMPEG_BIN,
-                "-i",
-                movie_file_path,
+            self.audio_timeline.write_wav(sound_file_path)
+            commands += [
                 "-i",
                 sound_file_path,
-                "-y",  # overwrite output file if it exists
-                "-c:v",
-                "copy",
-                "-c:a",
-                "aac",
-                "-b:a",
-                "320k",
                 # select video stream from first file
                 "-map",
                 "0:v:0",
                 # select audio stream from second file
                 "-map",
                 "1:a:0",
-                "-loglevel",
-                config["ffmpeg_loglevel"].lower(),
-                # "-shortest",
-                temp_file_path,
+                "-c:a",
+                "aac",
+                "-b:a",
+                "320k",
             ]
-            subprocess.call(commands)
-            shutil.move(temp_file_path, movie_file_path)
+
+        if config["write_to_movie"] and not config["save_as_gif"]:
+            commands += ["-c:v", "copy", movie_file_path]
+
+        if config["save_as_gif"]:
+            # Build a palette from all the frames rather than use ffmpeg's
+            # default GIF palette.  It is built in a pass of its own: doing it
+            # in the pass using it would keep every decoded frame in memory
+            # until the palette is done.
+            file_descriptor, palette_path = tempfile.mkstemp(
+                prefix="gif_palette_", suffix=".png", dir=self.partial_movie_directory
+            )
+            os.close(file_descriptor)
+            palette_process = subprocess.Popen(
+                commands + ["-vf", "palettegen=stats_mode=full", "-an", palette_path]
+            )
+            palette_process.wait()
+            commands += [
+                "-i",
+                palette_path,
+                "-filter_complex",
+                "[0:v][1:v]paletteuse",
+                self.gif_file_path,
+            ]
+
+        if not add_sound:
+            commands.insert(-1, "-an")
+
+        combine_process = subprocess.Popen(commands)
+        combine_process.wait()
+        os.remove(file_list)
+        if config["save_as_gif"]:
+            os.remove(palette_path)
+        if add_sound:
             os.remove(sound_file_path)
 
         self.print_file_ready_message(
             self.gif_file_path if config["save_as_gif"] else movie_file_path
         )
-        if config["write_to_movie"]:
-            for file_path in partial_movie_files:
-                # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
-                modify_atime(file_path)
 
     def clean_cache(self):
-        """Will clean the cache by removing the partial_movie_files used by manim the longest ago."""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        if len(cached_partial_movies) > config["max_files_cached"]:
-            number_files_to_delete = (
-                len(cached_partial_movies) - config["max_files_cached"]
-            )
-            oldest_files_to_delete = sorted(
-                [partial_movie_file for partial_movie_file in cached_partial_movies],
-                key=os.path.getatime,
-            )[:number_files_to_delete]
-            # oldest_file_path = min(cached_partial_movies, key=os.path.getatime)
-            for file_to_delete in oldest_files_to_delete:
-                os.remove(file_to_delete)
+        """Will clean the cache by removing the partial_movie_files used by manim the longest ago,
+        until at most ``max_files_cached`` files weighing at most ``max_cache_size`` megabytes are left."""
+        max_files = config["max_files_cached"]
+        max_size = config["max_cache_size"] * 1024 ** 2
+        used = [h for h in self.renderer.animations_hashes if h is not None]
+        evicted = self.partial_movie_cache.evict(max_files, max_size, keep=used)
+        if evicted:
             logger.info(
-                f"The partial movie directory is full (> {config['max_files_cached']} files). Therefore, manim has removed {number_files_to_delete} file(s) used by it the longest ago."
-                + "You can change this behaviour by changing max_files_cached in config."
+                f"The partial movie cache is full (> {max_files} files or > {config['max_cache_size']} MB). "
+                f"Therefore, manim has removed {len(evicted)} file(s) used by it the longest ago."
+                + "You can change this behaviour by changing max_files_cached and max_cache_size in config."
             )
 
     def flush_cache_directory(self):
         """Delete all the cached partial movie files"""
-        cached_partial_movies = [
-            os.path.join(self.partial_movie_directory, file_name)
-            for file_name in os.listdir(self.partial_movie_directory)
-            if file_name != "partial_movie_file_list.txt"
-        ]
-        for f in cached_partial_movies:
-            os.remove(f)
+        number_deleted = self.partial_movie_cache.clear()
         logger.info(
-            f"Cache flushed. {len(cached_partial_movies)} file(s) deleted in %(par_dir)s.",
+            f"Cache flushed. {number_deleted} file(s) deleted in %(par_dir)s.",
             {"par_dir": self.partial_movie_directory},
         )
 
+    def print_cache_statistics(self):
+        """Logs how many partial movie files were reused by this render,
+        and how much the cache holds."""
+        count, size = self.partial_movie_cache.get_size()
+        logger.info(
+            "Partial movie cache: %(hits)d hit(s) (%(store_hits)d from the cache store), "
+            "%(misses)d miss(es); %(count)d file(s) cached (%(size).1f MB).",
+            {
+                "hits": self.partial_movie_cache.hits + self.store_hits,
+                "store_hits": self.store_hits,
+                "misses": self.partial_movie_cache.misses - self.store_hits,
+                "count": count,
+                "size": size / 1024 ** 2,
+            },
+        )
+
     def print_file_ready_message(self, file_path):
         """Prints the "File Ready" message to STDOUT."""
         logger.info("\nFile ready at %(file_path)s\n", {"file_path": file_path})
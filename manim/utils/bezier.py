@@ -3,6 +3,10 @@
 __all__ = [
     "bezier",
     "partial_bezier_points",
+    "get_partial_bezier_curves",
+    "get_bezier_curve_lengths",
+    "get_bezier_arc_length_table",
+    "get_bezier_curve_points",
     "interpolate",
     "integer_interpolate",
     "mid",
@@ -54,6 +58,104 @@ def partial_bezier_points(points: np.ndarray, a: float, b: float) -> np.ndarray:
     return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
 
 
+def get_partial_bezier_curves(
+    curves: np.ndarray, a: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized version of :func:`partial_bezier_points`.
+
+    Given an array of shape (num_curves, degree + 1, dim) holding
+    the control points of several bezier curves, and arrays (or
+    scalars) a and b with 0<=a<=b<=1, return the control points
+    of the portion of each curve on its interval [a, b].
+
+    The control points of the partial curve are the blossom of the
+    original curve evaluated at (a, ..., a, b, ..., b), which is
+    computed for every curve at once with de Casteljau's algorithm.
+    """
+    curves = np.asarray(curves, dtype=float)
+    num_curves = len(curves)
+    a = np.broadcast_to(a, (num_curves,)).reshape((num_curves, 1, 1))
+    b = np.broadcast_to(b, (num_curves,)).reshape((num_curves, 1, 1))
+    n = curves.shape[1] - 1
+    result = np.empty_like(curves)
+    for j in range(n + 1):
+        points = curves
+        for level in range(n):
+            t = a if level < n - j else b
+            points = (1 - t) * points[:, :-1] + t * points[:, 1:]
+        result[:, j] = points[:, 0]
+    return result
+
+
+def _get_bernstein_weights(n: int, t: np.ndarray) -> np.ndarray:
+    # The weights of the n + 1 control points of a bezier curve of degree n
+    # at each of the values of t, along the last axis.
+    t = np.asarray(t, dtype=float)[..., np.newaxis]
+    k = np.arange(n + 1)
+    coefficients = np.array([choose(n, i) for i in k])
+    return coefficients * ((1 - t) ** (n - k)) * (t ** k)
+
+
+def _get_bezier_sample_distances(curves: np.ndarray, n_samples: int) -> np.ndarray:
+    # The distances between n_samples + 1 evenly spaced points (in t) of each
+    # curve, of shape (num_curves, n_samples).
+    n = curves.shape[1] - 1
+    weights = _get_bernstein_weights(n, np.linspace(0, 1, n_samples + 1))
+    samples = np.einsum("sk,ckd->csd", weights, curves)
+    return np.linalg.norm(np.diff(samples, axis=1), axis=2)
+
+
+def get_bezier_curve_lengths(curves: np.ndarray, n_samples: int = 8) -> np.ndarray:
+    """
+    Given an array of shape (num_curves, degree + 1, dim) holding
+    the control points of several bezier curves, return the
+    approximate arc length of each curve, measured along a polyline
+    through n_samples + 1 evenly spaced values of t.
+
+    All curves are evaluated at once, so this is much cheaper than
+    sampling each curve through :func:`bezier`.
+    """
+    curves = np.asarray(curves)
+    if len(curves) == 0:
+        return np.zeros(0)
+    return _get_bezier_sample_distances(curves, n_samples).sum(axis=1)
+
+
+def get_bezier_arc_length_table(curves: np.ndarray, n_samples: int = 8) -> np.ndarray:
+    """
+    Given an array of shape (num_curves, degree + 1, dim) holding
+    the control points of consecutive bezier curves, return the
+    approximate arc length from the start of the first curve up to
+    each of n_samples + 1 evenly spaced values of t on every curve.
+
+    The result has num_curves * n_samples + 1 increasing entries,
+    the entry i * n_samples + j being the length up to
+    t = j / n_samples on curve i, so the last entry is the total
+    length.  Arc lengths can be mapped back to curves by looking them
+    up in this table, e.g. with :func:`numpy.interp`.
+    """
+    curves = np.asarray(curves)
+    if len(curves) == 0:
+        return np.zeros(1)
+    distances = _get_bezier_sample_distances(curves, n_samples)
+    return np.append(0, np.cumsum(distances))
+
+
+def get_bezier_curve_points(curves: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of :func:`bezier`.
+
+    Given an array of shape (num_curves, degree + 1, dim) holding
+    the control points of several bezier curves, and an array (or
+    scalar) t, return the point of each curve at its value of t.
+    """
+    curves = np.asarray(curves, dtype=float)
+    n = curves.shape[1] - 1
+    t = np.broadcast_to(t, (len(curves),))
+    return np.einsum("ck,ckd->cd", _get_bernstein_weights(n, t), curves)
+
+
 # Linear interpolation variants
 
 
@@ -0,0 +1,183 @@
+"""Stores through which partial movie files are shared between machines.
+
+The partial movie files of a render are always kept in the local partial
+movie directory (see :class:`~.PartialMovieCache`).  A cache store is an
+additional, usually shared, place that is checked for the animations
+missing locally, and that receives the partial movie files rendered
+locally, so that render nodes and CI runners don't render the same
+animation twice.
+
+The store is chosen with the ``cache_store`` config option, which is either
+a directory (for instance on a shared file system) or an ``http://`` or
+``https://`` URL of a server or an S3-compatible bucket accepting plain
+``HEAD``, ``GET`` and ``PUT`` requests on ``<url>/<file name>``.
+"""
+
+__all__ = [
+    "CacheStore",
+    "DirectoryCacheStore",
+    "HTTPCacheStore",
+    "get_cache_store",
+]
+
+
+import os
+import shutil
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import logger
+
+
+class CacheStore:
+    """Base class of the stores of partial movie files.
+
+    Files are identified by their name, that is the hash of the animation
+    followed by the movie file extension.  Subclasses implement
+    :meth:`contains`, :meth:`download` and :meth:`upload`; they must be
+    usable from several threads at once.
+
+    Parameters
+    ----------
+    max_connections : :class:`int`, optional
+        The number of requests :meth:`contains_many` runs concurrently.
+    """
+
+    def __init__(self, max_connections=16):
+        self.max_connections = max_connections
+
+    def contains(self, name):
+        """Returns whether the store holds the file ``name``."""
+        raise NotImplementedError()
+
+    def contains_many(self, names):
+        """Checks which of several files the store holds.
+
+        Parameters
+        ----------
+        names : Iterable[:class:`str`]
+            The names of the files to look for.
+
+        Returns
+        -------
+        Set[:class:`str`]
+            The names of the files held by the store.
+        """
+        names = list(names)
+        if len(names) <= 1:
+            return {name for name in names if self.contains(name)}
+        with ThreadPoolExecutor(min(self.max_connections, len(names))) as pool:
+            found = list(pool.map(self.contains, names))
+        return {name for name, is_found in zip(names, found) if is_found}
+
+    def download(self, name, path):
+        """Copies the file ``name`` of the store to ``path``."""
+        raise NotImplementedError()
+
+    def upload(self, name, path):
+        """Copies the file at ``path`` to the store, as ``name``."""
+        raise NotImplementedError()
+
+
+class DirectoryCacheStore(CacheStore):
+    """A store in a directory, e.g. on a shared file system.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory holding the files.  It is created if needed.
+    """
+
+    def __init__(self, directory, **kwargs):
+        CacheStore.__init__(self, **kwargs)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def contains(self, name):
+        return os.path.exists(os.path.join(self.directory, name))
+
+    def download(self, name, path):
+        shutil.copyfile(os.path.join(self.directory, name), path)
+
+    def upload(self, name, path):
+        # Copy under a temporary name first so that readers never see a
+        # partly written file.
+        final_path = os.path.join(self.directory, name)
+        temp_path = f"{final_path}.{os.getpid()}.tmp"
+        shutil.copyfile(path, temp_path)
+        os.replace(temp_path, final_path)
+
+
+class HTTPCacheStore(CacheStore):
+    """A store behind an HTTP server or an S3-compatible object store.
+
+    Files are checked for with ``HEAD``, downloaded with ``GET`` and uploaded
+    with ``PUT`` requests to ``<url>/<name>``.
+
+    Parameters
+    ----------
+    url : :class:`str`
+        The URL of the store.
+    headers : :class:`dict`, optional
+        Headers added to every request, e.g. for authorization.
+    timeout : :class:`float`, optional
+        The timeout of the requests, in seconds.
+    """
+
+    def __init__(self, url, headers=None, timeout=30, **kwargs):
+        CacheStore.__init__(self, **kwargs)
+        self.url = url.rstrip("/")
+        self.headers = {} if headers is None else dict(headers)
+        self.timeout = timeout
+
+    def get_request(self, name, method, **kwargs):
+        return urllib.request.Request(
+            f"{self.url}/{name}", method=method, headers=self.headers, **kwargs
+        )
+
+    def contains(self, name):
+        try:
+            with urllib.request.urlopen(
+                self.get_request(name, "HEAD"), timeout=self.timeout
+            ):
+                return True
+        except urllib.error.HTTPError as error:
+            if error.code != 404:
+                logger.warning(f"Cache store lookup of {name} failed: {error}")
+            return False
+        except urllib.error.URLError as error:
+            logger.warning(f"Cache store lookup of {name} failed: {error}")
+            return False
+
+    def download(self, name, path):
+        with urllib.request.urlopen(
+            self.get_request(name, "GET"), timeout=self.timeout
+        ) as response, open(path, "wb") as file:
+            shutil.copyfileobj(response, file)
+
+    def upload(self, name, path):
+        with open(path, "rb") as file:
+            request = self.get_request(name, "PUT", data=file)
+            request.add_header("Content-Length", str(os.path.getsize(path)))
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+
+
+def get_cache_store(location):
+    """Returns the cache store at ``location``.
+
+    Parameters
+    ----------
+    location : :class:`str`
+        An ``http://`` or ``https://`` URL, or a directory.
+
+    Returns
+    -------
+    Optional[:class:`CacheStore`]
+        The store, or ``None`` if ``location`` is empty.
+    """
+    if not location:
+        return None
+    if location.startswith(("http://", "https://")):
+        return HTTPCacheStore(location)
+    return DirectoryCacheStore(location)
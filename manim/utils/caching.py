@@ -1,3 +1,8 @@
+import os
+import sqlite3
+import time
+from pathlib import Path
+
 from .. import config, logger
 from ..utils.hashing import get_hash_from_play_call
 
@@ -52,3 +57,256 @@ def handle_caching_play(func):
         func(self, scene, *args, **kwargs)
 
     return wrapper
+
+
+class PartialMovieCache:
+    """An index of the partial movie files stored in a cache directory.
+
+    Partial movie files are named after the hash of the play call that
+    produced them, so one directory can be shared by several scenes,
+    projects or render nodes.  An SQLite database stored next to the files
+    keeps track of their size, when they were last used and how many times
+    they were reused, so that the cache can be trimmed to a byte budget
+    without listing and stating the whole directory.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory holding the partial movie files.
+    extension : :class:`str`
+        The file extension of the partial movie files.
+    """
+
+    index_file_name = "partial_movie_cache.db"
+
+    def __init__(self, directory, extension):
+        self.directory = Path(directory)
+        self.extension = extension
+        # Lookups of the current render, for the statistics.
+        self.hits = 0
+        self.misses = 0
+        # Uses and removals of files not written to the index yet, see flush.
+        self.pending_uses = {}
+        self.pending_removals = set()
+        index_path = self.directory / self.index_file_name
+        is_new = not index_path.exists()
+        self.connection = sqlite3.connect(str(index_path), timeout=60)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS partial_movies ("
+                "hash TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, "
+                "last_used REAL NOT NULL, "
+                "hits INTEGER NOT NULL DEFAULT 0)"
+            )
+        if is_new:
+            self.add_existing_files()
+
+    def get_path(self, hash_invocation):
+        """Returns the path of the partial movie file of a play call.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash of the play call.
+
+        Returns
+        -------
+        :class:`~pathlib.Path`
+            The path of the file, which may not exist.
+        """
+        return self.directory / f"{hash_invocation}{self.extension}"
+
+    def add_existing_files(self):
+        """Adds the partial movie files already in the directory to the
+        index, using their access time as the time of last use.
+
+        This is only needed for directories that were used as a cache
+        before the index was created.  The temporary files of renders and
+        downloads in progress are left out.
+        """
+        temp_suffixes = (f"_temp{self.extension}", f"_download{self.extension}")
+        rows = []
+        for entry in os.scandir(self.directory):
+            if (
+                entry.is_file()
+                and entry.name.endswith(self.extension)
+                and not entry.name.endswith(temp_suffixes)
+            ):
+                stat = entry.stat()
+                name = entry.name[: -len(self.extension)]
+                rows.append((name, stat.st_size, stat.st_atime))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO partial_movies (hash, size, last_used) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def add(self, hash_invocation):
+        """Adds a newly written partial movie file to the index.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash of the play call that produced the file.
+        """
+        size = self.get_path(hash_invocation).stat().st_size
+        self._mark_as_used(hash_invocation, size, 0)
+
+    def contains(self, hash_invocation, touch=True):
+        """Checks whether the partial movie file of a play call is cached,
+        and marks it as used if it is.
+
+        The index is only updated by :meth:`flush`, so lookups don't each
+        need a write transaction.
+
+        Parameters
+        ----------
+        hash_invocation : :class:`str`
+            The hash of the play call.
+        touch : :class:`bool`, optional
+            Whether to count the lookup and mark the file as used.  Lookups
+            that don't render anything, like planning ones, leave the index
+            and the statistics untouched.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the file is cached.
+        """
+        try:
+            size = self.get_path(hash_invocation).stat().st_size
+        except FileNotFoundError:
+            if not touch:
+                return False
+            # The file may have been deleted by hand.
+            self.pending_uses.pop(hash_invocation, None)
+            self.pending_removals.add(hash_invocation)
+            self.misses += 1
+            return False
+        if touch:
+            self._mark_as_used(hash_invocation, size, 1)
+            self.hits += 1
+        return True
+
+    def _mark_as_used(self, hash_invocation, size, hits):
+        self.pending_removals.discard(hash_invocation)
+        if hash_invocation in self.pending_uses:
+            hits += self.pending_uses[hash_invocation][2]
+        self.pending_uses[hash_invocation] = (size, time.time(), hits)
+
+    def flush(self):
+        """Writes the uses and removals of files recorded since the last
+        flush to the index, in a single transaction."""
+        if not self.pending_uses and not self.pending_removals:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM partial_movies WHERE hash = ?",
+                [(hash_invocation,) for hash_invocation in self.pending_removals],
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO partial_movies (hash, size, last_used) "
+                "VALUES (?, ?, 0)",
+                [
+                    (hash_invocation, use[0])
+                    for hash_invocation, use in self.pending_uses.items()
+                ],
+            )
+            self.connection.executemany(
+                "UPDATE partial_movies SET size = ?, last_used = ?, hits = hits + ? "
+                "WHERE hash = ?",
+                [
+                    (*use, hash_invocation)
+                    for hash_invocation, use in self.pending_uses.items()
+                ],
+            )
+        self.pending_uses = {}
+        self.pending_removals = set()
+
+    def get_size(self):
+        """Returns the number of files in the cache and their total size
+        in bytes.
+
+        Returns
+        -------
+        Tuple[:class:`int`, :class:`int`]
+            The number of files and their total size.
+        """
+        self.flush()
+        count, size = self.connection.execute(
+            "SELECT COUNT(*), TOTAL(size) FROM partial_movies"
+        ).fetchone()
+        return count, int(size)
+
+    def evict(self, max_files=float("inf"), max_size=float("inf"), keep=()):
+        """Deletes the least recently used files until the cache holds at
+        most ``max_files`` files weighing at most ``max_size`` bytes.
+
+        Parameters
+        ----------
+        max_files : :class:`int`, optional
+            The maximum number of files to keep.
+        max_size : :class:`int`, optional
+            The maximum total size of the files to keep, in bytes.
+        keep : Iterable[:class:`str`], optional
+            Hashes of files that must not be deleted, e.g. the ones used by
+            the current render.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The hashes of the deleted files.
+        """
+        count, size = self.get_size()
+        if count <= max_files and size <= max_size:
+            return []
+        keep = set(keep)
+        evicted = []
+        rows = self.connection.execute(
+            "SELECT hash, size FROM partial_movies ORDER BY last_used"
+        ).fetchall()
+        for hash_invocation, file_size in rows:
+            if count <= max_files and size <= max_size:
+                break
+            if hash_invocation in keep:
+                continue
+            try:
+                os.remove(self.get_path(hash_invocation))
+            except FileNotFoundError:
+                pass
+            evicted.append(hash_invocation)
+            count -= 1
+            size -= file_size
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM partial_movies WHERE hash = ?",
+                [(hash_invocation,) for hash_invocation in evicted],
+            )
+        return evicted
+
+    def clear(self):
+        """Deletes all the files of the cache.
+
+        Returns
+        -------
+        :class:`int`
+            The number of deleted files.
+        """
+        self.flush()
+        rows = self.connection.execute("SELECT hash FROM partial_movies").fetchall()
+        for (hash_invocation,) in rows:
+            try:
+                os.remove(self.get_path(hash_invocation))
+            except FileNotFoundError:
+                pass
+        with self.connection:
+            self.connection.execute("DELETE FROM partial_movies")
+        return len(rows)
+
+    def close(self):
+        """Writes the pending changes to the index and closes the connection
+        to it."""
+        self.flush()
+        self.connection.close()
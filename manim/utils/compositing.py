@@ -0,0 +1,129 @@
+"""Utilities for compositing RGBA pixel arrays in place.
+
+All functions operate on ``uint8`` arrays of shape ``(height, width, 4)``
+holding *premultiplied* RGBA values, which is the layout cairo draws into
+the pixel array of a :class:`~.Camera`.  Sources are placed with their
+upper left corner at pixel ``(x, y)`` of the destination and are clipped
+to it, so only the affected sub-rectangle of the destination is read and
+written.
+"""
+
+__all__ = [
+    "premultiply",
+    "unpremultiply",
+    "get_overlapping_regions",
+    "composite_over",
+    "composite_over_pixels",
+    "composite_multiply",
+    "composite_mask",
+    "composite_lighten",
+]
+
+
+import typing
+
+import numpy as np
+
+MAX_VALUE: int = 255
+
+
+def premultiply(rgba: np.ndarray) -> np.ndarray:
+    """Returns a premultiplied copy of a straight RGBA ``uint8`` array."""
+    result = np.array(rgba, dtype="uint16")
+    result[..., :3] = (result[..., :3] * result[..., 3:] + MAX_VALUE // 2) // MAX_VALUE
+    return result.astype("uint8")
+
+
+def unpremultiply(rgba: np.ndarray) -> np.ndarray:
+    """Returns a straight copy of a premultiplied RGBA ``uint8`` array."""
+    result = np.array(rgba, dtype="uint16")
+    alphas = result[..., 3:]
+    result[..., :3] = np.where(
+        alphas > 0,
+        (result[..., :3] * MAX_VALUE + alphas // 2) // np.maximum(alphas, 1),
+        0,
+    )
+    return np.minimum(result, MAX_VALUE).astype("uint8")
+
+
+def get_overlapping_regions(
+    dst: np.ndarray, src: np.ndarray, x: int = 0, y: int = 0
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Returns the views of ``dst`` and ``src`` which overlap when the upper
+    left corner of ``src`` is placed at pixel ``(x, y)`` of ``dst``.
+
+    Both views are empty when the arrays don't overlap.
+    """
+    dst_height, dst_width = dst.shape[:2]
+    src_height, src_width = src.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + src_width, dst_width), min(y + src_height, dst_height)
+    x1, y1 = max(x1, x0), max(y1, y0)
+    return (
+        dst[y0:y1, x0:x1],
+        src[y0 - y : y1 - y, x0 - x : x1 - x],
+    )
+
+
+def composite_over(dst: np.ndarray, src: np.ndarray, x: int = 0, y: int = 0) -> None:
+    """Composites the premultiplied ``src`` over ``dst``, in place.
+
+    That is, ``dst = src + dst * (1 - src_alpha)``.
+    """
+    dst_region, src_region = get_overlapping_regions(dst, src, x, y)
+    if dst_region.size == 0:
+        return
+    inverse_alphas = MAX_VALUE - src_region[..., 3:].astype("uint16")
+    result = src_region + (dst_region * inverse_alphas + MAX_VALUE // 2) // MAX_VALUE
+    dst_region[...] = np.minimum(result, MAX_VALUE)
+
+
+def composite_over_pixels(
+    dst: np.ndarray, ys: np.ndarray, xs: np.ndarray, src: np.ndarray
+) -> None:
+    """Composites premultiplied colors over scattered pixels of ``dst``,
+    in place.
+
+    ``src`` holds one RGBA color per pixel ``(ys[i], xs[i])``, as floats
+    between 0 and 1.  The pixels must be distinct.
+    """
+    pixels = dst[ys, xs].astype("float")
+    pixels *= 1 - src[:, 3:]
+    pixels += src * MAX_VALUE
+    dst[ys, xs] = np.round(np.clip(pixels, 0, MAX_VALUE)).astype(dst.dtype)
+
+
+def composite_multiply(
+    dst: np.ndarray, src: np.ndarray, x: int = 0, y: int = 0
+) -> None:
+    """Multiplies every channel of ``dst`` by the one of ``src``, in place.
+
+    Multiplying a premultiplied drawing by an image keeps the image only
+    where (and as much as) something was drawn.
+    """
+    dst_region, src_region = get_overlapping_regions(dst, src, x, y)
+    if dst_region.size == 0:
+        return
+    result = dst_region * src_region.astype("uint16")
+    dst_region[...] = (result + MAX_VALUE // 2) // MAX_VALUE
+
+
+def composite_mask(dst: np.ndarray, mask: np.ndarray, x: int = 0, y: int = 0) -> None:
+    """Scales every channel of ``dst`` by a coverage ``mask``, in place.
+
+    ``mask`` is a ``(height, width)`` ``uint8`` array, where 0 clears the
+    pixel and 255 leaves it untouched.
+    """
+    dst_region, mask_region = get_overlapping_regions(dst, mask, x, y)
+    if dst_region.size == 0:
+        return
+    result = dst_region * mask_region[..., np.newaxis].astype("uint16")
+    dst_region[...] = (result + MAX_VALUE // 2) // MAX_VALUE
+
+
+def composite_lighten(dst: np.ndarray, src: np.ndarray, x: int = 0, y: int = 0) -> None:
+    """Keeps the channelwise maximum of ``dst`` and ``src`` in ``dst``."""
+    dst_region, src_region = get_overlapping_regions(dst, src, x, y)
+    if dst_region.size == 0:
+        return
+    np.maximum(dst_region, src_region, out=dst_region)
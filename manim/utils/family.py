@@ -1,6 +1,5 @@
 import itertools as it
 
-from ..mobject.mobject import Mobject
 from ..utils.iterables import remove_list_redundancies
 
 
@@ -24,13 +23,11 @@ def extract_mobject_family_members(
     list
         list of the mobjects and family members.
     """
-    if only_those_with_points:
-        method = Mobject.family_members_with_points
-    else:
-        method = Mobject.get_family
     extracted_mobjects = remove_list_redundancies(
-        list(it.chain(*[method(m) for m in mobjects]))
+        list(it.chain.from_iterable(m.iter_family() for m in mobjects))
     )
+    if only_those_with_points:
+        extracted_mobjects = [m for m in extracted_mobjects if m.get_num_points() > 0]
     if use_z_index:
         return sorted(extracted_mobjects, key=lambda m: m.z_index)
     return extracted_mobjects
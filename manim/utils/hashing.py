@@ -8,7 +8,7 @@ import numpy as np
 from types import ModuleType, MappingProxyType, FunctionType, MethodType
 from time import perf_counter
 
-from .. import logger
+from .. import config, logger
 
 ALREADY_PROCESSED_ID = {}
 
@@ -207,11 +207,48 @@ def get_camera_dict_for_hashing(camera_object):
     # We have to clean a little bit of camera_dict, as pixel_array and background are two very big numpy arrays. They
     # are not essential to caching process. We also have to remove pixel_array_to_cairo_context as it contains used
     # memory address (set randomly). See l.516 get_cached_cairo_context in camera.py
-    for to_clean in ["background", "pixel_array", "pixel_array_to_cairo_context"]:
+    # The display functions, the image cache and the capture statistics are
+    # only set once something was captured, and depend on what was rendered
+    # before rather than on what will be rendered.
+    for to_clean in [
+        "background",
+        "pixel_array",
+        "pixel_array_to_cairo_context",
+        "pixel_array_to_cairo_matrix",
+        "path_cache",
+        "display_funcs",
+        "image_mobject_cache",
+        "num_displayed_mobjects",
+        "num_culled_mobjects",
+    ]:
         camera_object_dict.pop(to_clean, None)
     return camera_object_dict
 
 
+def get_encoder_dict_for_hashing():
+    """Returns the resolved encoder options that change the content of the
+    partial movie files, so that files encoded differently (e.g. with the
+    "preview" and "master" encoder profiles) are never mistaken for each
+    other.
+
+    Returns
+    -------
+    :class:`dict`
+        The encoder options.
+    """
+    if config["transparent"]:
+        # Transparent movies are always encoded losslessly with qtrle.
+        return {"transparent": True}
+    return {
+        "transparent": False,
+        "video_codec": config["video_codec"],
+        "encoder_preset": config["encoder_preset"],
+        "encoder_crf": config["encoder_crf"],
+        "encoder_tune": config["encoder_tune"],
+        "yuv_conversion": config["yuv_conversion"],
+    }
+
+
 def get_hash_from_play_call(
     scene_object, camera_object, animations_list, current_mobjects_list
 ):
@@ -241,7 +278,10 @@ def get_hash_from_play_call(
     # We add the scene object within the ALREADY_PROCESSED_ID, as we don't want to process because pretty much all of its attributes will be soon or later processed (in one of the three hashes).
     ALREADY_PROCESSED_ID = {id(scene_object): scene_object}
     t_start = perf_counter()
+    # The encoder options are hashed along with the camera, as both decide how
+    # the frames end up in the partial movie file.
     camera_json = get_json(get_camera_dict_for_hashing(camera_object))
+    camera_json += get_json(get_encoder_dict_for_hashing())
     animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
     current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
     hash_camera, hash_animations, hash_current_mobjects = [
@@ -288,6 +328,7 @@ def get_hash_from_wait_call(
     # We add the scene object within the ALREADY_PROCESSED_ID, as we don't want to process because pretty much all of its attributes will be soon or later processed (in one of the three hashes).
     ALREADY_PROCESSED_ID = {id(scene_object): scene_object}
     camera_json = get_json(get_camera_dict_for_hashing(camera_object))
+    camera_json += get_json(get_encoder_dict_for_hashing())
     current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
     hash_current_mobjects = zlib.crc32(repr(current_mobjects_list_json).encode())
     hash_camera = zlib.crc32(repr(camera_json).encode())
@@ -1,6 +1,11 @@
 """Image manipulation utilities."""
 
-__all__ = ["get_full_raster_image_path", "drag_pixels", "invert_image"]
+__all__ = [
+    "get_full_raster_image_path",
+    "drag_pixels",
+    "invert_image",
+    "rgba_to_yuv420p",
+]
 
 
 import numpy as np
@@ -32,3 +37,65 @@ def invert_image(image):
     arr = np.array(image)
     arr = (255 * np.ones(arr.shape)).astype(arr.dtype) - arr
     return Image.fromarray(arr)
+
+
+# Coefficients computing the U and V channels of the limited range BT.601
+# colorspace ffmpeg converts RGB to by default, from R, G, B and A.
+RGBA_TO_CHROMA_MATRIX = np.array(
+    [
+        [-0.148223, 0.439216],
+        [-0.290993, -0.367788],
+        [0.439216, -0.071427],
+        [0, 0],
+    ],
+    dtype="float32",
+)
+
+
+def rgba_to_yuv420p(image):
+    """Converts an RGBA image to the planar YUV 4:2:0 format of ffmpeg's
+    ``yuv420p`` pixel format, ignoring its alpha channel.
+
+    The conversion uses the same limited range BT.601 colorspace as ffmpeg,
+    and each chroma sample is computed from the average color of a 2x2 block
+    of pixels.
+
+    Parameters
+    ----------
+    image : np.array
+        ``uint8`` array of shape ``(height, width, 4)``, with even height
+        and width.
+
+    Returns
+    -------
+    np.array
+        ``uint8`` array holding the Y plane followed by the U and V planes,
+        of ``height * width * 3 // 2`` bytes in total.
+    """
+    height, width = image.shape[:2]
+    num_pixels = height * width
+    planes = np.empty(num_pixels * 3 // 2, dtype="uint8")
+
+    # Y = 16 + (66 R + 129 G + 25 B) / 256, in 16 bit integers, which is
+    # quicker than a float product with the whole image.
+    luma = image[..., 0].astype("uint16")
+    luma *= 66
+    for channel, coefficient in [(1, 129), (2, 25)]:
+        values = image[..., channel].astype("uint16")
+        values *= coefficient
+        luma += values
+    luma += 128 + (16 << 8)
+    luma >>= 8
+    planes[:num_pixels] = luma.ravel()
+
+    # Sum the pixels of each 2x2 block, first adding the rows of each pair of
+    # rows, then the two halves of each 8 byte pair of pixels.
+    row_pairs = image.reshape(height // 2, 2 * width * 4)
+    sums = row_pairs[:, : width * 4].astype("uint16")
+    sums += row_pairs[:, width * 4 :]
+    sums = sums.reshape(height // 2, width // 2, 8)
+    blocks = (sums[..., :4] + sums[..., 4:]).reshape(-1, 4)
+    chroma = blocks.astype("float32") @ (RGBA_TO_CHROMA_MATRIX / 4)
+    chroma += 128.5
+    planes[num_pixels:] = chroma.T.astype("uint8").ravel()
+    return planes
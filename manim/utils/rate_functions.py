@@ -66,7 +66,6 @@ __all__ = [
 
 
 import typing
-from math import sqrt
 
 import numpy as np
 
@@ -74,6 +73,12 @@ from ..utils.bezier import bezier
 from ..utils.simple_functions import sigmoid
 
 
+def _where(condition, x, y):
+    # np.where, but returning a scalar rather than a 0-d array for scalars, so
+    # that rate functions take both numbers and arrays of numbers.
+    return np.where(condition, x, y)[()]
+
+
 def linear(t: typing.Union[np.ndarray, float]) -> typing.Union[np.ndarray, float]:
     return t
 
@@ -100,25 +105,21 @@ def slow_into(t: np.ndarray) -> np.ndarray:
 
 
 def double_smooth(t: float) -> np.ndarray:
-    if t < 0.5:
-        return 0.5 * smooth(2 * t)
-    else:
-        return 0.5 * (1 + smooth(2 * t - 1))
+    return _where(t < 0.5, 0.5 * smooth(2 * t), 0.5 * (1 + smooth(2 * t - 1)))
 
 
 def there_and_back(t: float, inflection: float = 10.0) -> np.ndarray:
-    new_t = 2 * t if t < 0.5 else 2 * (1 - t)
+    new_t = 2 * np.minimum(t, 1 - t)
     return smooth(new_t, inflection)
 
 
 def there_and_back_with_pause(t: float, pause_ratio: float = 1.0 / 3) -> np.ndarray:
     a = 1.0 / pause_ratio
-    if t < 0.5 - pause_ratio / 2:
-        return smooth(a * t)
-    elif t < 0.5 + pause_ratio / 2:
-        return 1
-    else:
-        return smooth(a - a * t)
+    return _where(
+        t < 0.5 - pause_ratio / 2,
+        smooth(a * t),
+        _where(t < 0.5 + pause_ratio / 2, 1, smooth(a - a * t)),
+    )
 
 
 def running_start(t: float, pull_factor: float = -0.5) -> typing.Iterable:
@@ -146,14 +147,10 @@ def squish_rate_func(
 ) -> typing.Callable[[float], typing.Any]:  # what is func return type?
     def result(t):
         if a == b:
-            return a
+            return np.full(np.shape(t), a)[()]
 
-        if t < a:
-            return func(0)
-        elif t > b:
-            return func(1)
-        else:
-            return func((t - a) / (b - a))
+        # Times before a and after b are clipped to 0 and 1.
+        return func(np.clip((t - a) / (b - a), 0, 1))
 
     return result
 
@@ -195,7 +192,7 @@ def ease_out_quad(t: float) -> float:
 
 
 def ease_in_out_quad(t: float) -> float:
-    return 2 * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 2) / 2
+    return _where(t < 0.5, 2 * t * t, 1 - pow(-2 * t + 2, 2) / 2)
 
 
 def ease_in_cubic(t: float) -> float:
@@ -207,7 +204,7 @@ def ease_out_cubic(t: float) -> float:
 
 
 def ease_in_out_cubic(t: float) -> float:
-    return 4 * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 3) / 2
+    return _where(t < 0.5, 4 * t * t * t, 1 - pow(-2 * t + 2, 3) / 2)
 
 
 def ease_in_quart(t: float) -> float:
@@ -219,7 +216,7 @@ def ease_out_quart(t: float) -> float:
 
 
 def ease_in_out_quart(t: float) -> float:
-    return 8 * t * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 4) / 2
+    return _where(t < 0.5, 8 * t * t * t * t, 1 - pow(-2 * t + 2, 4) / 2)
 
 
 def ease_in_quint(t: float) -> float:
@@ -231,42 +228,49 @@ def ease_out_quint(t: float) -> float:
 
 
 def ease_in_out_quint(t: float) -> float:
-    return 16 * t * t * t * t * t if t < 0.5 else 1 - pow(-2 * t + 2, 5) / 2
+    return _where(t < 0.5, 16 * t * t * t * t * t, 1 - pow(-2 * t + 2, 5) / 2)
 
 
 def ease_in_expo(t: float) -> float:
-    return 0 if t == 0 else pow(2, 10 * t - 10)
+    return _where(t == 0, 0, np.power(2.0, 10 * t - 10))
 
 
 def ease_out_expo(t: float) -> float:
-    return 1 if t == 1 else 1 - pow(2, -10 * t)
+    return _where(t == 1, 1, 1 - np.power(2.0, -10 * t))
 
 
 def ease_in_out_expo(t: float) -> float:
-    if t == 0:
-        return 0
-    elif t == 1:
-        return 1
-    elif t < 0.5:
-        return pow(2, 20 * t - 10) / 2
-    else:
-        return 2 - pow(2, -20 * t + 10) / 2
+    return _where(
+        t == 0,
+        0,
+        _where(
+            t == 1,
+            1,
+            _where(
+                t < 0.5,
+                np.power(2.0, 20 * t - 10) / 2,
+                2 - np.power(2.0, -20 * t + 10) / 2,
+            ),
+        ),
+    )
 
 
 def ease_in_circ(t: float) -> float:
-    return 1 - sqrt(1 - pow(t, 2))
+    return 1 - np.sqrt(1 - pow(t, 2))
 
 
 def ease_out_circ(t: float) -> float:
-    return sqrt(1 - pow(t - 1, 2))
+    return np.sqrt(1 - pow(t - 1, 2))
 
 
 def ease_in_out_circ(t: float) -> float:
-    return (
-        (1 - sqrt(1 - pow(2 * t, 2))) / 2
-        if t < 0.5
-        else (sqrt(1 - pow(-2 * t + 2, 2)) + 1) / 2
-    )
+    # Each half is out of the square roots' domain on the other half.
+    with np.errstate(invalid="ignore"):
+        return _where(
+            t < 0.5,
+            (1 - np.sqrt(1 - pow(2 * t, 2))) / 2,
+            (np.sqrt(1 - pow(-2 * t + 2, 2)) + 1) / 2,
+        )
 
 
 def ease_in_back(t: float) -> float:
@@ -284,43 +288,42 @@ def ease_out_back(t: float) -> float:
 def ease_in_out_back(t: float) -> float:
     c1 = 1.70158
     c2 = c1 * 1.525
-    return (
-        (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2
-        if t < 0.5
-        else (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+    return _where(
+        t < 0.5,
+        (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2,
+        (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2,
     )
 
 
 def ease_in_elastic(t: float) -> float:
     c4 = (2 * np.pi) / 3
-    if t == 0:
-        return 0
-    elif t == 1:
-        return 1
-    else:
-        return -pow(2, 10 * t - 10) * np.sin((t * 10 - 10.75) * c4)
+    return _where(
+        (t == 0) | (t == 1),
+        t,
+        -np.power(2.0, 10 * t - 10) * np.sin((t * 10 - 10.75) * c4),
+    )
 
 
 def ease_out_elastic(t: float) -> float:
     c4 = (2 * np.pi) / 3
-    if t == 0:
-        return 0
-    elif t == 1:
-        return 1
-    else:
-        return pow(2, -10 * t) * np.sin((t * 10 - 0.75) * c4) + 1
+    return _where(
+        (t == 0) | (t == 1),
+        t,
+        np.power(2.0, -10 * t) * np.sin((t * 10 - 0.75) * c4) + 1,
+    )
 
 
 def ease_in_out_elastic(t: float) -> float:
     c5 = (2 * np.pi) / 4.5
-    if t == 0:
-        return 0
-    elif t == 1:
-        return 1
-    elif t < 0.5:
-        return -(pow(2, 20 * t - 10) * np.sin((20 * t - 11.125) * c5)) / 2
-    else:
-        return (pow(2, -20 * t + 10) * np.sin((20 * t - 11.125) * c5)) / 2 + 1
+    return _where(
+        (t == 0) | (t == 1),
+        t,
+        _where(
+            t < 0.5,
+            -(np.power(2.0, 20 * t - 10) * np.sin((20 * t - 11.125) * c5)) / 2,
+            (np.power(2.0, -20 * t + 10) * np.sin((20 * t - 11.125) * c5)) / 2 + 1,
+        ),
+    )
 
 
 def ease_in_bounce(t: float) -> float:
@@ -331,21 +334,22 @@ def ease_out_bounce(t: float) -> float:
     n1 = 7.5625
     d1 = 2.75
 
-    if t < 1 / d1:
-        return n1 * t * t
-    elif t < 2 / d1:
-        return n1 * (t - 1.5 / d1) * t + 0.75
-    elif t < 2.5 / d1:
-        return n1 * (t - 2.25 / d1) * t + 0.9375
-    else:
-        return n1 * (t - 2.625 / d1) * t + 0.984375
+    return np.select(
+        [t < 1 / d1, t < 2 / d1, t < 2.5 / d1],
+        [
+            n1 * t * t,
+            n1 * (t - 1.5 / d1) * t + 0.75,
+            n1 * (t - 2.25 / d1) * t + 0.9375,
+        ],
+        n1 * (t - 2.625 / d1) * t + 0.984375,
+    )[()]
 
 
 def ease_in_out_bounce(t: float) -> float:
     c1 = 1.70158
     c2 = c1 * 1.525
-    return (
-        (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2
-        if t < 0.5
-        else (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+    return _where(
+        t < 0.5,
+        (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2,
+        (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2,
     )
@@ -2,10 +2,16 @@
 
 __all__ = [
     "get_full_sound_file_path",
+    "AudioTimeline",
 ]
 
 
+import wave
 from pathlib import Path
+
+import numpy as np
+from pydub import AudioSegment
+
 from ..utils.file_ops import seek_full_path_from_defaults
 
 
@@ -16,3 +22,126 @@ def get_full_sound_file_path(sound_file_name):
         default_dir=Path("assets") / "sounds",
         extensions=[".wav", ".mp3"],
     )
+
+
+class AudioTimeline:
+    """The soundtrack of a scene, as a list of sounds played at given times.
+
+    Sounds are only decoded once per file, and are mixed in a single pass
+    when the soundtrack is written by :meth:`write_wav`, a few seconds at a
+    time, so the whole soundtrack is never held in memory.
+
+    Parameters
+    ----------
+    chunk_duration : :class:`float`, optional
+        The duration, in seconds, of the pieces the soundtrack is mixed in.
+    """
+
+    def __init__(self, chunk_duration=10):
+        self.chunk_duration = chunk_duration
+        # (segment, time, gain, gain_to_background) tuples, in the order
+        # they were added.
+        self.events = []
+        self.segments_by_path = {}
+        self.duration = 0
+
+    def add_segment(self, segment, time=None, gain=None, gain_to_background=None):
+        """Plays an audio segment.
+
+        Parameters
+        ----------
+        segment : :class:`pydub.AudioSegment`
+            The audio segment to play.
+        time : :class:`float`, optional
+            When to start playing, in seconds.  Defaults to the end of the
+            soundtrack.
+        gain : :class:`float`, optional
+            The gain applied to the segment, in dB.
+        gain_to_background : :class:`float`, optional
+            The gain applied to the sounds added before, in dB, while the
+            segment plays.
+        """
+        if time is None:
+            time = self.duration
+        if time < 0:
+            raise ValueError("Adding sound at timestamp < 0")
+        self.events.append((segment, time, gain, gain_to_background))
+        self.duration = max(self.duration, time + segment.duration_seconds)
+
+    def add_sound(self, file_path, time=None, gain=None, gain_to_background=None):
+        """Plays a sound file, decoding it only if it wasn't played before.
+
+        See :meth:`add_segment` for the other parameters.
+        """
+        file_path = str(file_path)
+        if file_path not in self.segments_by_path:
+            self.segments_by_path[file_path] = AudioSegment.from_file(file_path)
+        self.add_segment(
+            self.segments_by_path[file_path], time, gain, gain_to_background
+        )
+
+    def write_wav(self, file_path):
+        """Mixes the soundtrack into a 16 bit WAV file.
+
+        The soundtrack uses the highest sample rate and number of channels
+        of its sounds.
+
+        Parameters
+        ----------
+        file_path : :class:`str`
+            The path of the WAV file.
+        """
+        frame_rate = max(event[0].frame_rate for event in self.events)
+        channels = max(event[0].channels for event in self.events)
+        samples_by_segment = {}
+        events = []
+        for segment, time, gain, gain_to_background in self.events:
+            if id(segment) not in samples_by_segment:
+                samples_by_segment[id(segment)] = get_float_samples(
+                    segment.set_frame_rate(frame_rate).set_channels(channels)
+                )
+            samples = samples_by_segment[id(segment)]
+            start = int(round(time * frame_rate))
+            events.append(
+                (
+                    samples,
+                    start,
+                    start + len(samples),
+                    1 if gain is None else 10 ** (gain / 20),
+                    None
+                    if gain_to_background is None
+                    else 10 ** (gain_to_background / 20),
+                )
+            )
+        starts = np.array([event[1] for event in events])
+        ends = np.array([event[2] for event in events])
+        num_frames = ends.max()
+        chunk_size = int(self.chunk_duration * frame_rate)
+
+        with wave.open(str(file_path), "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(frame_rate)
+            for chunk_start in range(0, num_frames, chunk_size):
+                chunk_end = min(chunk_start + chunk_size, num_frames)
+                mix = np.zeros((chunk_end - chunk_start, channels), dtype="float32")
+                playing = np.nonzero((starts < chunk_end) & (ends > chunk_start))[0]
+                for index in playing:
+                    samples, start, end, gain, gain_to_background = events[index]
+                    lo = max(start, chunk_start)
+                    hi = min(end, chunk_end)
+                    if gain_to_background is not None:
+                        mix[lo - chunk_start : hi - chunk_start] *= gain_to_background
+                    mix[lo - chunk_start : hi - chunk_start] += (
+                        gain * samples[lo - start : hi - start]
+                    )
+                mix = np.clip(np.round(mix * 32767), -32768, 32767)
+                wav_file.writeframes(mix.astype("<i2").tobytes())
+
+
+def get_float_samples(segment):
+    """Returns the samples of a :class:`pydub.AudioSegment` as an array of
+    shape ``(num_frames, channels)`` of floats between -1 and 1."""
+    samples = np.array(segment.get_array_of_samples(), dtype="float32")
+    samples /= 2 ** (8 * segment.sample_width - 1)
+    return samples.reshape((-1, segment.channels))
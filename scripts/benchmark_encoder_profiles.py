@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+Encodes the same frames with every encoder profile, with and without the
+numpy YUV conversion, and prints the encoding speed and file size of each.
+
+Usage: benchmark_encoder_profiles.py [num_frames] [height,width]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import types
+
+import numpy as np
+
+from manim import config, tempconfig
+from manim.constants import ENCODER_PROFILES
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+def make_frames(num_frames, height, width):
+    # A gradient with a disk moving over it, redrawn in a few frames only,
+    # roughly like a scene with a background and a moving mobject.
+    ys, xs = np.mgrid[0:height, 0:width]
+    background = np.zeros((height, width, 4), dtype="uint8")
+    background[..., 0] = 255 * xs // width
+    background[..., 2] = 255 * ys // height
+    background[..., 3] = 255
+    frames = []
+    for i in range(num_frames):
+        frame = background.copy()
+        cx = width * (0.2 + 0.6 * i / num_frames)
+        disk = (xs - cx) ** 2 + (ys - height / 2) ** 2 < (height / 5) ** 2
+        frame[disk] = [255, 255, 0, 255]
+        frames.append(frame)
+    return frames
+
+
+def benchmark(frames, directory, profile, yuv_conversion):
+    height, width = frames[0].shape[:2]
+    path = os.path.join(directory, f"{profile}_{yuv_conversion}.mp4")
+    with tempconfig({"dry_run": True}):
+        file_writer = SceneFileWriter(types.SimpleNamespace(num_plays=0), "Benchmark")
+    file_writer.partial_movie_files = [path]
+    with tempconfig(
+        {
+            "write_to_movie": True,
+            "disable_caching": True,
+            "pixel_height": height,
+            "pixel_width": width,
+            "yuv_conversion": yuv_conversion,
+        }
+    ):
+        config.encoder_profile = profile
+        start = time.perf_counter()
+        file_writer.begin_animation(True)
+        for frame in frames:
+            file_writer.write_frame(frame)
+        file_writer.end_animation(True)
+        duration = time.perf_counter() - start
+    return len(frames) / duration, os.path.getsize(path)
+
+
+if __name__ == "__main__":
+    num_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    height, width = (
+        map(int, sys.argv[2].split(",")) if len(sys.argv) > 2 else (1080, 1920)
+    )
+    frames = make_frames(num_frames, height, width)
+    print(f"{num_frames} frames of {width}x{height}")
+    print(f"{'profile':<10}{'conversion':<12}{'fps':>8}{'size (kB)':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in ENCODER_PROFILES:
+            for yuv_conversion in [False, True]:
+                fps, size = benchmark(frames, directory, profile, yuv_conversion)
+                conversion = "numpy" if yuv_conversion else "ffmpeg"
+                print(f"{profile:<10}{conversion:<12}{fps:>8.1f}{size / 1024:>12.0f}")
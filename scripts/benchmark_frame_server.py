@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""
+Times the serialization of a frame by the frame server, with the points sent
+as Point messages and packed into bytes, and prints the size of each response.
+
+Usage: benchmark_frame_server.py [num_mobjects] [num_curves]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from manim import VMobject
+from manim.grpc.gen import frameserver_pb2
+from manim.grpc.impl.frame_server_impl import serialize_mobject
+
+
+def make_mobjects(num_mobjects, num_curves):
+    mobjects = []
+    for i in range(num_mobjects):
+        mobject = VMobject()
+        angles = np.linspace(0, 2 * np.pi, num_curves + 1) + i
+        points = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], 1)
+        mobject.set_points_as_corners(points)
+        mobjects.append(mobject)
+    return mobjects
+
+
+def benchmark(mobjects, packed, repeats=5):
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        response = frameserver_pb2.FrameResponse(
+            mobjects=[serialize_mobject(mobject, packed=packed) for mobject in mobjects]
+        )
+        data = response.SerializeToString()
+        durations.append(time.perf_counter() - start)
+    return min(durations), len(data)
+
+
+if __name__ == "__main__":
+    num_mobjects = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_curves = int(sys.argv[2]) if len(sys.argv) > 2 else 250
+    mobjects = make_mobjects(num_mobjects, num_curves)
+    num_points = sum(len(mobject.points) for mobject in mobjects)
+    print(f"{num_mobjects} mobjects, {num_points} points")
+    print(f"{'points':<10}{'time (ms)':>12}{'size (kB)':>12}")
+    for packed in [False, True]:
+        duration, size = benchmark(mobjects, packed)
+        name = "packed" if packed else "messages"
+        print(f"{name:<10}{duration * 1000:>12.1f}{size / 1024:>12.0f}")
@@ -1,9 +1,17 @@
 import pytest
 import numpy as np
 
+from manim import tempconfig
 from manim.scene.graph_scene import GraphScene
 
 
+@pytest.fixture(autouse=True)
+def media_dir(tmp_path):
+    # Scenes create their partial movie directory and its index.
+    with tempconfig({"media_dir": str(tmp_path)}):
+        yield tmp_path
+
+
 def test_axes_without_shift():
     """Test whether axes are not shifted when origin is in plot range."""
     G = GraphScene(
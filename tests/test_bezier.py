@@ -0,0 +1,41 @@
+import numpy as np
+
+from manim.utils.bezier import (
+    bezier,
+    get_bezier_arc_length_table,
+    get_bezier_curve_lengths,
+    get_bezier_curve_points,
+    get_partial_bezier_curves,
+    partial_bezier_points,
+)
+
+
+def test_get_partial_bezier_curves_matches_partial_bezier_points():
+    curves = np.random.random((5, 4, 3))
+    for a, b in [(0, 1), (0.2, 0.7), (0.5, 0.5), (0, 0.3), (0.6, 1)]:
+        partials = get_partial_bezier_curves(curves, a, b)
+        for curve, partial in zip(curves, partials):
+            np.testing.assert_allclose(partial, partial_bezier_points(curve, a, b))
+
+
+def test_get_bezier_curve_lengths():
+    line = np.array([[0, 0, 0], [1, 0, 0], [2, 0, 0], [3, 0, 0]])
+    degenerate = np.zeros((4, 3))
+    lengths = get_bezier_curve_lengths(np.array([line, degenerate]))
+    np.testing.assert_allclose(lengths, [3, 0])
+
+
+def test_get_bezier_arc_length_table():
+    curves = np.random.random((5, 4, 3))
+    table = get_bezier_arc_length_table(curves, 8)
+    assert table.shape == (41,)
+    assert table[0] == 0
+    np.testing.assert_allclose(table[8::8], np.cumsum(get_bezier_curve_lengths(curves)))
+
+
+def test_get_bezier_curve_points_matches_bezier():
+    curves = np.random.random((5, 4, 3))
+    t = np.linspace(0, 1, 5)
+    points = get_bezier_curve_points(curves, t)
+    for curve, value, point in zip(curves, t, points):
+        np.testing.assert_allclose(point, bezier(curve)(value))
@@ -0,0 +1,103 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from manim import tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.cache_stores import DirectoryCacheStore, HTTPCacheStore
+
+
+class _ObjectStoreHandler(BaseHTTPRequestHandler):
+    """A minimal stand-in for an S3-compatible object store."""
+
+    def do_HEAD(self):
+        self.server.lookups += 1
+        self.send_object(with_body=False)
+
+    def do_GET(self):
+        self.send_object(with_body=True)
+
+    def do_PUT(self):
+        length = int(self.headers["Content-Length"])
+        self.server.objects[self.path] = self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def send_object(self, with_body):
+        data = self.server.objects.get(self.path)
+        if data is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def object_store():
+    server = HTTPServer(("127.0.0.1", 0), _ObjectStoreHandler)
+    server.objects = {}
+    server.lookups = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_port}/bucket"
+    server.shutdown()
+    server.server_close()
+
+
+def check_store(store, tmp_path):
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"movie")
+    store.upload("a.mp4", str(source))
+    assert store.contains("a.mp4")
+    assert store.contains_many(["a.mp4", "b.mp4", "c.mp4"]) == {"a.mp4"}
+    store.download("a.mp4", str(tmp_path / "copy.mp4"))
+    assert (tmp_path / "copy.mp4").read_bytes() == b"movie"
+
+
+def test_directory_store(tmp_path):
+    check_store(DirectoryCacheStore(str(tmp_path / "store")), tmp_path)
+
+
+def test_http_store(tmp_path, object_store):
+    _, url = object_store
+    check_store(HTTPCacheStore(url), tmp_path)
+
+
+def test_missing_partial_movies_are_downloaded(tmp_path, object_store):
+    server, object_store_url = object_store
+    store = HTTPCacheStore(object_store_url)
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"movie")
+    store.upload("a.mp4", str(source))
+    with tempconfig(
+        {
+            "media_dir": str(tmp_path / "media"),
+            "write_to_movie": True,
+            "movie_file_extension": ".mp4",
+            "cache_store": object_store_url,
+        }
+    ):
+        file_writer = SceneFileWriter(None, "SharedScene")
+        assert file_writer.get_cached_hashes(["a", "b"]) == {"a"}
+        file_writer.wait_for_cache_transfers()
+        assert file_writer.partial_movie_cache.get_path("a").read_bytes() == b"movie"
+        assert file_writer.is_already_cached("a")
+        assert file_writer.store_hits == 1
+        # The store is asked about each file once per render.
+        lookups = server.lookups
+        assert not file_writer.is_already_cached("b")
+        assert not file_writer.is_already_cached("b")
+        assert server.lookups == lookups
+        file_writer.close_cache_store()
+        with pytest.raises(RuntimeError):
+            file_writer.cache_transfers.submit(print)
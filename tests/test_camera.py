@@ -0,0 +1,153 @@
+import numpy as np
+
+from manim import (
+    BLACK,
+    LEFT,
+    RIGHT,
+    Camera,
+    Circle,
+    ImageMobject,
+    ImageMobjectFromCamera,
+    MovingCamera,
+    MultiCamera,
+    PMobject,
+    ThreeDCamera,
+    VMobject,
+)
+
+
+def test_point_cloud_is_blended_over_background():
+    camera = Camera(pixel_width=64, pixel_height=36, background_color=BLACK)
+    pmobject = PMobject()
+    pmobject.add_points(
+        [[0, 0, 0], [0, 0, 0]], rgbas=np.array([[1, 0, 0, 0.5], [1, 0, 0, 0.5]])
+    )
+    camera.display_point_cloud(
+        pmobject, pmobject.points, pmobject.rgbas, 1, camera.pixel_array
+    )
+    # Two half transparent red points cover the pixel with alpha 0.75
+    np.testing.assert_array_equal(camera.pixel_array[18, 32], [191, 0, 0, 255])
+
+
+def test_point_cloud_chunks_and_circular_kernel():
+    camera = Camera(
+        pixel_width=64,
+        pixel_height=36,
+        background_color=BLACK,
+        point_cloud_chunk_size=7,
+    )
+    pmobject = PMobject()
+    pmobject.add_points(np.zeros((10, 3)), rgbas=np.ones((10, 4)))
+    camera.display_point_cloud(
+        pmobject, pmobject.points, pmobject.rgbas, 5, camera.pixel_array
+    )
+    lit = np.count_nonzero(camera.pixel_array[:, :, 0])
+    assert lit == len(camera.get_thickening_nudges(5, circular=True))
+    assert lit < len(camera.get_thickening_nudges(5))
+
+
+def test_image_mobject_only_touches_its_bounding_box():
+    camera = Camera(pixel_width=160, pixel_height=90, background_color=BLACK)
+    pixels = np.full((10, 20, 4), 255, dtype=np.uint8)
+    image = ImageMobject(pixels).set_height(2).shift(2 * LEFT)
+    camera.display_image_mobject(image, camera.pixel_array)
+    ys, xs = np.nonzero(camera.pixel_array[:, :, 0])
+    # 2 units high and 4 units wide, centered 2 units left of the center
+    assert (ys.min(), ys.max()) == (34, 55)
+    assert (xs.min(), xs.max()) == (35, 79)
+    assert len(camera.image_mobject_cache) == 1
+
+
+def test_resampled_image_is_a_pixel_array():
+    camera = Camera(pixel_width=160, pixel_height=90, background_color=BLACK)
+    source = np.full((10, 20, 4), 255, dtype=np.uint8)
+    corner_coords = np.array([[10, 20], [50, 20], [10, 40]])
+    for premultiplied in [False, True]:
+        (x0, y0), sub_image = camera.resample_image(
+            source, corner_coords, camera.pixel_array, premultiplied=premultiplied
+        )
+        assert (x0, y0) == (10, 20)
+        assert sub_image.shape == (20, 40, 4)
+        assert sub_image.dtype == np.uint8
+        np.testing.assert_array_equal(sub_image[10, 20], [255, 255, 255, 255])
+
+
+def test_image_mobject_resampling_is_cached():
+    camera = Camera(pixel_width=160, pixel_height=90, background_color=BLACK)
+    image = ImageMobject(np.full((10, 20, 4), 255, dtype=np.uint8))
+    image.rotate(1).apply_matrix([[1, 0.5, 0], [0, 1, 0], [0, 0, 1]])
+    first = camera.get_placed_image(image, camera.pixel_array)
+    assert camera.get_placed_image(image, camera.pixel_array) is first
+    image.set_opacity(0.5)
+    assert camera.get_placed_image(image, camera.pixel_array) is not first
+
+
+def test_offscreen_mobjects_are_culled():
+    camera = MovingCamera(pixel_width=64, pixel_height=36, background_color=BLACK)
+    camera.frame.set_width(2).move_to(10 * RIGHT)
+    near = Circle(radius=0.5).move_to(9 * RIGHT)
+    touching = Circle(radius=1).move_to(8 * RIGHT)
+    far = Circle(radius=0.5).move_to(10 * LEFT)
+    assert camera.cull_mobjects([far, near, touching]) == [near, touching]
+
+
+def test_capture_counts_culled_mobjects():
+    camera = Camera(pixel_width=64, pixel_height=36, background_color=BLACK)
+    pmobjects = [PMobject().add_points([[x, 0, 0]]) for x in (0, 3, 100, -100)]
+    camera.capture_mobjects(pmobjects)
+    assert camera.num_displayed_mobjects == 2
+    assert camera.num_culled_mobjects == 2
+    camera.cull_offscreen_mobjects = False
+    camera.capture_mobjects(pmobjects)
+    assert camera.num_culled_mobjects == 0
+
+
+def test_three_d_camera_culls_projected_bounds():
+    camera = ThreeDCamera(pixel_width=64, pixel_height=36)
+    camera.set_phi(0)
+    circle = Circle().move_to(20 * RIGHT)
+    assert camera.cull_mobjects([circle]) == []
+    # Points behind the camera are kept rather than culled wrongly.
+    circle.move_to(40 * camera.get_rotation_matrix()[2])
+    assert camera.cull_mobjects([circle]) == [circle]
+
+
+def test_moving_camera_reuses_cairo_context():
+    camera = MovingCamera(pixel_width=64, pixel_height=36)
+    ctx = camera.get_cairo_context(camera.pixel_array)
+    assert camera.get_cairo_context(camera.pixel_array) is ctx
+
+    camera.frame.shift(RIGHT)
+    assert camera.get_cairo_context(camera.pixel_array) is ctx
+    # The matrix follows the frame: its center is drawn at the center pixel.
+    assert np.allclose(ctx.user_to_device(*camera.frame_center[:2]), (32, 18))
+
+
+def test_multi_camera_shares_paths(monkeypatch):
+    sub_camera = MovingCamera()
+    display = ImageMobjectFromCamera(sub_camera).scale(0.5)
+    camera = MultiCamera(
+        image_mobjects_from_cameras=[display], pixel_width=64, pixel_height=36
+    )
+    num_paths = []
+    gen_subpaths = VMobject.gen_subpaths_from_points_2d
+
+    def count_subpaths(self, points):
+        num_paths.append(self)
+        return gen_subpaths(self, points)
+
+    monkeypatch.setattr(VMobject, "gen_subpaths_from_points_2d", count_subpaths)
+    circle = Circle()
+    camera.capture_mobjects([circle, display])
+    assert num_paths == [circle]
+    assert camera.path_cache is None
+    assert (sub_camera.pixel_array != sub_camera.background).any()
+
+
+def test_sub_camera_images_are_copied():
+    camera = Camera(pixel_width=64, pixel_height=36)
+    source = np.zeros((10, 20, 4), dtype=np.uint8)
+    corners = np.array([[5.3, 7.6], [25.1, 7.6], [5.3, 17.4]])
+    assert camera.get_pixel_aligned_position(corners, source) == (5, 8)
+    corners[1] = [27, 7.6]
+    assert camera.get_pixel_aligned_position(corners, source) is None
@@ -10,8 +10,9 @@ def test_import_color():
     C.WHITE
 
 
-def test_background_color():
-    S = Scene()
+def test_background_color(tmp_path):
+    with tempconfig({"media_dir": str(tmp_path)}):
+        S = Scene()
     S.camera.background_color = "#ff0000"
     S.renderer.update_frame(S)
     assert np.all(S.renderer.get_frame()[0, 0] == np.array([255, 0, 0, 255]))
@@ -0,0 +1,51 @@
+import numpy as np
+
+from manim.utils.compositing import (
+    composite_lighten,
+    composite_mask,
+    composite_multiply,
+    composite_over,
+    premultiply,
+    unpremultiply,
+)
+
+
+def get_canvas(color=(0, 0, 255, 255)):
+    canvas = np.zeros((4, 6, 4), dtype=np.uint8)
+    canvas[:, :] = color
+    return canvas
+
+
+def test_premultiply_roundtrip():
+    straight = np.array([[[255, 128, 0, 255], [200, 100, 50, 128], [9, 9, 9, 0]]])
+    premultiplied = premultiply(straight.astype(np.uint8))
+    np.testing.assert_array_equal(premultiplied[0, 1], [100, 50, 25, 128])
+    np.testing.assert_array_equal(premultiplied[0, 2], [0, 0, 0, 0])
+    np.testing.assert_allclose(
+        unpremultiply(premultiplied)[0, :2], straight[0, :2], atol=1
+    )
+
+
+def test_composite_over_is_clipped_to_destination():
+    canvas = get_canvas()
+    red = premultiply(np.full((3, 3, 4), [255, 0, 0, 128], dtype=np.uint8))
+    composite_over(canvas, red, 4, -1)
+    # Only the overlapping 2x2 block is touched
+    np.testing.assert_array_equal(canvas[0, 4], [128, 0, 127, 255])
+    np.testing.assert_array_equal(canvas[1, 5], [128, 0, 127, 255])
+    np.testing.assert_array_equal(canvas[2, 4], [0, 0, 255, 255])
+    np.testing.assert_array_equal(canvas[0, 3], [0, 0, 255, 255])
+    composite_over(canvas, red, 10, 10)
+
+
+def test_composite_multiply_mask_and_lighten():
+    canvas = get_canvas((255, 255, 255, 255))
+    composite_multiply(canvas, get_canvas((0, 128, 255, 255))[:2, :2], 1, 1)
+    np.testing.assert_array_equal(canvas[1, 1], [0, 128, 255, 255])
+    np.testing.assert_array_equal(canvas[0, 0], [255, 255, 255, 255])
+
+    composite_mask(canvas, np.zeros((1, 1), dtype=np.uint8), 0, 0)
+    np.testing.assert_array_equal(canvas[0, 0], [0, 0, 0, 0])
+
+    composite_lighten(canvas, get_canvas((10, 200, 10, 255)))
+    np.testing.assert_array_equal(canvas[1, 1], [10, 200, 255, 255])
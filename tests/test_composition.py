@@ -1,3 +1,5 @@
+import pytest
+
 from manim.animation.animation import Animation
 from manim.animation.composition import AnimationGroup, Succession
 from manim.animation.fading import FadeIn, FadeInFrom, FadeOutAndShift
@@ -85,3 +87,81 @@ def test_animationbuilder_in_group():
     assert all(isinstance(anim, Animation) for anim in animation_group.animations)
     succession = Succession(sqr.animate.shift(DOWN).scale(2), FadeIn(circ))
     assert all(isinstance(anim, Animation) for anim in succession.animations)
+
+
+def test_animation_group_sub_alphas():
+    """Test the alphas given to the animations of a lagged group."""
+    alphas = []
+
+    class RecordAlpha(Animation):
+        def interpolate(self, alpha):
+            alphas.append(alpha)
+
+    animations = [
+        RecordAlpha(Line(), run_time=1.0),
+        RecordAlpha(Line(), run_time=2.0),
+        RecordAlpha(Line(), run_time=0.0),
+    ]
+    group = AnimationGroup(*animations, lag_ratio=0.5)
+    # The animations start at 0, 0.5 and 1.5 and the group lasts 2.5.
+    assert group.get_run_time() == 2.5
+    group.interpolate(0.4)
+    assert alphas == [1.0, 0.25, 0.0]
+
+
+def test_animation_group_timeline():
+    """Test that a lagged group only interpolates the animations in progress,
+    and still leaves each animation at the right alpha."""
+    alphas = {}
+
+    class RecordAlpha(Animation):
+        def interpolate(self, alpha):
+            alphas.setdefault(self, []).append(alpha)
+
+    animations = [RecordAlpha(Line(), run_time=1.0) for _ in range(10)]
+    group = AnimationGroup(*animations, lag_ratio=1)
+    group.begin()
+    alphas.clear()
+    # Halfway through the fourth animation.
+    group.interpolate(0.35)
+    assert set(alphas) == set(animations[:4])
+    assert alphas[animations[0]] == [1.0]
+    assert alphas[animations[3]] == [0.5]
+    alphas.clear()
+    group.interpolate(0.38)
+    assert list(alphas) == [animations[3]]
+    assert alphas[animations[3]] == [pytest.approx(0.8)]
+    # Going back in time rewinds the animations crossed on the way.
+    alphas.clear()
+    group.interpolate(0.15)
+    assert set(alphas) == set(animations[1:4])
+    assert alphas[animations[1]] == [pytest.approx(0.5)]
+    assert alphas[animations[2]] == [0.0]
+    assert alphas[animations[3]] == [0.0]
+
+
+def test_animation_group_updates_mobjects_in_progress():
+    """Test that a lagged group only updates the mobjects of the animations in
+    progress, and those of the finished ones once more."""
+    updated = []
+
+    class RecordUpdate(Animation):
+        def update_mobjects(self, dt):
+            updated.append(self)
+
+    animations = [RecordUpdate(Line(), run_time=1.0) for _ in range(4)]
+    group = AnimationGroup(*animations, lag_ratio=1)
+    # Before the group begins, the state of the animations is unknown.
+    group.update_mobjects(0)
+    assert updated == animations
+    group.begin()
+    updated.clear()
+    group.update_mobjects(1 / 15)
+    assert updated == []
+    # Halfway through the third animation.
+    group.interpolate(0.625)
+    group.update_mobjects(1 / 15)
+    assert updated == animations[:3]
+    updated.clear()
+    group.update_mobjects(1 / 15)
+    assert updated == [animations[2]]
@@ -81,6 +81,32 @@ def test_digest_file(tmp_path):
         assert config.get_dir("video_dir") == Path("this_is_my_favorite_path/videos")
 
 
+def test_encoder_profile(tmp_path):
+    """Test that encoder options override the encoder profile."""
+    with tempconfig({}):
+        assert config.encoder_profile == "default"
+        tmp_cfg = tempfile.NamedTemporaryFile("w", dir=tmp_path, delete=False)
+        tmp_cfg.write(
+            """
+            [ffmpeg]
+            encoder_profile = master
+            crf = 20
+            """
+        )
+        tmp_cfg.close()
+        config.digest_file(tmp_cfg.name)
+
+        assert config.encoder_preset == "slow"
+        assert config.encoder_tune == "animation"
+        assert config.encoder_crf == 20
+        assert config.encoder_profile is None
+
+        config.encoder_profile = "preview"
+        assert config.encoder_preset == "ultrafast"
+        assert config.encoder_profile == "preview"
+    assert config.encoder_profile == "default"
+
+
 def test_temporary_dry_run():
     """Test that tempconfig correctly restores after setting dry_run."""
     assert config["write_to_movie"]
@@ -79,3 +79,68 @@ def test_shift_family():
 
     for m in family:
         assert np.allclose(positions_before[m] + RIGHT, positions_after[m])
+
+
+def test_family_cache_invalidation():
+    """Check that cached families follow changes to the submobjects of any
+    member of the family."""
+    mob, child, gchild1, gchild2 = Mobject(), Mobject(), Mobject(), Mobject()
+    mob.add(child)
+    assert mob.get_family() == [mob, child]
+    child.add(gchild1)
+    assert mob.get_family() == [mob, child, gchild1]
+    child.submobjects.append(gchild2)
+    assert mob.get_family() == [mob, child, gchild1, gchild2]
+    child.submobjects.reverse()
+    assert mob.get_family() == [mob, child, gchild2, gchild1]
+    child.submobjects[0] = Mobject()
+    assert gchild2 not in mob.get_family()
+    child.remove(gchild1)
+    assert len(mob.get_family()) == 3
+    mob.submobjects = [gchild1]
+    assert mob.get_family() == [mob, gchild1]
+    assert list(mob.iter_family()) == mob.get_family()
+
+    # The returned list can be modified without affecting the cache.
+    family = mob.get_family()
+    family.append(child)
+    assert mob.get_family() == [mob, gchild1]
+
+
+def test_copied_family():
+    mob, child, gchild = Mobject(), Mobject(), Mobject()
+    child.add(gchild)
+    mob.add(child)
+    mob.get_family()
+    copy = mob.copy()
+    family = copy.get_family()
+    assert len(family) == 3
+    assert not set(family) & set(mob.get_family())
+    copy.submobjects[0].remove(copy.submobjects[0].submobjects[0])
+    assert len(copy.get_family()) == 2
+    assert len(mob.get_family()) == 3
+
+
+def test_family_cache_is_invalidated_locally():
+    """Check that changing the submobjects of a mobject only drops the cached
+    families of the mobject and its ancestors."""
+    mob, child1, child2, gchild = Mobject(), Mobject(), Mobject(), Mobject()
+    child1.add(gchild)
+    mob.add(child1, child2)
+    families = {m: m._get_cached_family() for m in [mob, child1, child2, gchild]}
+    # Creating, copying or changing unrelated mobjects keeps every family.
+    other = Mobject().add(Mobject())
+    other.copy().submobjects.clear()
+    for m, family in families.items():
+        assert m._get_cached_family() is family
+    gchild.add(Mobject())
+    for m in [mob, child1, gchild]:
+        assert m._get_cached_family() is not families[m]
+    assert child2._get_cached_family() is families[child2]
+    assert len(mob.get_family()) == 5
+    # A removed child no longer affects its former parent, except for a
+    # harmless recomputation.
+    mob.remove(child1)
+    assert mob.get_family() == [mob, child2]
+    child1.add(Mobject())
+    assert mob.get_family() == [mob, child2]
@@ -0,0 +1,241 @@
+import collections
+import io
+import threading
+import types
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from manim import BLUE, RED, RIGHT, YELLOW, ApplyMethod, Circle, Scene, Square, config
+
+pytest.importorskip("grpc")
+pytest.importorskip("watchdog")
+
+from manim.grpc.gen import frameserver_pb2
+from manim.grpc.impl.frame_server_impl import (
+    FrameServer,
+    get_raster_frame_size,
+    serialize_mobject,
+)
+
+
+class DeltaScene(Scene):
+    def construct(self):
+        self.square = Square()
+        self.circle = Circle()
+        self.add(self.square, self.circle)
+        self.play(ApplyMethod(self.square.shift, RIGHT))
+        self.remove(self.circle)
+        self.wait()
+
+
+def make_frame_server(scene_class=DeltaScene):
+    """Builds a frame server serving ``scene_class``, without watching a
+    file or connecting to a frontend."""
+    frame_server = FrameServer.__new__(FrameServer)
+    frame_server.lock = threading.Lock()
+    frame_server.keyframes = []
+    frame_server.raster_cache = collections.OrderedDict()
+    frame_server.raster_cameras = {}
+    frame_server.scene_class = scene_class
+    frame_server.generate_keyframe_data()
+    return frame_server
+
+
+def test_packed_mobject_data():
+    square = Square().shift(RIGHT).rotate(0.3)
+    square.set_fill([RED, BLUE], opacity=0.5)
+    square.set_stroke([YELLOW, RED, BLUE], width=3)
+    data = serialize_mobject(square, packed=True)
+    assert len(data.vectorized_mobject_data.points) == 0
+    # Points are little-endian float32 xyz triples.
+    points = np.frombuffer(data.vectorized_mobject_data.packed_points, "<f4")
+    np.testing.assert_allclose(points.reshape(-1, 3), square.points, atol=1e-6)
+    # Colors are flattened RGBA rows, in the order of the mobject's arrays.
+    fill_rgbas = np.array(data.style.fill_rgbas).reshape(-1, 4)
+    np.testing.assert_allclose(fill_rgbas, square.get_fill_rgbas(), atol=1e-6)
+    stroke_rgbas = np.array(data.style.stroke_rgbas).reshape(-1, 4)
+    np.testing.assert_allclose(stroke_rgbas, square.get_stroke_rgbas(), atol=1e-6)
+    assert len(stroke_rgbas) == 3
+
+
+def test_unpacked_mobject_data():
+    square = Square()
+    data = serialize_mobject(square)
+    assert not data.vectorized_mobject_data.packed_points
+    assert len(data.style.fill_rgbas) == 0
+    points = [[p.x, p.y, p.z] for p in data.vectorized_mobject_data.points]
+    np.testing.assert_allclose(points, square.points)
+
+
+def test_delta_frames():
+    frame_server = make_frame_server()
+    scene = frame_server.scene
+    square_id, circle_id = id(scene.square), id(scene.circle)
+    request = frameserver_pb2.FrameRequest(client_id="client", delta=True)
+    sent_digests = frame_server.get_client_digests(request)
+
+    # The first frame is sent whole.
+    response = frame_server.get_frame_response(request, 0, sent_digests)
+    assert [mobject.id for mobject in response.mobjects] == [square_id, circle_id]
+    assert list(response.mobject_ids) == []
+
+    # Only the moving square is sent again.
+    response = frame_server.get_frame_response(request, 0.5, sent_digests, True)
+    assert [mobject.id for mobject in response.mobjects] == [square_id]
+    assert list(response.mobject_ids) == [square_id, circle_id]
+    assert list(response.removed_mobject_ids) == []
+
+    # Nothing changed since the end of the animation.
+    response = frame_server.get_frame_response(request, 1, sent_digests, True)
+    response = frame_server.get_frame_response(request, 1.5, sent_digests, True)
+    assert response.animation_index == 1
+    assert list(response.mobjects) == []
+    assert list(response.mobject_ids) == [square_id]
+    assert list(response.removed_mobject_ids) == [circle_id]
+
+    # Going back adds the circle again.
+    response = frame_server.get_frame_response(request, 0, sent_digests, True)
+    assert [mobject.id for mobject in response.mobjects] == [square_id, circle_id]
+    assert list(response.mobject_ids) == [square_id, circle_id]
+    assert list(response.removed_mobject_ids) == []
+
+
+def test_full_frames_without_client_id():
+    frame_server = make_frame_server()
+    request = frameserver_pb2.FrameRequest(delta=True)
+    assert frame_server.get_client_digests(request) is None
+    response = frame_server.get_frame_response(request, 0.5)
+    assert len(response.mobjects) == 2
+    assert list(response.mobject_ids) == []
+
+
+def test_client_digests_are_bounded():
+    frame_server = make_frame_server()
+    frame_server.max_clients = 2
+    requests = [
+        frameserver_pb2.FrameRequest(client_id=client_id)
+        for client_id in ["a", "b", "c"]
+    ]
+    sent_digests = frame_server.get_client_digests(requests[0])
+    frame_server.get_client_digests(requests[1])
+    assert frame_server.get_client_digests(requests[0]) is sent_digests
+    frame_server.get_client_digests(requests[2])
+    # The least recently seen client is forgotten.
+    assert list(frame_server.client_digests) == ["a", "c"]
+
+
+@pytest.mark.parametrize(
+    "start_time,end_time,frame_rate",
+    [(0, 1, 10), (0.5, 1.5, 4), (0, 2, 15), (1, 1, 30)],
+)
+def test_stream_frames(start_time, end_time, frame_rate):
+    frame_server = make_frame_server()
+    request = frameserver_pb2.FrameRangeRequest(
+        frame=frameserver_pb2.FrameRequest(client_id="client", delta=True),
+        start_time=start_time,
+        end_time=end_time,
+        frame_rate=frame_rate,
+    )
+    context = types.SimpleNamespace(is_active=lambda: True)
+    responses = list(frame_server.StreamFrames(request, context))
+    assert len(responses) == int((end_time - start_time) * frame_rate) + 1
+    # Only the first frame is sent whole.
+    assert len(responses[0].mobjects) == 2
+    assert all(response.mobject_ids for response in responses[1:])
+
+
+def test_stream_frames_stops_when_cancelled():
+    frame_server = make_frame_server()
+    request = frameserver_pb2.FrameRangeRequest(
+        frame=frameserver_pb2.FrameRequest(), start_time=0, end_time=1, frame_rate=10
+    )
+    active = iter([True, True, False])
+    context = types.SimpleNamespace(is_active=lambda: next(active))
+    assert len(list(frame_server.StreamFrames(request, context))) == 2
+
+
+def count_raster_renders(frame_server):
+    renders = []
+    render_raster_frame = frame_server.render_raster_frame
+
+    def counting_render_raster_frame(*args):
+        renders.append(args)
+        return render_raster_frame(*args)
+
+    frame_server.render_raster_frame = counting_render_raster_frame
+    return renders
+
+
+def raster_frame_request(time_offset, pixel_width=64, pixel_height=36, **kwargs):
+    return frameserver_pb2.RasterFrameRequest(
+        frame=frameserver_pb2.FrameRequest(time_offset=time_offset),
+        pixel_width=pixel_width,
+        pixel_height=pixel_height,
+        **kwargs
+    )
+
+
+def test_raster_frame_size():
+    width, height = config["pixel_width"], config["pixel_height"]
+    assert get_raster_frame_size(0, 0) == (width, height)
+    assert get_raster_frame_size(320, 240) == (320, 240)
+    assert get_raster_frame_size(width // 2, 0) == (width // 2, height // 2)
+    assert get_raster_frame_size(0, height // 2) == (width // 2, height // 2)
+    assert get_raster_frame_size(1, 0) == (1, 1)
+
+
+@pytest.mark.parametrize("image_format", ["PNG", "JPEG", "WEBP"])
+def test_get_raster_frame(image_format):
+    frame_server = make_frame_server()
+    ImageFormat = frameserver_pb2.RasterFrameRequest.ImageFormat
+    response = frame_server.GetRasterFrame(
+        raster_frame_request(1.5, format=ImageFormat.Value(image_format)), None
+    )
+    assert (response.pixel_width, response.pixel_height) == (64, 36)
+    assert response.animation_index == 1
+    assert response.animation_offset == pytest.approx(0.5)
+    assert not response.scene_finished
+    image = Image.open(io.BytesIO(response.image))
+    assert image.format == image_format
+    assert image.size == (64, 36)
+
+
+def test_raster_frame_cache():
+    frame_server = make_frame_server()
+    renders = count_raster_renders(frame_server)
+    image = frame_server.get_raster_frame_response(raster_frame_request(0.5)).image
+    assert len(renders) == 1
+    # The same frame is taken from the cache, even after seeking elsewhere.
+    frame_server.get_raster_frame_response(raster_frame_request(1.5))
+    assert (
+        frame_server.get_raster_frame_response(raster_frame_request(0.5)).image == image
+    )
+    assert len(renders) == 2
+    # Other sizes are rendered again.
+    frame_server.get_raster_frame_response(raster_frame_request(0.5, 32, 18))
+    assert len(renders) == 3
+
+
+def test_raster_frame_cache_eviction():
+    frame_server = make_frame_server()
+    frame_server.raster_cache_size = 2
+    renders = count_raster_renders(frame_server)
+    for time_offset in [0, 0.5, 0, 1.5]:
+        frame_server.get_raster_frame_response(raster_frame_request(time_offset))
+    assert len(renders) == 3
+    assert [key[:2] for key in frame_server.raster_cache] == [(0, 0), (1, 0.5)]
+    # The frame at 0.5 was the least recently used.
+    frame_server.get_raster_frame_response(raster_frame_request(0.5))
+    assert len(renders) == 4
+
+
+def test_reload_clears_raster_frame_cache():
+    frame_server = make_frame_server()
+    renders = count_raster_renders(frame_server)
+    frame_server.get_raster_frame_response(raster_frame_request(0.5))
+    frame_server.generate_keyframe_data()
+    assert not frame_server.raster_cache
+    frame_server.get_raster_frame_response(raster_frame_request(0.5))
+    assert len(renders) == 2
@@ -0,0 +1,56 @@
+import numpy as np
+
+from manim import Axes, FunctionGraph, ParametricFunction
+
+
+def circle(t):
+    return np.array([np.cos(t), np.sin(t), 0])
+
+
+def vectorized_circle(t):
+    return np.cos(t), np.sin(t), 0
+
+
+def test_vectorized_parametric_function():
+    """Test that evaluating the function at all the values of t at once gives
+    the same curve."""
+    curve = ParametricFunction(circle, t_max=np.pi)
+    vectorized = ParametricFunction(vectorized_circle, t_max=np.pi, use_vectorized=True)
+    np.testing.assert_allclose(vectorized.points, curve.points, atol=1e-9)
+
+    graph = FunctionGraph(np.sin)
+    vectorized = FunctionGraph(np.sin, use_vectorized=True)
+    np.testing.assert_allclose(vectorized.points, graph.points, atol=1e-9)
+
+    axes = Axes()
+    graph = axes.get_graph(np.sin)
+    vectorized = axes.get_graph(np.sin, use_vectorized=True)
+    np.testing.assert_allclose(vectorized.points, graph.points, atol=1e-9)
+
+
+def test_parametric_function_skips_non_finite_points():
+    curve = ParametricFunction(lambda t: np.array([t, 1 / t, 0]), t_min=-1, t_max=1)
+    assert np.isfinite(curve.points).all()
+
+
+def test_adaptive_sampling():
+    """Test that adaptive sampling stays within its tolerance with fewer
+    points, and spends them where the curve bends."""
+    uniform = ParametricFunction(vectorized_circle, t_max=np.pi, use_vectorized=True)
+    adaptive = ParametricFunction(
+        vectorized_circle, t_max=np.pi, use_vectorized=True, pixel_tolerance=0.5
+    )
+    assert adaptive.get_num_curves() < uniform.get_num_curves()
+    anchors = adaptive.get_anchors()
+    np.testing.assert_allclose(np.linalg.norm(anchors, axis=1), 1)
+
+    def kink(t):
+        return np.array([t, np.abs(t), 0])
+
+    adaptive = ParametricFunction(
+        kink, t_min=-1, t_max=1, pixel_tolerance=0.5, n_initial_samples=31
+    )
+    t_values, _ = adaptive.sample_adaptively(-1, 1)
+    # Only the interval around the kink needed more samples.
+    added = np.setdiff1d(t_values, np.linspace(-1, 1, 32))
+    np.testing.assert_allclose(added, [0], atol=1e-12)
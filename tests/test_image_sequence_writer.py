@@ -0,0 +1,28 @@
+import numpy as np
+from PIL import Image
+
+from manim.scene.image_sequence_writer import ImageSequenceWriter
+
+
+def test_frames_are_saved_in_order(tmp_path):
+    writer = ImageSequenceWriter(
+        str(tmp_path / "frame"), compression_level=1, max_pending_frames=2
+    )
+    for value in range(4):
+        writer.write_frame(np.full((4, 6, 4), value, dtype=np.uint8))
+    writer.write_frame(np.full((4, 6, 4), 9, dtype=np.uint8), num_frames=3)
+    writer.finish()
+    values = [
+        np.array(Image.open(tmp_path / f"frame{i}.png"))[0, 0, 0] for i in range(7)
+    ]
+    assert values == [0, 1, 2, 3, 9, 9, 9]
+
+
+def test_webp_frames_are_lossless(tmp_path):
+    frame = np.random.randint(0, 256, (8, 8, 4), dtype=np.uint8)
+    frame[..., 3] = 255
+    writer = ImageSequenceWriter(str(tmp_path / "frame"), image_format="webp")
+    writer.write_frame(frame)
+    writer.finish()
+    saved = np.array(Image.open(tmp_path / "frame0.webp").convert("RGBA"))
+    np.testing.assert_array_equal(saved, frame)
@@ -0,0 +1,88 @@
+import types
+
+import numpy as np
+
+from manim import (
+    LEFT,
+    RIGHT,
+    UP,
+    ApplyMethod,
+    Circle,
+    Dot,
+    FadeIn,
+    Scene,
+    Square,
+)
+from manim.renderer.js_renderer import JsRenderer
+from manim.renderer.keyframe import get_mobject_state, set_mobject_state
+
+
+class KeyframeScene(Scene):
+    def construct(self):
+        self.square = Square()
+        self.circle = Circle()
+        self.dot = Dot().add_updater(lambda d: d.next_to(self.square, UP))
+        self.add(self.square, self.circle, self.dot)
+        self.play(ApplyMethod(self.square.shift, RIGHT))
+        self.wait()
+        self.play(ApplyMethod(self.square.shift, RIGHT), FadeIn(Square()))
+        self.play(ApplyMethod(self.circle.shift, LEFT))
+
+
+def render_keyframes():
+    frame_server = types.SimpleNamespace(keyframes=[])
+    scene = KeyframeScene(renderer=JsRenderer(frame_server))
+    scene.render()
+    return scene, frame_server.keyframes
+
+
+def test_mobject_state():
+    square = Square()
+    state = get_mobject_state(square)
+    assert get_mobject_state(square, state) is state
+    points = square.points.copy()
+    square.shift(RIGHT)
+    new_state = get_mobject_state(square, state)
+    assert new_state is not state
+    assert new_state["fill_rgbas"] is state["fill_rgbas"]
+    set_mobject_state(square, state)
+    np.testing.assert_allclose(square.points, points)
+    # The state is copied, so it isn't changed along with the mobject.
+    square.shift(RIGHT)
+    np.testing.assert_allclose(state["points"], points)
+
+
+def test_keyframes_share_unchanged_states():
+    scene, keyframes = render_keyframes()
+    assert len(keyframes) == 4
+    assert [keyframe.is_static for keyframe in keyframes] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+    circle_states = [keyframe.mobject_states[scene.circle] for keyframe in keyframes]
+    assert circle_states[0] is circle_states[1] is circle_states[2]
+    # Beginning the animation of the circle suspends its updating.
+    assert circle_states[3] is not circle_states[0]
+    assert circle_states[3]["points"] is circle_states[0]["points"]
+    square_states = [keyframe.mobject_states[scene.square] for keyframe in keyframes]
+    assert square_states[0] is not square_states[1]
+    assert square_states[0]["fill_rgbas"] is square_states[1]["fill_rgbas"]
+
+
+def test_restore_keyframes():
+    scene, keyframes = render_keyframes()
+    expected_square_x = [0, 1, 1, 2]
+    current = None
+    for index in [3, 0, 2, 1, 0, 3, 2]:
+        keyframe = keyframes[index]
+        restored = keyframe.restore(current)
+        current = keyframe
+        assert restored is scene
+        assert scene.mobjects == keyframe.mobjects
+        assert np.isclose(scene.square.get_x(), expected_square_x[index])
+        assert np.isclose(scene.circle.get_x(), 0)
+        scene.update_to_time(scene.duration)
+        assert np.isclose(scene.circle.get_x(), -1 if index == 3 else 0)
+        assert np.isclose(scene.dot.get_x(), scene.square.get_x())
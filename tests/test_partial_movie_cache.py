@@ -0,0 +1,80 @@
+import os
+
+from manim.utils.caching import PartialMovieCache
+
+
+def write_partial_movie(cache, hash_invocation, size):
+    with open(cache.get_path(hash_invocation), "wb") as file:
+        file.write(b"0" * size)
+
+
+def test_hits_and_misses_are_counted(tmp_path):
+    cache = PartialMovieCache(tmp_path, ".mp4")
+    assert not cache.contains("a")
+    write_partial_movie(cache, "a", 10)
+    cache.add("a")
+    assert cache.contains("a")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.get_size() == (1, 10)
+    os.remove(cache.get_path("a"))
+    assert not cache.contains("a")
+    assert cache.get_size() == (0, 0)
+    cache.close()
+
+
+def test_least_recently_used_files_are_evicted_by_size(tmp_path):
+    cache = PartialMovieCache(tmp_path, ".mp4")
+    for hash_invocation in "abcd":
+        write_partial_movie(cache, hash_invocation, 100)
+        cache.add(hash_invocation)
+    assert cache.contains("a")
+    assert cache.evict(max_size=250, keep=["b"]) == ["c", "d"]
+    assert sorted(os.listdir(tmp_path)) == ["a.mp4", "b.mp4", cache.index_file_name]
+    assert cache.evict(max_files=1) == ["b"]
+    assert cache.clear() == 1
+    cache.close()
+
+
+def test_existing_files_are_indexed(tmp_path):
+    (tmp_path / "a.mp4").write_bytes(b"0" * 5)
+    (tmp_path / "b.mp4").write_bytes(b"0" * 7)
+    cache = PartialMovieCache(tmp_path, ".mp4")
+    assert cache.get_size() == (2, 12)
+    cache.close()
+
+
+def test_uses_are_written_in_one_transaction(tmp_path):
+    cache = PartialMovieCache(tmp_path, ".mp4")
+    for hash_invocation in "ab":
+        write_partial_movie(cache, hash_invocation, 10)
+        cache.add(hash_invocation)
+    cache.flush()
+    changes = cache.connection.total_changes
+    for _ in range(3):
+        assert cache.contains("a")
+        assert cache.contains("b")
+        assert not cache.contains("c")
+    assert cache.connection.total_changes == changes
+    cache.flush()
+    hits = dict(cache.connection.execute("SELECT hash, hits FROM partial_movies"))
+    assert hits == {"a": 3, "b": 3}
+    cache.close()
+
+
+def test_temporary_files_are_not_indexed(tmp_path):
+    (tmp_path / "a.mp4").write_bytes(b"0" * 5)
+    (tmp_path / "b_123_temp.mp4").write_bytes(b"0" * 7)
+    (tmp_path / "c_123_download.mp4").write_bytes(b"0" * 9)
+    cache = PartialMovieCache(tmp_path, ".mp4")
+    assert cache.get_size() == (1, 5)
+    cache.close()
+
+
+def test_lookups_without_touching(tmp_path):
+    cache = PartialMovieCache(tmp_path, ".mp4")
+    write_partial_movie(cache, "a", 10)
+    assert cache.contains("a", touch=False)
+    assert not cache.contains("b", touch=False)
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache.get_size() == (0, 0)
+    cache.close()
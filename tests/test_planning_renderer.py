@@ -0,0 +1,130 @@
+import sqlite3
+
+import pytest
+
+from manim import (
+    RIGHT,
+    ApplyMethod,
+    PlanningRenderer,
+    PMobject,
+    Scene,
+    config,
+    tempconfig,
+)
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.caching import PartialMovieCache
+
+
+class PointScene(Scene):
+    def construct(self):
+        point = PMobject().add_points([[0, 0, 0]])
+        self.add(point)
+        self.play(ApplyMethod(point.shift, RIGHT))
+        self.wait()
+        self.play(ApplyMethod(point.shift, RIGHT), run_time=2)
+
+
+def test_plan_matches_render_hashes(tmp_path):
+    with tempconfig(
+        {
+            "media_dir": str(tmp_path),
+            "write_to_movie": True,
+            "disable_caching": False,
+        }
+    ):
+        planner = PlanningRenderer()
+        PointScene(renderer=planner).render()
+        plan = planner.get_plan()
+        assert [animation.status for animation in plan] == ["render"] * 3
+        assert [animation.run_time for animation in plan] == [1, 1, 2]
+
+        # Render with every animation reported as cached, so nothing is
+        # written, and check that the hashes are the planned ones.
+        with tempconfig({"dry_run": True}):
+            renderer = CairoRenderer()
+            scene = PointScene(renderer=renderer)
+            renderer.file_writer.is_already_cached = lambda hash_play: True
+            scene.render()
+        assert renderer.animations_hashes == [animation.hash for animation in plan]
+
+        cache = planner.file_writer.partial_movie_cache
+        cache.get_path(plan[1].hash).write_bytes(b"movie")
+        replanner = PlanningRenderer()
+        PointScene(renderer=replanner).render()
+        replan = replanner.get_plan()
+        statuses = [animation.status for animation in replan]
+        assert statuses == ["render", "cached", "render"]
+        assert replanner.get_ranges_to_render(replan) == [(0, 0), (2, 2)]
+        assert replanner.get_ranges_to_render(plan) == [(0, 2)]
+
+
+def test_plan_skips_animations_out_of_range(tmp_path):
+    with tempconfig(
+        {
+            "media_dir": str(tmp_path),
+            "from_animation_number": 1,
+            "upto_animation_number": 1,
+        }
+    ):
+        planner = PlanningRenderer()
+        PointScene(renderer=planner).render()
+        statuses = [animation.status for animation in planner.get_plan()]
+        assert statuses == ["skipped", "render"]
+
+
+def test_encoder_profile_is_part_of_the_hashes(tmp_path):
+    with tempconfig(
+        {
+            "media_dir": str(tmp_path),
+            "write_to_movie": True,
+            "disable_caching": False,
+        }
+    ):
+        config.encoder_profile = "preview"
+        planner = PlanningRenderer()
+        PointScene(renderer=planner).render()
+        plan = planner.get_plan()
+        cache = planner.file_writer.partial_movie_cache
+        for animation in plan:
+            cache.get_path(animation.hash).write_bytes(b"movie")
+
+        replanner = PlanningRenderer()
+        PointScene(renderer=replanner).render()
+        statuses = [animation.status for animation in replanner.get_plan()]
+        assert statuses == ["cached"] * 3
+
+        # Files encoded for previews are not reused in master renders.
+        config.encoder_profile = "master"
+        replanner = PlanningRenderer()
+        PointScene(renderer=replanner).render()
+        statuses = [animation.status for animation in replanner.get_plan()]
+        assert statuses == ["render"] * 3
+
+
+def test_planning_leaves_the_cache_untouched(tmp_path):
+    with tempconfig(
+        {
+            "media_dir": str(tmp_path),
+            "write_to_movie": True,
+            "disable_caching": False,
+        }
+    ):
+        planner = PlanningRenderer()
+        PointScene(renderer=planner).render()
+        plan = planner.get_plan()
+        cache = planner.file_writer.partial_movie_cache
+        for animation in plan:
+            cache.get_path(animation.hash).write_bytes(b"movie")
+
+        replanner = PlanningRenderer()
+        PointScene(renderer=replanner).render()
+        statuses = [animation.status for animation in replanner.get_plan()]
+        assert statuses == ["cached"] * 3
+        replanned_cache = replanner.file_writer.partial_movie_cache
+        assert (replanned_cache.hits, replanned_cache.misses) == (0, 0)
+        # The index was closed without recording any use.
+        with pytest.raises(sqlite3.ProgrammingError):
+            replanned_cache.get_size()
+        index = PartialMovieCache(cache.directory, config["movie_file_extension"])
+        assert index.get_size() == (0, 0)
+        index.close()
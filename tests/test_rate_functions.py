@@ -0,0 +1,41 @@
+import inspect
+
+import numpy as np
+import pytest
+
+from manim.utils import rate_functions
+
+
+@pytest.mark.parametrize(
+    "rate_func",
+    [
+        func
+        for name, func in inspect.getmembers(rate_functions, inspect.isfunction)
+        if func.__module__ == rate_functions.__name__
+        and not name.startswith("_")
+        and name not in ["not_quite_there", "squish_rate_func"]
+    ]
+    + [
+        rate_functions.not_quite_there(),
+        rate_functions.squish_rate_func(rate_functions.smooth),
+        rate_functions.squish_rate_func(rate_functions.smooth, 0.5, 0.5),
+    ],
+)
+def test_rate_functions_take_arrays(rate_func):
+    """Check that rate functions give the same values for an array of times
+    as for each of the times."""
+    times = np.linspace(0, 1, 51)
+    values = rate_func(times)
+    assert np.shape(values) == times.shape
+    np.testing.assert_allclose(values, [rate_func(t) for t in times])
+    assert np.ndim(rate_func(0.3)) == 0
+
+
+def test_ease_in_out_bounce_is_unchanged():
+    """Check that ease_in_out_bounce keeps its former values, which are those
+    of ease_in_out_back, so that existing scenes render the same."""
+    times = np.linspace(0, 1, 51)
+    np.testing.assert_allclose(
+        rate_functions.ease_in_out_bounce(times),
+        rate_functions.ease_in_out_back(times),
+    )
@@ -0,0 +1,111 @@
+import io
+import os
+import subprocess
+import types
+
+import numpy as np
+
+from manim import config, tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.images import rgba_to_yuv420p
+
+
+class _Process:
+    def __init__(self):
+        self.stdin = io.BytesIO()
+
+
+def test_static_frames_are_piped_once(monkeypatch):
+    with tempconfig({"dry_run": True}):
+        file_writer = SceneFileWriter(None, "StaticScene")
+    with tempconfig({"write_to_movie": True}):
+        repeats = []
+
+        def open_movie_pipe(num_repeated_frames=None):
+            repeats.append(num_repeated_frames)
+            file_writer.writing_process = _Process()
+
+        monkeypatch.setattr(file_writer, "open_movie_pipe", open_movie_pipe)
+        frame = np.zeros((2, 3, 4), dtype=np.uint8)
+
+        file_writer.begin_animation(True)
+        file_writer.write_frame(frame, num_frames=30)
+        assert repeats == [30]
+        assert len(file_writer.writing_process.stdin.getvalue()) == frame.nbytes
+
+        file_writer.begin_animation(True)
+        file_writer.write_frame(frame)
+        file_writer.write_frame(frame, num_frames=3)
+        assert repeats == [30, 1]
+        assert len(file_writer.writing_process.stdin.getvalue()) == 4 * frame.nbytes
+
+
+def test_encoder_options(monkeypatch, tmp_path):
+    with tempconfig({"dry_run": True}):
+        file_writer = SceneFileWriter(types.SimpleNamespace(num_plays=0), "Scene")
+    file_writer.partial_movie_files = [str(tmp_path / "movie.mp4")]
+    commands = []
+
+    def popen(command, stdin=None):
+        commands.append(command)
+        return _Process()
+
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    with tempconfig(
+        {
+            "write_to_movie": True,
+            "pixel_width": 4,
+            "pixel_height": 2,
+            "encoder_threads": 2,
+            "yuv_conversion": True,
+        }
+    ):
+        config.encoder_profile = "master"
+        file_writer.begin_animation(True)
+        file_writer.write_frame(np.full((2, 4, 4), 255, dtype=np.uint8))
+
+    command = " ".join(commands[0])
+    assert "-pix_fmt yuv420p -r" in command
+    assert "-vcodec libx264 -pix_fmt yuv420p -preset slow -crf 18" in command
+    assert "-tune animation -threads 2" in command
+    # The luma plane and both 2x1 chroma planes are piped, not RGBA pixels.
+    assert file_writer.writing_process.stdin.getvalue() == bytes([235] * 8 + [128] * 4)
+
+
+def test_rgba_to_yuv420p():
+    image = np.zeros((2, 4, 4), dtype=np.uint8)
+    image[:, 2:] = [255, 0, 0, 255]
+    planes = rgba_to_yuv420p(image)
+    assert planes.dtype == np.uint8
+    assert list(planes) == [16, 16, 82, 82] * 2 + [128, 90] + [128, 240]
+
+
+def test_gif_palette_is_built_in_its_own_pass(monkeypatch, tmp_path):
+    commands = []
+
+    def popen(command, stdin=None):
+        commands.append(command)
+        return types.SimpleNamespace(wait=lambda: 0)
+
+    monkeypatch.setattr(subprocess, "Popen", popen)
+    with tempconfig(
+        {"media_dir": str(tmp_path), "write_to_movie": True, "save_as_gif": True}
+    ):
+        file_writer = SceneFileWriter(types.SimpleNamespace(num_plays=0), "Scene")
+        file_writer.partial_movie_files = [str(tmp_path / "movie.mp4")]
+        file_writer.combine_movie_files()
+        file_writer.partial_movie_cache.close()
+
+    palette_command, gif_command = commands
+    palette_path = palette_command[-1]
+    assert palette_path.endswith(".png")
+    assert "palettegen=stats_mode=full" in palette_command
+    assert gif_command[gif_command.index("-filter_complex") + 1] == (
+        "[0:v][1:v]paletteuse"
+    )
+    assert gif_command[gif_command.index(palette_path) - 1] == "-i"
+    assert gif_command[-1] == file_writer.gif_file_path
+    # The palette and the list of partial movie files are removed.
+    assert os.listdir(file_writer.partial_movie_directory) == [
+        file_writer.partial_movie_cache.index_file_name
+    ]
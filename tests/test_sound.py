@@ -1,9 +1,12 @@
 import os, struct, wave
 
-from manim import Scene
+from pydub import AudioSegment
 
+from manim import Scene, tempconfig
+from manim.utils.sounds import AudioTimeline
 
-def test_add_sound():
+
+def test_add_sound(tmp_path):
     # create sound file
     f = wave.open("noise.wav", "w")
     f.setparams((2, 2, 44100, 0, "NONE", "not compressed"))
@@ -14,7 +17,57 @@ def test_add_sound():
 
     f.close()
 
-    scene = Scene()
-    scene.add_sound("noise.wav")
+    with tempconfig({"media_dir": str(tmp_path)}):
+        scene = Scene()
+        scene.add_sound("noise.wav")
 
     os.remove("noise.wav")
+
+
+def test_audio_timeline_mixes_sounds(tmp_path):
+    tone = AudioSegment(
+        struct.pack("<4h", 1000, 1000, 1000, 1000),
+        sample_width=2,
+        frame_rate=4,
+        channels=1,
+    )
+    timeline = AudioTimeline(chunk_duration=0.5)
+    timeline.add_segment(tone)
+    timeline.add_segment(tone, time=0.5, gain_to_background=-6)
+    timeline.add_segment(tone, time=2)
+    assert timeline.duration == 3
+
+    wav_path = tmp_path / "soundtrack.wav"
+    timeline.write_wav(wav_path)
+    with wave.open(str(wav_path)) as f:
+        assert f.getnchannels() == 1
+        assert f.getframerate() == 4
+        samples = struct.unpack(f"<{f.getnframes()}h", f.readframes(f.getnframes()))
+    # The background is halved while the second sound plays.
+    assert samples[:2] == (1000, 1000)
+    assert samples[2:4] == (1501, 1501)
+    assert samples[4:8] == (1000, 1000, 0, 0)
+    assert samples[8:] == (1000, 1000, 1000, 1000)
+
+
+def test_audio_timeline_decodes_files_once(tmp_path):
+    sound_path = tmp_path / "noise.wav"
+    f = wave.open(str(sound_path), "w")
+    f.setparams((1, 2, 8000, 0, "NONE", "not compressed"))
+    f.writeframes(struct.pack("<800h", *([2000] * 800)))
+    f.close()
+
+    timeline = AudioTimeline()
+    timeline.add_sound(sound_path)
+    timeline.add_sound(sound_path, time=1, gain=-6)
+    assert len(timeline.segments_by_path) == 1
+    assert timeline.events[0][0] is timeline.events[1][0]
+
+    wav_path = tmp_path / "soundtrack.wav"
+    timeline.write_wav(wav_path)
+    with wave.open(str(wav_path)) as f:
+        assert f.getnframes() == 8800
+        samples = struct.unpack(f"<{f.getnframes()}h", f.readframes(f.getnframes()))
+    assert samples[0] == 2000
+    assert samples[799:801] == (2000, 0)
+    assert samples[-1] == 1002
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from manim import BLUE, RED, RIGHT, Circle, Square, Triangle, VGroup
+from manim.animation.transform import Transform
+
+
+def get_state(mobject):
+    return [
+        (
+            submobject.points.copy(),
+            submobject.fill_rgbas.copy(),
+            submobject.stroke_rgbas.copy(),
+            submobject.get_stroke_width(),
+        )
+        for submobject in mobject.family_members_with_points()
+    ]
+
+
+def make_transform(**kwargs):
+    start = VGroup(Circle(), Square(), Triangle()).arrange(RIGHT)
+    start.set_fill(RED, opacity=0.5)
+    target = VGroup(Square(color=BLUE), Triangle(), Circle(), Square())
+    target.set_stroke(width=10).shift(2 * RIGHT)
+    return Transform(start, target, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"lag_ratio": 0.3}, {"path_arc": 1}, {"path_arc": 1, "lag_ratio": 0.5}],
+)
+def test_batched_transform(kwargs):
+    """Check that transforms interpolating their submobjects at once do it
+    just as one by one."""
+    batched = make_transform(**kwargs)
+    unbatched = make_transform(**kwargs)
+    batched.begin()
+    unbatched.begin()
+    assert batched.batched_interpolation is not None
+    unbatched.batched_interpolation = None
+    for alpha in [0, 0.2, 0.5, 0.9, 1]:
+        batched.interpolate(alpha)
+        unbatched.interpolate(alpha)
+        for a, b in zip(get_state(batched.mobject), get_state(unbatched.mobject)):
+            for value_a, value_b in zip(a, b):
+                np.testing.assert_allclose(value_a, value_b, atol=1e-12)
+
+
+def test_unbatched_transform():
+    """Check that transforms whose starting mobject has updaters don't
+    interpolate their submobjects at once."""
+    transform = make_transform()
+    transform.mobject.add_updater(lambda mobject: None)
+    transform.begin()
+    assert transform.batched_interpolation is None
+    transform.interpolate(1)
+    assert np.allclose(transform.mobject[0].points, transform.target_copy[0].points)
@@ -0,0 +1,46 @@
+import numpy as np
+
+from manim import (
+    AnimatedStreamLines,
+    ShowPassingFlashWithThinningStrokeWidth,
+    StreamLines,
+)
+
+
+def get_stream_lines():
+    return StreamLines(
+        lambda p: np.array([-p[1], p[0], 0]),
+        x_min=-1,
+        x_max=1,
+        y_min=-1,
+        y_max=1,
+        delta_x=1,
+        delta_y=1,
+    )
+
+
+def test_animated_stream_lines_flow():
+    stream_lines = get_stream_lines()
+    original_points = [line.get_points() for line in stream_lines]
+    animated = AnimatedStreamLines(stream_lines)
+    for _ in range(30):
+        animated.update(0.2)
+    for line, points in zip(stream_lines, original_points):
+        # The flash only ever shows part of the original line
+        assert len(line.points) <= len(points) + 4
+        assert line.anim.mobject is line
+
+
+def test_animated_stream_lines_thinning():
+    stream_lines = get_stream_lines()
+    animated = AnimatedStreamLines(
+        stream_lines,
+        line_anim_class=ShowPassingFlashWithThinningStrokeWidth,
+        line_anim_config={"run_time": 2, "time_width": 0.5, "n_segments": 4},
+    )
+    animated.update(1)
+    assert len(animated.submobjects) == len(stream_lines)
+    for group in animated:
+        assert len(group) == 4
+        widths = [segment.get_stroke_width() for segment in group]
+        assert widths == sorted(widths)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from manim import Mobject, VMobject, VGroup, VDict
 
@@ -118,3 +119,45 @@ def test_vdict_remove():
     assert len(obj.submob_dict) == 0
     with pytest.raises(KeyError):
         obj.remove("a")
+
+
+def test_vmobject_arc_length():
+    """Test the cached arc-length table of a VMobject."""
+    obj = VMobject()
+    # A short curve followed by a curve three times as long.
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [4, 0, 0]])
+    assert obj.get_arc_length() == pytest.approx(4)
+    assert obj.get_arc_length(n_sample_points=9) == pytest.approx(4)
+    np.testing.assert_allclose(
+        obj.proportion_from_arc_length([0, 0.25, 0.625, 1]), [0, 0.5, 0.75, 1]
+    )
+    np.testing.assert_allclose(
+        obj.point_from_proportion(obj.proportion_from_arc_length(0.5)), [2, 0, 0]
+    )
+    # Changing the points in place invalidates the table.
+    obj.points *= 2
+    assert obj.get_arc_length() == pytest.approx(8)
+
+
+def test_vmobject_arc_length_of_subpaths():
+    """Test that the length of a path counts the jumps between its subpaths."""
+    obj = VMobject()
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0]])
+    obj.start_new_path(np.array([5, 0, 0]))
+    obj.add_line_to(np.array([6, 0, 0]))
+    assert obj.get_arc_length() == pytest.approx(6)
+    assert obj.get_arc_length(n_sample_points=9) == pytest.approx(6)
+    # The jump isn't drawn, so it takes no time to go through.
+    assert obj.get_arc_length_table()[-1] == pytest.approx(2)
+    np.testing.assert_allclose(obj.proportion_from_arc_length(0.5), 0.5)
+
+
+def test_vmobject_pointwise_become_partial():
+    """Test that partial curves keep the middle curves untouched."""
+    obj = VMobject()
+    obj.set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    partial = VMobject().pointwise_become_partial(obj, 1 / 6, 5 / 6)
+    assert partial.get_num_curves() == 3
+    np.testing.assert_allclose(partial.points[0], [0.5, 0, 0])
+    np.testing.assert_allclose(partial.points[4:8], obj.points[4:8])
+    np.testing.assert_allclose(partial.points[-1], [0.5, 1, 0])